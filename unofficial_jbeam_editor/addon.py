@@ -0,0 +1,78 @@
+import bpy
+import logging
+
+from bpy.app.handlers import persistent
+
+from unofficial_jbeam_editor.utils.devtools_register import DevToolsRegister
+from unofficial_jbeam_editor.config.logging_config import configure_logging
+from unofficial_jbeam_editor.ui.addon_preferences import MyAddonPreferences, register as register_preferences, unregister as unregister_preferences
+
+from unofficial_jbeam_editor.utils.temp_file_manager import TempFileManager
+from unofficial_jbeam_editor.utils.icons_manager import IconsManager
+from unofficial_jbeam_editor.utils.jbeam.jbeam_props_storage import JbeamPropsStorageManager
+from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamUtils
+from unofficial_jbeam_editor.utils.jbeam.jbeam_element_index import JbeamElementIndexManager
+from unofficial_jbeam_editor.utils.jbeam.jbeam_selection_tracker import JbeamSelectionTracker
+from unofficial_jbeam_editor.translation.translations import register as register_translations, unregister as unregister_translations
+from unofficial_jbeam_editor.ui.sidebar_menu import register as register_devtools_panel, unregister as unregister_devtools_panel
+
+from unofficial_jbeam_editor.operators.common.operator_generic_popup import register as register_generic_popup, unregister as unregister_generic_popup
+from unofficial_jbeam_editor.operators.file.beamng.beamng_file_operator_stubs import DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportJbeamToNodeMeshStub
+
+@persistent
+def save_pre_handler(dummy):
+    logging.debug("DevTools::save_pre_handler ==============>")
+    left_out = JbeamUtils.save_all_jbeam_props_to_mesh()
+    if left_out:
+        logging.debug(f"🧹 Left {left_out} orphaned JBeam props entries out of the saved props")
+
+@persistent
+def on_load_post_handler(scene):
+    logging.debug("DevTools::on_load_post_handler ==============>")
+    JbeamPropsStorageManager.get_instance().reset_after_file_load(warm_up=MyAddonPreferences.is_props_warm_up_enabled())
+    JbeamSelectionTracker.get_instance().register()
+    JbeamElementIndexManager.get_instance().register()
+
+def menu_func_import(self, context):
+    self.layout.operator(DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportJbeamToNodeMeshStub.bl_idname, text="JBeam File (.jbeam)")
+
+def register() -> None:
+    configure_logging()
+    logging.info("DevTools Application Start")
+    logging.debug("DevTools addon Registration Begin ==============>")
+    #add_executable_permission(FileUtils.get_executable_filepath())
+
+    DevToolsRegister.register()
+
+    register_devtools_panel()
+    register_preferences()
+    DevToolsRegister.update_feature_groups()
+    register_translations()
+    register_generic_popup()
+    TempFileManager().init()
+    JbeamSelectionTracker.get_instance().register()
+    JbeamElementIndexManager.get_instance().register()
+    bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
+    bpy.app.handlers.save_pre.append(save_pre_handler)
+    bpy.app.handlers.load_post.append(on_load_post_handler)
+
+    logging.debug("DevTools addon Registration Complete <==========\n")
+
+def unregister() -> None:
+    logging.debug("DevTools addon Unregistration Begin ============>")
+    unregister_devtools_panel()
+    unregister_preferences()
+    unregister_translations()
+    unregister_generic_popup()
+    TempFileManager().cleanup()
+    IconsManager().cleanup()
+    JbeamSelectionTracker.get_instance().unregister()
+    JbeamElementIndexManager.get_instance().unregister()
+    JbeamPropsStorageManager.get_instance().stop_warm_up()
+
+    DevToolsRegister.unregister()
+
+    bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
+    bpy.app.handlers.save_pre.remove(save_pre_handler)
+    bpy.app.handlers.load_post.remove(on_load_post_handler)
+    logging.debug("DevTools addon Unregistration Complete <========\n")
@@ -0,0 +1,231 @@
+"""Headless batch conversion between .jbeam/.pc files and .blend files.
+
+    blender --background --python unofficial_jbeam_editor/cli/jbeam_batch.py -- --mode import --input "mods/**/*.pc" --output out/
+    blender --background --python unofficial_jbeam_editor/cli/jbeam_batch.py -- --mode export --input "out/*.blend" --output jbeam/ --jobs 4
+
+Modes:
+    import     .jbeam/.pc -> <output>/<relative path>.blend
+    export     .blend -> every jbeam source file of its node meshes, written to <output>/<relative path>
+    roundtrip  .jbeam/.pc -> import -> export to <output>/<relative path>
+
+Output paths mirror the input and source files relative to --source-root, so files of the same name in different folders
+do not collide. For import and roundtrip it defaults to the common directory of the input files, for export (where the
+sources are only known once a .blend is loaded) to none, which mirrors the whole absolute path of every source file.
+Sources are always read from their original path, never from an earlier output.
+
+With --jobs > 1 the files are split over worker Blender processes. Every finished file is printed as one JSON line
+prefixed with JBEAM_BATCH, followed by a summary line with the total time per stage.
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import logging
+import argparse
+import subprocess
+
+from concurrent.futures import ThreadPoolExecutor
+
+ADDON_MODULE = "unofficial_jbeam_editor"
+LINE_PREFIX = "JBEAM_BATCH "
+IMPORT_EXTENSIONS = (".jbeam", ".pc")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+try:
+    import bpy
+    import addon_utils
+except ImportError:
+    bpy = None  # only collect_files, common_root and mirror_path can be used outside of Blender
+
+
+def emit(event: dict):
+    print(LINE_PREFIX + json.dumps(event), flush=True)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="jbeam_batch", description="Batch convert .jbeam/.pc files and .blend files")
+    parser.add_argument("--mode", choices=("import", "export", "roundtrip"), required=True)
+    parser.add_argument("--input", nargs="+", required=True, help="input files or glob patterns, ** matches subdirectories")
+    parser.add_argument("--output", required=True, help="output directory")
+    parser.add_argument("--source-root", help="directory the output paths mirror, see the module description for the default")
+    parser.add_argument("--jobs", type=int, default=1, help="number of worker Blender processes")
+    parser.add_argument("--verbose", action="store_true", help="keep the addon debug log")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def collect_files(patterns, mode) -> list[str]:
+    extensions = (".blend",) if mode == "export" else IMPORT_EXTENSIONS
+    files = []
+    for pattern in patterns:
+        matches = glob.glob(pattern, recursive=True) if glob.has_magic(pattern) else [pattern]
+        files.extend(os.path.abspath(f) for f in sorted(matches) if f.lower().endswith(extensions) and os.path.isfile(f))
+    return list(dict.fromkeys(files))
+
+
+def common_root(files) -> str | None:
+    """Deepest directory that contains all files, None if there are none or they are on different drives."""
+    try:
+        return os.path.commonpath([os.path.dirname(os.path.abspath(f)) for f in files]) if files else None
+    except ValueError:
+        return None
+
+
+def mirror_path(output_dir, source_root, filepath, extension=None) -> str:
+    """filepath relative to source_root below output_dir. A file outside source_root keeps its whole absolute path below output_dir."""
+    path = os.path.abspath(filepath)
+    try:
+        relative = os.path.relpath(path, source_root) if source_root else None
+    except ValueError:  # on another drive
+        relative = None
+    if relative is None or relative == os.pardir or relative.startswith(os.pardir + os.sep):
+        drive, tail = os.path.splitdrive(path)
+        relative = os.path.join(drive.replace(":", ""), tail.lstrip("\\/"))
+    if extension:
+        relative = os.path.splitext(relative)[0] + extension
+    return os.path.join(output_dir, relative)
+
+
+class BatchConverter:
+    """Converts files one after another in this Blender process and emits one result line per file."""
+
+    def __init__(self, mode, output_dir, source_root=None):
+        self.mode = mode
+        self.output_dir = output_dir
+        self.source_root = source_root
+
+    def convert(self, filepath) -> dict:
+        result = {"event": "file", "file": filepath, "status": "ok", "stages": {}, "outputs": []}
+        start = time.perf_counter()
+        try:
+            if self.mode == "export":
+                self._stage(result, "load", lambda: bpy.ops.wm.open_mainfile(filepath=filepath, load_ui=False))
+            else:
+                self._clear_scene()
+                self._stage(result, "import", lambda: self._import(filepath))
+            if self.mode == "import":
+                output = mirror_path(self.output_dir, self.source_root, filepath, ".blend")
+                os.makedirs(os.path.dirname(output), exist_ok=True)
+                self._stage(result, "save", lambda: bpy.ops.wm.save_as_mainfile(filepath=output, copy=True))
+                result["outputs"].append(output)
+            else:
+                self._export(result)
+        except Exception as e:
+            result["status"] = "error"
+            result["error"] = f"{type(e).__name__}: {e}"
+        result["total"] = round(time.perf_counter() - start, 6)
+        return result
+
+    @staticmethod
+    def _stage(result, name, func):
+        start = time.perf_counter()
+        value = func()
+        result["stages"][name] = round(result["stages"].get(name, 0.0) + time.perf_counter() - start, 6)
+        if isinstance(value, set) and 'FINISHED' not in value:
+            raise RuntimeError(f"{name} returned {value}")
+        return value
+
+    @staticmethod
+    def _clear_scene():
+        for obj in list(bpy.data.objects):
+            bpy.data.objects.remove(obj)
+        bpy.data.orphans_purge(do_recursive=True)
+
+    @staticmethod
+    def _import(filepath):
+        if filepath.lower().endswith(".pc"):
+            return bpy.ops.devtools_jbeam_editor.beamng_import_pc_file_to_node_meshes('EXEC_DEFAULT', filepath=filepath)
+        return bpy.ops.devtools_jbeam_editor.beamng_import_jbeam_file_to_node_mesh('EXEC_DEFAULT', filepath=filepath)
+
+    def _export(self, result):
+        from unofficial_jbeam_editor.ui.addon_preferences import MyAddonPreferences as a
+        from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamUtils as j
+        from unofficial_jbeam_editor.utils.jbeam.jbeam_source_exporter import JbeamSourceExporter
+
+        node_meshes = [obj for obj in bpy.data.objects if obj.type == 'MESH' and j.is_node_mesh(obj)]
+        if not node_meshes:
+            raise RuntimeError("No node meshes to export")
+        for obj in node_meshes:
+            exporter = JbeamSourceExporter(obj, a.is_export_optimize_order_enabled(), a.get_export_position_precision())
+            exports = self._stage(result, "collect", exporter.collect)
+            for export in exports.values():
+                export.output_path = mirror_path(self.output_dir, self.source_root, export.jbeam_path)
+                os.makedirs(os.path.dirname(export.output_path), exist_ok=True)
+            for export in self._stage(result, "write", lambda: exporter.write(exports)):
+                if export.error:
+                    raise RuntimeError(f"{export.jbeam_path}: {export.error}")
+                result["outputs"].append(export.output_path)
+
+
+def run_workers(args, files) -> list[dict]:
+    """Split the files over args.jobs worker Blender processes and collect their result lines."""
+    chunks = [files[i::args.jobs] for i in range(args.jobs) if files[i::args.jobs]]
+    workers = []
+    for chunk in chunks:
+        command = [bpy.app.binary_path, "--background", "--python", os.path.abspath(__file__), "--",
+                   "--worker", "--mode", args.mode, "--output", args.output, "--input", *chunk]
+        if args.source_root:
+            command += ["--source-root", args.source_root]
+        if args.verbose:
+            command.append("--verbose")
+        workers.append((chunk, subprocess.Popen(command, stdout=subprocess.PIPE, text=True, encoding="utf-8")))
+    with ThreadPoolExecutor(max_workers=len(workers)) as pool:  # drain all pipes at once so no worker blocks on a full pipe
+        outputs = list(pool.map(lambda worker: worker[1].communicate()[0], workers))
+    results = []
+    for (chunk, process), stdout in zip(workers, outputs):
+        reported = set()
+        for line in stdout.splitlines():
+            if line.startswith(LINE_PREFIX):
+                event = json.loads(line[len(LINE_PREFIX):])
+                if event.get("event") == "file":
+                    emit(event)
+                    results.append(event)
+                    reported.add(event["file"])
+        for filepath in chunk:  # files lost to a crashed worker
+            if filepath not in reported:
+                event = {"event": "file", "file": filepath, "status": "error", "error": f"worker exited with code {process.returncode}", "stages": {}, "outputs": [], "total": 0.0}
+                emit(event)
+                results.append(event)
+    return results
+
+
+def main(argv) -> int:
+    args = parse_args(argv)
+    args.output = os.path.abspath(args.output)
+    addon_utils.enable(ADDON_MODULE, default_set=True)  # default_set makes the addon preferences available
+    if not args.verbose:
+        logging.getLogger().setLevel(logging.WARNING)  # the addon enables debug logging on register
+    os.makedirs(args.output, exist_ok=True)
+
+    start = time.perf_counter()
+    files = args.input if args.worker else collect_files(args.input, args.mode)
+    if args.source_root:
+        args.source_root = os.path.abspath(args.source_root)
+    elif args.mode != "export" and not args.worker:
+        args.source_root = common_root(files)  # computed over all files so that every worker mirrors the same way
+    if args.jobs > 1 and len(files) > 1 and not args.worker:
+        results = run_workers(args, files)
+    else:
+        converter = BatchConverter(args.mode, args.output, args.source_root)
+        results = []
+        for filepath in files:
+            result = converter.convert(filepath)
+            emit(result)
+            results.append(result)
+
+    if not args.worker:
+        stages = {}
+        for result in results:
+            for stage, seconds in result["stages"].items():
+                stages[stage] = round(stages.get(stage, 0.0) + seconds, 6)
+        failed = sum(1 for result in results if result["status"] != "ok")
+        emit({"event": "summary", "mode": args.mode, "files": len(results), "failed": failed, "jobs": args.jobs,
+              "stages": stages, "wall": round(time.perf_counter() - start, 6)})
+    return 1 if any(result["status"] != "ok" for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []))
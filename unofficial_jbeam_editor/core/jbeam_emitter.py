@@ -0,0 +1,57 @@
+import io
+import json
+
+class JbeamEmitter:
+    """Writes JBeam sections to a text stream. Rows are lists, scope modifiers are dicts, both written on one line
+    with JSON quoting. The strings "true" and "false" are written as bare booleans like JBeam expects.
+
+    with open(filepath, "w", encoding="utf-8") as f:
+        JbeamEmitter(f).write_list(nodes, '["id", "posX", "posY", "posZ"],')
+    """
+
+    BARE_LITERALS = {"true", "false"}
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def format_value(self, value, bare_literals=True) -> str:
+        if isinstance(value, str):
+            if bare_literals and value in self.BARE_LITERALS:
+                return value
+            return json.dumps(value, ensure_ascii=False)
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, float):
+            return repr(value)
+        if isinstance(value, int):
+            return str(value)
+        if value is None:
+            return "null"
+        if isinstance(value, (list, tuple)):
+            return "[" + ", ".join(self.format_value(v, bare_literals) for v in value) + "]"
+        if isinstance(value, dict):
+            return "{" + ", ".join(f"{json.dumps(str(k), ensure_ascii=False)}: {self.format_value(v, bare_literals)}" for k, v in value.items()) + "}"
+        return json.dumps(str(value), ensure_ascii=False)
+
+    def write(self, text: str):
+        self.stream.write(text)
+
+    def write_list(self, data, prepend="", newfile=True, bare_literals=True):
+        """One item per line. Rows are indented for a new file (12 spaces) or for splicing into an existing section (4 spaces)."""
+        spaces = 12 if newfile else 4
+        indent = " " * spaces
+        write = self.stream.write
+        if prepend:
+            write((indent if newfile else "") + prepend + "\n")
+        for i, item in enumerate(data):
+            if i:
+                write(",\n")
+            write(indent)
+            write(self.format_value(item, bare_literals))
+        write("\n" + " " * (spaces - 4))
+
+    @staticmethod
+    def format_list(data, prepend="", newfile=True, bare_literals=True) -> str:
+        stream = io.StringIO()
+        JbeamEmitter(stream).write_list(data, prepend, newfile, bare_literals)
+        return stream.getvalue()
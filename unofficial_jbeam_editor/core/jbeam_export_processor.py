@@ -0,0 +1,128 @@
+import re
+import logging
+
+class JbeamExportProcessor:
+    """Splices new section contents into the text of an existing .jbeam file. The file is tokenized once to find the spans
+    of all target sections, then the output is assembled from slices, so comments and formatting outside the sections are kept."""
+
+    STRING = r'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+    # Group 1 is the token, the separators before it are skipped in the same match. A bracket-free row like ["a1", 0, 0, 0]
+    # is one token, so a row costs one match instead of one per value.
+    TOKEN_PATTERN = re.compile(
+        r'[^\[\]{}"/:]*+(\[[^\[\]{}"/]*+(?:' + STRING + r'[^\[\]{}"/]*+)*+\]|' + STRING + r'|//[^\n]*|/\*.*?\*/|[\[\]{}:])', re.DOTALL)
+    ROW_ID_PATTERN = re.compile(r'\[\s*(' + STRING + ')')  # first string of a row, the node id in a nodes section
+
+    def __init__(self, json_data):
+        self.json_data = json_data
+        self.modified_data = json_data
+        self.changed_sections: list[str] = []  # keys of the sections whose text differs from the file after replace_sections
+        self._sections_cache = (None, {})  # (text, spans of every array member of every part) of the last tokenized text
+
+    def find_part_sections(self, keys) -> dict[str, list[tuple[str, int, int, str]]]:
+        """part name -> (key, key end, section end, indent) of every section array named in keys. Sections are direct members of a part."""
+        keys = set(keys)
+        spans = {}
+        for part_name, part_spans in self._get_all_sections().items():
+            part_spans = [span for span in part_spans if span[0] in keys]
+            if part_spans:
+                spans[part_name] = part_spans
+        return spans
+
+    def _get_all_sections(self) -> dict[str, list[tuple[str, int, int, str]]]:
+        """Spans of all array members of all parts. The text is tokenized once until replace_sections changes it."""
+        data = self.modified_data
+        if self._sections_cache[0] is not data:
+            self._sections_cache = (data, self._tokenize_sections(data))
+        return self._sections_cache[1]
+
+    def _tokenize_sections(self, data) -> dict[str, list[tuple[str, int, int, str]]]:
+        spans = {}  # part name -> spans
+        stack = []  # (bracket, key of the container in its parent object)
+        last_string = None
+        current_key = None
+        open_section = None  # (key, key end, indent, stack depth)
+        for match in self.TOKEN_PATTERN.finditer(data):
+            token = match.group(1)
+            first = token[0]
+            if first == '"':
+                last_string = match
+                continue
+            if first == '/':
+                continue
+            if first == ':':
+                current_key = last_string
+                continue
+            is_section = (open_section is None and first == '[' and current_key is not None and len(stack) == 2 and stack[1][0] == '{')
+            if len(token) > 1:  # a whole row, opened and closed
+                if is_section:
+                    spans.setdefault(stack[1][1], []).append((current_key.group(1)[1:-1], current_key.end(), match.end(), self._get_indent(data, current_key.start(1))))
+            elif first in '[{':
+                if is_section:
+                    open_section = (current_key.group(1)[1:-1], current_key.end(), self._get_indent(data, current_key.start(1)), len(stack))
+                stack.append((first, current_key.group(1)[1:-1] if current_key is not None else None))
+            else:
+                if stack:
+                    stack.pop()
+                if open_section is not None and len(stack) == open_section[3]:
+                    key, key_end, indent, _ = open_section
+                    spans.setdefault(stack[1][1], []).append((key, key_end, match.end(), indent))
+                    open_section = None
+            current_key = None
+            last_string = None
+        return spans
+
+    def find_sections(self, keys, part_name=None) -> list[tuple[str, int, int, str]]:
+        """Section spans in file order. With part_name only the sections of that part are returned if the part exists."""
+        spans = self.find_part_sections(keys)
+        if part_name is not None and part_name in spans:
+            return spans[part_name]
+        if part_name is not None:
+            logging.debug(f"⚠️  Part '{part_name}' not found, replacing the sections of all parts")
+        return sorted((span for part_spans in spans.values() for span in part_spans), key=lambda span: span[1])
+
+    @staticmethod
+    def _get_indent(data, pos) -> str:
+        line_start = data.rfind('\n', 0, pos) + 1
+        prefix = data[line_start:pos]
+        return " " * (len(prefix) - len(prefix.lstrip()))
+
+    def match_part(self, node_ids) -> str | None:
+        """Name of the part whose nodes section lists the most of node_ids as row ids. If no part lists any of them,
+        the only part with a nodes section or None."""
+        data = self.modified_data
+        part_sections = self.find_part_sections(("nodes",))
+        best_part, best_hits = next(iter(part_sections)) if len(part_sections) == 1 else None, 0
+        for part_name, spans in part_sections.items():
+            hits = sum(
+                1 for _, key_end, section_end, _ in spans
+                for match in self.ROW_ID_PATTERN.finditer(data, key_end, section_end)
+                if match.group(1)[1:-1] in node_ids
+            )
+            if hits > best_hits:
+                best_part, best_hits = part_name, hits
+        return best_part
+
+    def replace_sections(self, sections: dict[str, str], part_name=None) -> str:
+        """Replace the contents of all sections (key -> new contents) in one pass and return the new text.
+        The sections whose text changed are listed in changed_sections."""
+        data = self.modified_data
+        chunks = []
+        pos = 0
+        self.changed_sections = []
+        for key, key_end, section_end, indent in self.find_sections(sections, part_name):
+            indented_contents = "\n".join(indent + line for line in sections[key].splitlines())
+            section = f': [\n    {indented_contents}\n{indent}]'
+            if section != data[key_end:section_end]:
+                self.changed_sections.append(key)
+            chunks.append(data[pos:key_end])
+            chunks.append(section)
+            pos = section_end
+        chunks.append(data[pos:])
+        self.modified_data = "".join(chunks)
+        return self.modified_data
+
+    def insert_node_contents(self, key, new_contents, part_name=None):
+        return self.replace_sections({key: new_contents}, part_name)
+
+    def get_result(self):
+        return self.modified_data
@@ -0,0 +1,167 @@
+import re
+import json
+import logging
+
+from unofficial_jbeam_editor.core.json_cleanup import json_cleanup
+
+class JbeamFileHelper:
+
+    # NOTE: Changes to this helper should be tested with test_data/test.jbeam
+
+    # 🔧 Precompiled regex patterns (your patterns, unchanged)
+    RE_LINE_COMMENT = re.compile(r'(?<!:)\s*//.*$')
+    RE_DOUBLE_COMMAS = re.compile(r'(,\s*){2,}')
+    RE_QUOTED_DICT = re.compile(r'"\s*\{')
+    RE_ARRAY_DICT = re.compile(r'\]\s*\{')
+    RE_CURLY_DICT = re.compile(r'\}\s*\{')
+    RE_MISSING_COMMA_BEFORE_KEY = re.compile(r'(?<=[}\]0-9"e])\s*(?="[^"]+"\s*:)')
+    RE_QUOTED_STRING_NUMBER = re.compile(r'(\[\s*"[^"]*")(?=\s*-?\d)')  # FIXME: still a bug with lines like ["name","[group]:", which incorrectly transform into ["name","[, group]:"
+    RE_REMOVE_BAD_COMMA_BEFORE_BRACKET = re.compile(r',\s*(?=\[\w)') # NOTE: This is a crappy workaround for the defective RE_QUOTED_STRING_NUMBER
+    RE_SPACE_SEPARATED_NUMBERS_1 = re.compile(r'(-?\d+(?:\.\d+)?)(\s+)(?=-?\d)')
+    RE_SPACE_SEPARATED_NUMBERS_2 = re.compile(r'(-?\d+(?:\.\d+)?)(?=\s+-?\d)')
+    RE_FLOAT_DICT = re.compile(r'(\d+\.\d+)\s*(\{)')
+    RE_KEY_DICT = re.compile(r'(".*?")\s*(?=[\{\[])')
+    RE_NUMBER_STRING = re.compile(r'(-?\d+(?:\.\d+)?)(\s+)(")')
+    RE_NUMBER_STRING_NO_SPACE = re.compile(r'(\d(?:\.\d+)?)(?="\w)')
+
+    @staticmethod
+    def loads_json_object(json_string: str) -> dict:
+        json_data = json.loads(json_string)
+        if not isinstance(json_data, dict):
+            raise ValueError("❌ Expected a JSON object (dictionary) at the top level")
+        main_key = next(iter(json_data), None)
+        if main_key is None:
+            raise ValueError("❌ Empty JSON structure")
+        return json_data
+
+    @staticmethod
+    def validate_jbeam(json_data: dict) -> dict:
+        if not isinstance(json_data, dict):
+            raise ValueError("❌ Root of the JBeam file must be a dictionary.")
+        for part_name, part_data in json_data.items():
+            if not isinstance(part_data, dict):
+                raise ValueError(f"❌ Part '{part_name}' must be a dictionary.")
+            if not part_data:
+                raise ValueError(f"❌ Part '{part_name}' must not be empty.")
+        return json_data
+
+    @staticmethod
+    def decode(text: str) -> dict:
+        """Parts of a jbeam text that may have comments and dangling commas. Malformed text raises ValueError, see attempt_fix_jbeam_commas."""
+        return JbeamFileHelper.validate_jbeam(JbeamFileHelper.loads_json_object(json_cleanup(text)))
+
+    @staticmethod
+    def attempt_fix_jbeam_commas(content: str, is_jbeam=True) -> str:
+        logging.debug("🩹 Fixing syntax errors in content...")
+        lines = JbeamFileHelper.remove_block_and_line_comments(content)
+        fixed_lines = []
+        total_fixes = 0
+
+        # Precompute next significant line for each line
+        next_lines = [''] * len(lines)
+        for i in range(len(lines) - 1):
+            for j in range(i + 1, len(lines)):
+                next_line = lines[j].strip()
+                if next_line:
+                    next_lines[i] = next_line
+                    break
+
+        for i, line in enumerate(lines):
+            s = line.rstrip()
+            while s.lstrip().startswith(","):
+                s = s.lstrip().lstrip(",")
+
+            s, fixes = JbeamFileHelper.RE_LINE_COMMENT.subn('', s)
+            total_fixes += fixes
+
+            s, fixes = JbeamFileHelper.RE_DOUBLE_COMMAS.subn(',', s)
+            total_fixes += fixes
+
+            s = s.rstrip()
+            if not s.strip():
+                continue
+
+            if not s.endswith((',', '{', '[', ':')):
+                next_line = lines[i + 1].strip() if i + 1 < len(lines) else ''
+                if next_line and not next_line.startswith(('}', ']')):
+                    s += ','  # add missing comma
+                    total_fixes += 1
+
+            next_line = next_lines[i]
+            if s.endswith(',') and next_line.startswith(('}', ']')):
+                s = s.rstrip(',')
+                total_fixes += 1
+
+            if is_jbeam:
+                for regex, replacement in [
+                    (JbeamFileHelper.RE_QUOTED_DICT, '",{'),
+                    (JbeamFileHelper.RE_ARRAY_DICT, '],{'),
+                    (JbeamFileHelper.RE_CURLY_DICT, '}, {'),
+                    (JbeamFileHelper.RE_MISSING_COMMA_BEFORE_KEY, ', '),
+                    (JbeamFileHelper.RE_QUOTED_STRING_NUMBER, r'\1,'),
+                    (JbeamFileHelper.RE_SPACE_SEPARATED_NUMBERS_1, r'\1, '),
+                    (JbeamFileHelper.RE_SPACE_SEPARATED_NUMBERS_2, r'\1, '),
+                    (JbeamFileHelper.RE_FLOAT_DICT, r'\1,\2'),
+                    (JbeamFileHelper.RE_KEY_DICT, r'\1, '),
+                    (JbeamFileHelper.RE_NUMBER_STRING, r'\1, \3'),
+                    (JbeamFileHelper.RE_NUMBER_STRING_NO_SPACE, r'\1,'),
+                ]:
+                    s, fixes = regex.subn(replacement, s)
+                    total_fixes += fixes
+
+            s, fixes = JbeamFileHelper.RE_REMOVE_BAD_COMMA_BEFORE_BRACKET.subn('', s)  # NOTE: remove this line when above FIXME is fixed as it's just a workaround revert fix for defective RE_QUOTED_STRING_NUMBER
+
+            fixed_lines.append(s)
+
+        if total_fixes > 0:
+            logging.debug(f"🆗 Total fixes made: {total_fixes}")
+        return '\n'.join(fixed_lines)
+
+
+    @staticmethod
+    def extract_json_error_snippet(e, raw_content):
+        error_message = str(e)
+        if 'Expecting' in error_message:
+            parts = error_message.split('char')
+            char_position = parts[1].strip().split()[0]  # Get the first part before any non-numeric characters
+            char_position = ''.join(filter(str.isdigit, char_position))  # Remove non-numeric characters (like ')') from char_position
+            try:
+                char_position = int(char_position)  # Convert char_position to an integer
+            except ValueError:
+                logging.debug("❌ Failed to extract valid character position.")
+                return
+
+            snippet_start = max(0, char_position - 40)  # 40 characters before the error
+            snippet_end = min(len(raw_content), char_position + 40)  # 40 characters after
+            error_text = raw_content[snippet_start:snippet_end]
+            logging.debug(f"Error position: {char_position}")
+            return error_text
+        return
+    
+    @staticmethod
+    def remove_block_and_line_comments(content: str) -> list[str]:
+        lines = content.splitlines()
+        cleaned_lines = []
+        in_block_comment = False
+
+        for line in lines:
+            line, _ = JbeamFileHelper.RE_LINE_COMMENT.subn('', line)  # Remove inline line comments first
+
+            if not in_block_comment:
+                if '/*' in line:
+                    before_comment = line.split('/*', 1)[0].rstrip()
+                    if before_comment:
+                        cleaned_lines.append(before_comment)
+                    in_block_comment = True
+                    continue
+                if not line.strip():
+                    continue
+                cleaned_lines.append(line)
+            else:
+                if '*/' in line:
+                    after_comment = line.split('*/', 1)[1].strip()
+                    in_block_comment = False
+                    if after_comment:
+                        cleaned_lines.append(after_comment)
+                # else: still inside a block comment, skip
+        return cleaned_lines
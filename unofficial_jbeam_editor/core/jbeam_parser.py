@@ -1,12 +1,11 @@
-import mathutils
 import logging
 
 from typing import Union
 from pathlib import Path
 
-from unofficial_jbeam_editor.utils.utils import Utils
-from unofficial_jbeam_editor.utils.jbeam.jbeam_loader import JbeamLoadItem
-from unofficial_jbeam_editor.utils.jbeam.jbeam_models import JbeamJson, JbeamPart, JbeamSlotType, NodeID, Node, Beam, Triangle, JbeamPartID, JbeamPartSectionName, JbeamPartData, JsonJbeamElement, JbeamElementProps
+from unofficial_jbeam_editor.core.stage_profiler import StageProfiler
+from unofficial_jbeam_editor.core.lazy_logger import LazyLogger
+from unofficial_jbeam_editor.core.jbeam_models import JbeamLoadItem, JbeamJson, JbeamPart, JbeamSlotType, NodeID, Node, Beam, Triangle, JbeamPartID, JbeamPartSectionName, JbeamPartData, JsonJbeamElement, JbeamElementProps
 
 
 class JbeamParser:
@@ -40,23 +39,26 @@ class JbeamParser:
                 if isinstance(slot_rows, list) and len(slot_rows) > 1:
                     p.slots = [row[0] for row in slot_rows[1:] if isinstance(row, list) and len(row) > 0]
             nodes = self._get_section("nodes", part_data)
-            logging.debug(f"🧩 Parsing Nodes ⚪ {part_name}")
+            logging.debug("🧩 Parsing Nodes ⚪ %s", part_name)
             if nodes:
-                p.nodes_list = self._parse_nodes(nodes)
+                with StageProfiler.stage("parse.nodes"):
+                    p.nodes_list = self._parse_nodes(nodes)
+                StageProfiler.count("nodes", len(p.nodes_list))
             else:
-                logging.debug(f"    - No Nodes found in {part_name}.")
+                logging.debug("    - No Nodes found in %s.", part_name)
             p.json_beams = self._get_section("beams", part_data)
             p.json_triangles = self._get_section("triangles", part_data)
             p.json_quads = self._get_section("quads", part_data)
 
             self.jbeam_parts[p.id] = p
-            logging.debug(f"    - Registered part {p}")
+            logging.debug("    - Registered part %s", p)
 
     def _get_section(self, section_name: JbeamPartSectionName, part_data: JbeamPartData) -> list[Union[JbeamElementProps, JsonJbeamElement]]:
         return part_data.get(section_name, [])
 
     def _split_quads_into_triangles(self, quads_json: list) -> list:
         result = []
+        log = LazyLogger()
         for entry in quads_json:
             if isinstance(entry, list) and len(entry) >= 4:
                 *nodes, last = entry
@@ -69,9 +71,10 @@ class JbeamParser:
                     result.append([n1, n2, n3, props.copy()])
                     result.append([n3, n4, n1, props.copy()])
                 else:
-                    logging.debug(f"⚠️  WARNING: entry {entry} not a proper quad (ignored)")
+                    log.count("⚠️  WARNING: entry %s not a proper quad (ignored)", entry)
             else:
                 result.append(entry)  # Keep dicts and others as-is
+        log.flush()
         return result
 
     def parse_data_for_jbeam_object_conversion(self, obj, part_id="", get_vertex_indices=True):
@@ -91,12 +94,15 @@ class JbeamParser:
             part.triangles_list = (part.triangles_list or []) + tris_from_quads_list
 
         except Exception as e:
-            Utils.log_and_raise(f"An error occurred while processing the remaining JBeam data: {e}", RuntimeError, e)   
+            msg = f"An error occurred while processing the remaining JBeam data: {e}"
+            logging.error(msg)
+            raise RuntimeError(msg) from e
 
     def _parse_nodes(self, json_nodes: list):
         nodes: list[Node] = []
         seen_node_ids = set()  # Track node_id uniqueness
         current_props = {}
+        log = LazyLogger()
 
         for entry in json_nodes:
             if isinstance(entry, dict):
@@ -109,11 +115,11 @@ class JbeamParser:
                     continue  # Skip header row
 
                 if node_id in seen_node_ids:
-                    logging.debug(f"⚠️  Warning: Duplicate node '{node_id}' found and skipped ...")
+                    log.count("⚠️  Warning: Duplicate node '%s' found and skipped ...", node_id)
                     continue  # Skip duplicate node_id
 
                 seen_node_ids.add(node_id)
-                position = mathutils.Vector((x, y, z))
+                position = (x, y, z)
                 props = current_props.copy()
                 props.update(inline_props)
                 instance = 1 # only 1 instance can exist of one node ID unlike beams and triangles that can have multiple instances
@@ -121,6 +127,7 @@ class JbeamParser:
                 node.source_jbeam = self.source.file_path
                 nodes.append(node)
 
+        log.flush()
         return nodes
 
     def _parse_elements(self, json_data, structure_type, part_id="", lookup=None):
@@ -136,7 +143,8 @@ class JbeamParser:
             return
 
         seen_structures = {}  # Track unique beams/triangles and their instance counts
-        missing_node_warnings = []
+        log = LazyLogger()
+        missing_log = LazyLogger()
 
         def get_node(self, part, name):
             if name not in part.nodes:
@@ -151,7 +159,7 @@ class JbeamParser:
 
             elif isinstance(entry, list):
                 if isinstance(entry, list) and all(isinstance(item, str) and item.startswith("id") and item.endswith(":") for item in entry[:2]):
-                    logging.debug(f"    - Header detected: {entry} (ignored)")
+                    log.count("    - Header detected: %s (ignored)", entry)
                     continue
 
                 nodes = None
@@ -167,8 +175,9 @@ class JbeamParser:
 
                 if any(n is None for n in nodes):
                     # Store which node names were missing
-                    missing = [name for name, node in zip(entry, nodes) if node is None]
-                    missing_node_warnings.append((entry[:len(nodes)], missing))
+                    if missing_log.enabled:
+                        missing = [name for name, node in zip(entry, nodes) if node is None]
+                        missing_log.count("    - %s (missing: %s)", entry[:len(nodes)], missing)
                     continue # FIXME nodes are not found for the base part because they are in the child part
 
                 index = get_index([n.index for n in nodes]) if lookup else -1
@@ -188,23 +197,29 @@ class JbeamParser:
                 struct.source_jbeam = self.source.file_path
                 structures.append(struct)  # Beam() or Triangle()
 
-        if missing_node_warnings:
-            logging.debug(f"⚠️  Missing node references detected while accessing {structure_type.capitalize().rstrip('s')} elements:")
-            for full_entry, missing_names in missing_node_warnings:
-                logging.debug(f"    - {full_entry} (missing: {missing_names})")
-            logging.debug("💡 Nodes may be missing or the part depends on a base JBeam. Try importing the matching .pc file.")
+        log.flush()
+        if missing_log.total("    - %s (missing: %s)"):
+            missing_log.log("⚠️  Missing node references detected while accessing %s elements:", structure_type.capitalize().rstrip('s'))
+            missing_log.flush()
+            missing_log.log("💡 Nodes may be missing or the part depends on a base JBeam. Try importing the matching .pc file.")
 
         return structures
 
     def _parse_beams(self, json_beams, mesh=None, part_id=""):
-        logging.debug(f"🧩 Parsing Beams 🟰  {part_id}")
-        lookup = {tuple(sorted((e.vertices[0], e.vertices[1]))): e.index for e in mesh.edges} if mesh else None
-        return self._parse_elements(json_beams, "beams", part_id, lookup)
+        logging.debug("🧩 Parsing Beams 🟰  %s", part_id)
+        with StageProfiler.stage("parse.beams"):
+            lookup = {tuple(sorted((e.vertices[0], e.vertices[1]))): e.index for e in mesh.edges} if mesh else None
+            beams = self._parse_elements(json_beams, "beams", part_id, lookup)
+        StageProfiler.count("beams", len(beams or ()))
+        return beams
 
     def _parse_triangles(self, json_triangles, mesh=None, part_id=""):
-        logging.debug(f"🧩 Parsing triangles 📐 {part_id}")
-        lookup = {tuple(sorted(f.vertices)): f.index for f in mesh.polygons} if mesh else None
-        return self._parse_elements(json_triangles, "triangles", part_id, lookup)
+        logging.debug("🧩 Parsing triangles 📐 %s", part_id)
+        with StageProfiler.stage("parse.triangles"):
+            lookup = {tuple(sorted(f.vertices)): f.index for f in mesh.polygons} if mesh else None
+            triangles = self._parse_elements(json_triangles, "triangles", part_id, lookup)
+        StageProfiler.count("triangles", len(triangles or ()))
+        return triangles
 
     # deprecated function: used to get the vertex indices of a BeamNG's Jbeam Editor object mesh during conversion into this addon's Node Mesh
     def _retrieve_closest_vertex_indices(self, obj, part: JbeamPart, epsilon=0.0005):
@@ -213,8 +228,8 @@ class JbeamParser:
             closest_dist_sq = float('inf')
 
             for vert in obj.data.vertices:
-                vert_pos = obj.matrix_world @ vert.co  
-                dist_sq = (vert_pos - node.position).length_squared
+                vert_pos = obj.matrix_world @ vert.co
+                dist_sq = sum((a - b) ** 2 for a, b in zip(vert_pos, node.position))
 
                 if dist_sq < closest_dist_sq:
                     closest_dist_sq = dist_sq
@@ -238,7 +253,7 @@ class JbeamParser:
         items = nodes.items() # Iterable[Tuple[NodeID, Node]]
         for node_id, node in items:
             logging.debug(f"{node_id} => {node}")
-            # i.e.: 'node_1' => Node(instance=1, id=a1ll, index=5, pos=<Vector (0.6800, -0.9350, 0.1100)>, props={'frictionCoef': 1.2, 'nodeMaterial': '|NM_RUBBER', 'nodeWeight': 1, 'collision': True, 'selfCollision': True, 'group': 'mattress'})
+            # i.e.: 'node_1' => Node(instance=1, id=a1ll, index=5, pos=(0.68, -0.935, 0.11), props={'frictionCoef': 1.2, 'nodeMaterial': '|NM_RUBBER', 'nodeWeight': 1, 'collision': True, 'selfCollision': True, 'group': 'mattress'})
 
     def get_jbeam_parts(self) -> dict[JbeamPartID, JbeamPart]:
         return self.jbeam_parts
@@ -0,0 +1,75 @@
+from unofficial_jbeam_editor.core.jbeam_models import JbeamPartID
+
+PartGroupID = str
+
+class GroupedPart:
+    def __init__(self, part, group_id, level, parser):
+        self.id = part.id
+        self.group_id: PartGroupID = group_id
+        self.level = level
+        self.parser = parser
+
+    def __repr__(self):
+        return f"GroupedPart(id={self.id}, group_id={self.group_id}, level={self.level}, parser={self.parser.parse_source})"
+
+class JbeamPartGrouper:
+    """Groups the parsed parts of a part config. A part joins the group of a part whose slots accept its slotType."""
+
+    @staticmethod
+    def can_be_grouped_with(source, candidate) -> bool:
+        for slot in source.slots:
+            slot_type = slot[0] if isinstance(slot, (list, tuple)) else slot
+            if candidate.slot_type == slot_type:
+                return True
+        return False
+
+    @staticmethod
+    def group_parts(parsers) -> list[GroupedPart]:
+        visited_parts: set[JbeamPartID] = set()
+        grouped_parts: list[GroupedPart] = []
+        group_counter: PartGroupID = 0
+
+        parsers_by_id = {
+            part.id: parser
+            for parser in parsers
+            for part in parser.jbeam_parts.values()
+        }
+
+        for parser in parsers:
+            load_item = parser.parse_source
+            jbeam_part = parser.get_jbeam_part(load_item.part_id)
+            if not jbeam_part or jbeam_part.id in visited_parts:
+                continue
+
+            # logging.debug(f"🔹 Starting new group {group_counter} from root part: {jbeam_part.slot_type}:{jbeam_part.id}")
+            group = JbeamPartGrouper._explore_and_group_parts(parsers_by_id, jbeam_part, visited_parts, group_counter)
+            grouped_parts.extend(group)
+            group_counter += 1
+
+        return grouped_parts
+
+    @staticmethod
+    def _explore_and_group_parts(parsers_by_id, root_part, visited_parts, group_counter) -> list[GroupedPart]:
+        group: list[GroupedPart] = []
+        queue = [(root_part, 0)]  # Start with root part at level 0
+
+        while queue:
+            current_part, level = queue.pop(0)
+            if current_part.id in visited_parts:
+                continue
+
+            current_parser = parsers_by_id.get(current_part.id)
+            if not current_parser:
+                continue
+
+            group.append(GroupedPart(current_part, group_counter, level, current_parser))
+            visited_parts.add(current_part.id)
+
+            for other_parser in parsers_by_id.values():
+                for candidate in other_parser.jbeam_parts.values():
+                    if candidate.id in visited_parts or candidate.id == current_part.id:
+                        continue
+                    if JbeamPartGrouper.can_be_grouped_with(current_part, candidate):
+                        queue.append((candidate, level + 1))
+
+        return group
@@ -2,9 +2,7 @@ import os
 import re
 import logging
 
-from unofficial_jbeam_editor.ui.addon_preferences import MyAddonPreferences as a
-from unofficial_jbeam_editor.utils.utils import Utils
-from unofficial_jbeam_editor.utils.jbeam.jbeam_models import JbeamLoadItem, PcJson, PcJbeamParts
+from unofficial_jbeam_editor.core.jbeam_models import JbeamLoadItem, PcJson, PcJbeamParts
 
 
 class PartConfig:
@@ -32,7 +30,7 @@ class JbeamPcParser:
             self.pc.model = data.get("model")
             self.pc.part_names = data.get("parts", {})
         except Exception as e:
-            Utils.log_and_report(f"Failed to parse PC file 📄 {self.pc.filepath}: {e}", None, "ERROR")
+            logging.error(f"Failed to parse PC file 📄 {self.pc.filepath}: {e}")
             return False
         logging.debug(f"Loaded part configurator: {self.pc} ")
         return True
@@ -0,0 +1,323 @@
+import ast
+import json
+import math
+import re
+import logging
+
+from collections import defaultdict, OrderedDict
+
+from unofficial_jbeam_editor.core.number_utils import NumberUtils
+
+DEFAULT_SCOPE_MODIFIER_VALUES = {
+    "frictionCoef": 1.0,
+    "nodeMaterial": "|NM_METAL",
+    "nodeWeight": 25,
+    "collision": "true",
+    "selfCollision": "false",
+    "fixed": "false",
+    "group": "",
+    "disable": "",
+    "beamPrecompression": 1,
+    "beamType": "|NORMAL",
+    "beamLongBound": 1,
+    "beamShortBound": 1,
+    "beamSpring": 10000000,
+    "beamDamp": 0,
+    "beamDeform": "FLT_MAX",
+    "beamStrength": "FLT_MAX",
+    "breakGroup": "",
+    "groundModel": "asphalt"
+}
+
+class JbeamStructureBuilder:
+    """Normalizes the props of mesh elements and sorts the elements so that elements with equal props are adjacent."""
+
+    @staticmethod
+    def _is_literal(value) -> bool:
+        """True if value survives json.dumps -> ast.literal_eval unchanged, which is how props used to be copied."""
+        if isinstance(value, (str, int)) and not isinstance(value, bool):
+            return True
+        if isinstance(value, bool) or value is None:
+            return False  # true/false/null are not Python literals
+        if isinstance(value, float):
+            return math.isfinite(value)
+        if isinstance(value, list):
+            return all(JbeamStructureBuilder._is_literal(v) for v in value)
+        if isinstance(value, dict):
+            return all(isinstance(k, str) and JbeamStructureBuilder._is_literal(k) and JbeamStructureBuilder._is_literal(v) for k, v in value.items())
+        return False
+
+    def _parse_properties(self, properties):
+        if not properties or not isinstance(properties, dict):
+            return {}
+        if not self._is_literal(properties):
+            properties_str = json.dumps(properties)
+            try:
+                ast.literal_eval(properties_str)  # true/false/null/NaN still drop the props like they always did
+            except (SyntaxError, ValueError):
+                return {}  # Handle invalid cases gracefully
+            properties = json.loads(properties_str)
+        return {k.strip(): v for k, v in properties.items()}
+
+    @staticmethod
+    def _freeze(value):
+        """Canonical hashable key of a props value. Types are part of the key since 1, 1.0 and True serialize differently."""
+        if isinstance(value, dict):
+            return (dict, tuple((k, JbeamStructureBuilder._freeze(v)) for k, v in value.items()))
+        if isinstance(value, list):
+            return (list, tuple(JbeamStructureBuilder._freeze(v) for v in value))
+        return (type(value), value)
+
+    def _normalize_properties(self, node_info, unique_props):
+        cleaned_node_info = {k.strip(): v for k, v in node_info.items()}
+
+        # Fill in missing properties with defaults
+        for prop in unique_props:
+            if prop not in cleaned_node_info:
+                cleaned_node_info[prop] = DEFAULT_SCOPE_MODIFIER_VALUES.get(prop, "")
+
+        for prop, value in cleaned_node_info.items():
+            if not isinstance(value, str):
+                continue
+            if value.isdigit():
+                cleaned_node_info[prop] = int(value)
+            elif NumberUtils.is_float(value):
+                cleaned_node_info[prop] = float(value)
+            else:
+                try:
+                    decoded_value = json.loads(value)
+                    if isinstance(decoded_value, list):  # If it's a list, we update
+                        cleaned_node_info[prop] = decoded_value
+                    else:
+                        cleaned_node_info[prop] = value.replace('"', '').replace("'", '')  # Properties with quotes in the UI are acceptable; they will automatically be sanitized here and converted to use double quotes in the JBeam file for consistency.
+                except json.JSONDecodeError:
+                    pass
+
+        sorted_props = {}
+        for key in ["group", "deformGroup", "breakGroup"]:
+            if not key in cleaned_node_info:
+                continue
+            value = cleaned_node_info.pop(key) # make group properties display first in the dictionary
+            # Try convert from string to list if it's a JSON string so we can sort the elements for groups
+            if isinstance(value, str):
+                try:
+                    cleaned_json_str = re.sub(r",\s*]", "]", value)
+                    value = json.loads(cleaned_json_str.strip())  # Strip spaces and load JSON
+                except json.JSONDecodeError:
+                    pass  # If not a JSON string, keep as-is
+            if isinstance(value, list):
+                value = sorted(value)
+            sorted_props[key] = value
+
+        sorted_props.update(dict(sorted(cleaned_node_info.items(), key=lambda x: x[0].lower())))
+        # The compact JSON text is only the sort key, so the order matches earlier exports exactly
+        sort_key = json.dumps(sorted_props, separators=(",", ":"), sort_keys=False)
+        if not self._is_literal(sorted_props):
+            sorted_props = json.loads(sort_key)  # keep the JSON value semantics (tuples -> lists, NaN handling) of earlier exports
+        return sorted_props, sort_key
+
+    def build(self, props: dict[int, dict[int, dict]]) -> OrderedDict:
+        """element index -> instance -> props to '{index}_{instance}' -> normalized props, sorted so equal props are adjacent."""
+        data_dict = {}
+        for v_idx, instances in props.items():
+            for instance, prop in instances.items():  # Iterate over the instances in each vertex/edge/face
+                data_dict[f"{v_idx}_{instance+1}"] = self._parse_properties(prop)
+        unique_props = set()  # Collect all unique properties dynamically
+        for node_info in data_dict.values():
+            unique_props.update(node_info.keys())
+
+        # Most elements share their props, so each distinct set is normalized once
+        normalized = {}
+        final_list = {}
+        for node_id, node_info in data_dict.items():
+            frozen = self._freeze(node_info)
+            if frozen not in normalized:
+                normalized[frozen] = self._normalize_properties(node_info, unique_props)
+            final_list[node_id] = normalized[frozen]
+
+        # Sort based on JSON string to ensure determinism
+        sorted_items = sorted(final_list.items(), key=lambda x: x[1][1])
+
+        return OrderedDict((k, dict(v[0])) for k, v in sorted_items)
+
+
+class ScopeModifierOrderOptimizer:
+    """Orders elements so that consecutive elements share as many props as possible, which minimizes the scope modifier rows
+    written by JbeamRedundancyReducer. Elements with equal props are grouped, the groups are ordered by greedy
+    nearest neighbour over the number of differing props and the path is then improved with 2-opt."""
+
+    MAX_GREEDY_GROUPS = 1000  # above this the pairwise distances get too expensive and the original order is kept
+    MAX_TWO_OPT_GROUPS = 300
+    MAX_ALL_STARTS_GROUPS = 64  # below this every group is tried as the start of the greedy path
+    MAX_TWO_OPT_PASSES = 10
+
+    @staticmethod
+    def _freeze(value):
+        if isinstance(value, list):
+            return tuple(ScopeModifierOrderOptimizer._freeze(v) for v in value)
+        if isinstance(value, dict):
+            return tuple((k, ScopeModifierOrderOptimizer._freeze(v)) for k, v in value.items())
+        return value
+
+    @staticmethod
+    def count_modifier_rows(data: dict, items: list[str]) -> int:
+        """Number of modifier rows reduce_redundancy writes for the elements in this order, without the trailing default rows."""
+        rows = 0
+        curr_props = {}
+        for item_idx in reversed(items):
+            for key, value in data[item_idx].items():
+                value = ScopeModifierOrderOptimizer._freeze(value)
+                if curr_props.get(key) != value:
+                    if curr_props.get(key) is not None:
+                        rows += 1
+                    curr_props[key] = value
+        return rows + sum(1 for value in curr_props.values() if value is not None)
+
+    @staticmethod
+    def optimize(data: dict) -> list[str]:
+        """Element order with at most as many modifier rows as the order of data, which is returned if no better order is found."""
+        items = list(data.keys())
+        order = ScopeModifierOrderOptimizer._grouped_order(data, items)
+        if ScopeModifierOrderOptimizer.count_modifier_rows(data, order) > ScopeModifierOrderOptimizer.count_modifier_rows(data, items):
+            return items  # the distances ignore props that carry over from a previous element, so the path can be worse
+        return order
+
+    @staticmethod
+    def _grouped_order(data: dict, items: list[str]) -> list[str]:
+        groups: dict[tuple, list[str]] = {}
+        for item_idx in items:
+            signature = tuple(sorted((key, ScopeModifierOrderOptimizer._freeze(value)) for key, value in data[item_idx].items()))
+            groups.setdefault(signature, []).append(item_idx)
+
+        signatures = list(groups.keys())
+        count = len(signatures)
+        if count < 3 or count > ScopeModifierOrderOptimizer.MAX_GREEDY_GROUPS:
+            return [item_idx for signature in signatures for item_idx in groups[signature]]
+
+        keys = sorted({key for signature in signatures for key, _ in signature})
+        vectors = []
+        for signature in signatures:
+            props = dict(signature)
+            vectors.append(tuple(props.get(key) for key in keys))
+        distances = [[0] * count for _ in range(count)]
+        for i in range(count):
+            vector_i = vectors[i]
+            for k in range(i + 1, count):
+                distances[i][k] = distances[k][i] = sum(1 for a, b in zip(vector_i, vectors[k]) if a != b)
+
+        best_path = list(range(count))  # keep the original order unless a greedy path beats it
+        best_cost = sum(distances[i][i + 1] for i in range(count - 1))
+        starts = range(count) if count <= ScopeModifierOrderOptimizer.MAX_ALL_STARTS_GROUPS else [0]
+        for start in starts:
+            path, cost = ScopeModifierOrderOptimizer._nearest_neighbour_path(distances, start)
+            if cost < best_cost:
+                best_path, best_cost = path, cost
+
+        if count <= ScopeModifierOrderOptimizer.MAX_TWO_OPT_GROUPS:
+            best_path = ScopeModifierOrderOptimizer._two_opt(distances, best_path)
+
+        return [item_idx for group_index in best_path for item_idx in groups[signatures[group_index]]]
+
+    @staticmethod
+    def _nearest_neighbour_path(distances, start) -> tuple[list[int], int]:
+        unvisited = set(range(len(distances)))
+        unvisited.remove(start)
+        path, cost = [start], 0
+        while unvisited:
+            row = distances[path[-1]]
+            nearest = min(unvisited, key=lambda index: (row[index], index))
+            cost += row[nearest]
+            unvisited.remove(nearest)
+            path.append(nearest)
+        return path, cost
+
+    @staticmethod
+    def _two_opt(distances, path) -> list[int]:
+        """Reverses path segments while that shortens the open path."""
+        count = len(path)
+        for _ in range(ScopeModifierOrderOptimizer.MAX_TWO_OPT_PASSES):
+            improved = False
+            for i in range(count - 1):
+                for k in range(i + 1, count):
+                    before = (distances[path[i - 1]][path[i]] if i > 0 else 0) + (distances[path[k]][path[k + 1]] if k < count - 1 else 0)
+                    after = (distances[path[i - 1]][path[k]] if i > 0 else 0) + (distances[path[i]][path[k + 1]] if k < count - 1 else 0)
+                    if after < before:
+                        path[i:k + 1] = reversed(path[i:k + 1])
+                        improved = True
+            if not improved:
+                break
+        return path
+
+
+class JbeamRedundancyReducer:
+    """Turns structured props into jbeam rows, writing a scope modifier row only where a prop changes.
+    Node ids, node positions and the vertex indices of edges and faces are plain lists indexed like the mesh elements."""
+
+    def __init__(self, data, domain="vertex", optimize_order=False, node_ids=None, positions=None, edge_vertices=None, face_vertices=None):
+        self.data = data
+        self.domain = domain
+        self.optimize_order = optimize_order
+        self.node_ids = node_ids
+        self.positions = positions  # (x, y, z) per vertex
+        self.edge_vertices = edge_vertices  # (v1, v2) per edge
+        self.face_vertices = face_vertices  # (v1, v2, v3, ...) per face
+        self.rows_before = 0  # modifier rows in the order of structure_data
+        self.rows_after = 0  # modifier rows in the written order
+    
+    def reduce_redundancy(self):
+        # Start from the bottom of the hierarchy (reverse the order of nodes)
+        hierarchy = []
+        items: list[str] = list(self.data.keys())  # list of element format {index}_{instance} ex: ['0_1', '1_1', '2_1', '3_1', '4_1', '5_1', '6_1', '7_1']
+        self.rows_before = self.rows_after = ScopeModifierOrderOptimizer.count_modifier_rows(self.data, items)
+        if self.optimize_order:
+            items = ScopeModifierOrderOptimizer.optimize(self.data)
+            self.rows_after = ScopeModifierOrderOptimizer.count_modifier_rows(self.data, items)
+            logging.debug(f"🧮 {self.domain}: scope modifier rows {self.rows_before} -> {self.rows_after}")
+        items.reverse()
+        curr_props = defaultdict(lambda: None)  # Track the current hierarchy for each property to avoid redundancy
+        node_ids = self.node_ids
+
+        for item_idx in items:
+            properties = self.data[item_idx]
+
+            for key, value in properties.items():
+                if isinstance(value, list):
+                    value = tuple(value)  # Convert list to tuple to avoid redundancy in defaultdict
+
+                # If the property value has changed, push it up in the hierarchy
+                if curr_props[key] != value:
+                    if curr_props[key] is not None:
+                        processed_value = list(curr_props[key]) if isinstance(curr_props[key], tuple) else curr_props[key]
+                        if key == "group" and processed_value == []:
+                            processed_value = ""  # Convert empty list to empty string
+                        hierarchy.append({key: processed_value})
+                    curr_props[key] = value
+
+            # Split item_idx into element_index and instance
+            idx_str, instance_str = item_idx.split("_")
+            idx = int(idx_str)
+            instance = int(instance_str)
+
+            if self.domain == "vertex":
+                hierarchy.append([node_ids[idx], *self.positions[idx]])  # Append the node itself to the hierarchy
+            elif self.domain == "edge":
+                v1_idx, v2_idx = sorted(self.edge_vertices[idx])
+                hierarchy.append([node_ids[v1_idx] or "?", node_ids[v2_idx] or "?"])  # Append the beam itself to the hierarchy
+            elif self.domain == "face":
+                hierarchy.append([node_ids[v] or "?" for v in self.face_vertices[idx]])  # Append the triangle itself to the hierarchy
+
+        # Add the last property values
+        for key, value in curr_props.items():
+            if value is not None:
+                processed_value = list(value) if isinstance(value, tuple) else value
+                if key == "group" and processed_value == []:
+                    processed_value = ""  # Convert empty list to empty string
+                hierarchy.append({key: processed_value})
+
+        hierarchy.reverse()
+        used_properties = sorted(set(key for node, properties in self.data.items() for key in properties))
+
+        for key in used_properties:
+            hierarchy.append({key: DEFAULT_SCOPE_MODIFIER_VALUES.get(key, '')})
+
+        return hierarchy
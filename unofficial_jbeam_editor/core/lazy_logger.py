@@ -0,0 +1,52 @@
+import logging
+
+
+class LazyLogger:
+    """Logging for per-element loops. Whether the level is enabled is checked once when the logger is created,
+    so a disabled message costs a single boolean test and its %-style arguments are never formatted.
+    Repeated messages can be counted and are then written as a few examples plus the number omitted when flushed.
+
+        with LazyLogger() as log:
+            for node in nodes:
+                log.count("⚠️  Duplicate node ID ignored: '%s'", node.id)
+    """
+
+    def __init__(self, level=logging.DEBUG, logger: logging.Logger | None = None, max_examples=3):
+        self.logger = logger or logging.getLogger()
+        self.level = level
+        self.enabled = self.logger.isEnabledFor(level)
+        self.max_examples = max_examples
+        self._counts: dict[str, int] = {}  # message template -> number of times counted
+        self._examples: dict[str, list[tuple]] = {}  # message template -> arguments of the first max_examples
+
+    def log(self, msg: str, *args):
+        if self.enabled:
+            self.logger.log(self.level, msg, *args)
+
+    def count(self, msg: str, *args):
+        """Count a message that repeats per element. msg is the %-style template and also the key it is counted under."""
+        if not self.enabled:
+            return
+        n = self._counts.get(msg, 0)
+        self._counts[msg] = n + 1
+        if n < self.max_examples:
+            self._examples.setdefault(msg, []).append(args)
+
+    def total(self, msg: str) -> int:
+        return self._counts.get(msg, 0)
+
+    def flush(self):
+        for msg, n in self._counts.items():
+            examples = self._examples.get(msg, [])
+            for args in examples:
+                self.logger.log(self.level, msg, *args)
+            if n > len(examples):
+                self.logger.log(self.level, "    ... %d more like this omitted (%d in total)", n - len(examples), n)
+        self._counts.clear()
+        self._examples.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
@@ -0,0 +1,103 @@
+import json
+import time
+import logging
+import threading
+
+from contextlib import contextmanager
+
+# The root logger is set to CRITICAL by configure_logging, this child logger passes its INFO records on to the app.log handler
+PROFILE_LOGGER = logging.getLogger("unofficial_jbeam_editor.profile")
+PROFILE_LOGGER.setLevel(logging.INFO)
+
+
+class ProfileSession:
+    """Time per stage and counters of one operation. Stages can be nested, a nested stage is also included in the time of its parent."""
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.stages: dict[str, list] = {}  # stage -> [seconds, calls], in the order the stages first completed
+        self.counters: dict[str, int] = {}
+        self.duration = 0.0
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()  # stages also run in the worker threads of the source exporter
+
+    def add_time(self, stage: str, seconds: float):
+        with self._lock:
+            entry = self.stages.setdefault(stage, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += 1
+
+    def add_count(self, name: str, n: int = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def finish(self):
+        self.duration = time.perf_counter() - self._start
+
+    def to_dict(self) -> dict:
+        return {
+            "event": "profile",
+            "operation": self.operation,
+            "duration": round(self.duration, 6),
+            "stages": {stage: {"seconds": round(seconds, 6), "calls": calls} for stage, (seconds, calls) in self.stages.items()},
+            "counters": dict(self.counters),
+        }
+
+    def popup_message(self) -> str:
+        """Lines for create_generic_popup, which splits the message at '|'."""
+        lines = [f"{self.operation}: {self.duration:.3f}s,,TIME"]
+        for stage, (seconds, calls) in self.stages.items():
+            lines.append(f"{stage}: {seconds:.3f}s" + (f" ({calls} calls)" if calls > 1 else ""))
+        if self.counters:
+            lines.append("")
+            lines.extend(f"{name.replace('_', ' ')}: {count}" for name, count in self.counters.items())
+        lines.append("Check app.log for the JSON record of this breakdown.")
+        return "|".join(lines)
+
+
+class StageProfiler:
+    """Context manager timers and counters for the import and export pipeline.
+    Stages and counters are only recorded while a session is active, otherwise they cost one attribute lookup."""
+
+    _session: ProfileSession | None = None
+
+    @staticmethod
+    @contextmanager
+    def session(operation: str, on_finish=None):
+        """Record an operation. A session started inside another one, like the .jbeam import run by the .pc import,
+        records into the outer session and on_finish is only called for the outer one."""
+        if StageProfiler._session is not None:
+            yield StageProfiler._session
+            return
+        session = StageProfiler._session = ProfileSession(operation)
+        try:
+            yield session
+        finally:
+            StageProfiler._session = None
+            session.finish()
+            PROFILE_LOGGER.info(json.dumps(session.to_dict()))
+            if on_finish:
+                on_finish(session)
+
+    @staticmethod
+    @contextmanager
+    def stage(name: str):
+        session = StageProfiler._session
+        if session is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            session.add_time(name, time.perf_counter() - start)
+
+    @staticmethod
+    def count(name: str, n: int = 1):
+        session = StageProfiler._session
+        if session is not None:
+            session.add_count(name, n)
+
+    @staticmethod
+    def active() -> ProfileSession | None:
+        return StageProfiler._session
@@ -2,6 +2,7 @@ import bpy
 
 from typing import List
 from unofficial_jbeam_editor.utils.utils import Utils
+from unofficial_jbeam_editor.ui.addon_preferences import MyAddonPreferences as a
 
 class OperatorGenericPopup(bpy.types.Operator):
     bl_idname = "wm.dev_tools_generic_popup"
@@ -46,6 +47,12 @@ def unregister() -> None:
 def create_generic_popup(message: str) -> None:
     bpy.ops.wm.dev_tools_generic_popup('INVOKE_DEFAULT', message=message) # type: ignore
 
+def create_profile_popup(session) -> None:
+    """on_finish callback for StageProfiler.session that shows the breakdown of the finished operation."""
+    if bpy.app.background or not a.is_profile_popup_enabled():
+        return
+    create_generic_popup(message=session.popup_message())
+
 # Sample Usage:
 class WEB_OT_SampleExecuteOperator(OperatorGenericPopup):
     bl_idname = "blender_web_pro.install_something"
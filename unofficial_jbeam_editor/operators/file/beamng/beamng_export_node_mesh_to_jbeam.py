@@ -2,45 +2,35 @@ import bpy
 import os
 import io
 import json
+import time
 import logging
 
 from pprint import pprint
 
+from unofficial_jbeam_editor.ui.addon_preferences import MyAddonPreferences as a
 from unofficial_jbeam_editor.utils.utils import Utils
+from unofficial_jbeam_editor.core.stage_profiler import StageProfiler
+from unofficial_jbeam_editor.operators.common.operator_generic_popup import create_profile_popup
+from unofficial_jbeam_editor.utils.file_utils import FileUtils
 from unofficial_jbeam_editor.utils.object_utils import ObjectUtils as o
-from unofficial_jbeam_editor.utils.json_cleanup import json_cleanup
+from unofficial_jbeam_editor.core.json_cleanup import json_cleanup
 from unofficial_jbeam_editor.utils.jbeam.jbeam_helper import PreJbeamStructureHelper, RedundancyReducerJbeamGenerator
 from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamUtils as j, JbeamRefnodeUtils as jr
-from unofficial_jbeam_editor.utils.jbeam.jbeam_export_processor import JbeamExportProcessor
+from unofficial_jbeam_editor.core.jbeam_export_processor import JbeamExportProcessor
+from unofficial_jbeam_editor.core.jbeam_emitter import JbeamEmitter
+from unofficial_jbeam_editor.utils.jbeam.jbeam_mesh_validator import JbeamMeshValidator
+from unofficial_jbeam_editor.utils.jbeam.jbeam_source_exporter import JbeamSourceExporter
+from unofficial_jbeam_editor.operators.file.beamng.beamng_file_operator_stubs import DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeamStub
 
 
-class DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeam(bpy.types.Operator):
-    bl_idname = "export.dev_tools_beamng_export_node_mesh_to_jbeam"
-    bl_label = "DevTools: Export Mesh to JBeam Format"
-    bl_description = "Export a Node Mesh to the JBeam format. In Edit Mode, the operator checks the JBeam path of the active element and exports all related elements with the same JBeam path. In Object Mode, all elements are exported to a single JBeam file."
-    bl_options = {'REGISTER'}
+class DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeam(DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeamStub):
 
-    filepath: bpy.props.StringProperty(subtype="FILE_PATH") # type: ignore
-
-    def check_unique_node_names(self, obj: bpy.types.Object) -> tuple[bool, str]:
-        """Checks if all nodes have a unique name."""
-        node_names = set()
-
-        for index in range(len(obj.data.vertices)):
-            node_name = j.get_node_id(obj, index).strip()
-
-            if not node_name:
-                return False, f"Node at index {index} has an empty name."
-
-            if node_name in node_names:
-                return False, f"Duplicate node name detected: '{node_name}' at index {index}."
-
-            node_names.add(node_name)
-
-        return True, "All nodes have unique names."
+    export_all_elements = True  # set by invoke, the defaults apply when the operator is run with EXEC_DEFAULT
+    jbeam_path = ""
 
     def execute(self, context):
-        success = self.export_jbeam_format(self.filepath)
+        with StageProfiler.session(f"Export {os.path.basename(self.filepath)}", on_finish=create_profile_popup):
+            success = self.export_jbeam_format(self.filepath)
         return {'FINISHED'} if success else {'CANCELLED'} 
 
     def invoke(self, context, event):
@@ -73,27 +63,16 @@ class DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeam(bpy.types.Opera
             restore_mode()
             return {'CANCELLED'}
 
-        if o.has_ngons(obj):
-            Utils.log_and_report("Jbeam does not support quads and N-gons. Triangulate these faces with Ctrl+T", self, 'ERROR')
-            restore_mode()
-            return {'CANCELLED'}
-
-        refnodes = jr.get_refnode_values()
-        for refnode in refnodes:
-            items = jr.find_nodes_with_refnode_id(obj, refnode)
-            if len(items) > 1:
-                enum = jr.get_refnode_name(refnode)
-                Utils.log_and_report(f"Multiple nodes assigned with {enum}. Only 1 Node can be labeled as {enum}", self, 'WARNING')
-                return {'CANCELLED'}
-
-        # Check unique node names
-        is_valid, message = self.check_unique_node_names(obj)
-        if not is_valid:
+        report = JbeamMeshValidator.validate(obj)
+        for message in report.warnings:
             Utils.log_and_report(message, self, 'WARNING')
+        if not report.is_valid:
+            for message in report.errors:
+                Utils.log_and_report(message, self, 'ERROR')
             restore_mode()
             return {'CANCELLED'}
 
-        Utils.log_and_report(message, self, 'INFO')
+        Utils.log_and_report("Export preflight passed.", self, 'INFO')
 
         self.filepath = self.jbeam_path if self.jbeam_path else bpy.data.filepath
         context.window_manager.fileselect_add(self)
@@ -106,8 +85,10 @@ class DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeam(bpy.types.Opera
 
         jbeam = PreJbeamStructureHelper(obj, domain="vertex", export_all_elements=self.export_all_elements, jbeam_path=self.jbeam_path)
         data = jbeam.structure_data()
-        reducer = RedundancyReducerJbeamGenerator(obj, data, domain="vertex")
+        reducer = RedundancyReducerJbeamGenerator(obj, data, domain="vertex", optimize_order=a.is_export_optimize_order_enabled(), position_precision=a.get_export_position_precision())
         data_actual = reducer.reduce_redundancy()
+        self.modifier_rows[0] += reducer.rows_before
+        self.modifier_rows[1] += reducer.rows_after
 
         node_data = [] #[["id", "posX", "posY", "posZ"]]
         for item in data_actual:
@@ -118,8 +99,10 @@ class DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeam(bpy.types.Opera
 
         jbeam = PreJbeamStructureHelper(obj, domain="edge", export_all_elements=self.export_all_elements, jbeam_path=self.jbeam_path)
         data = jbeam.structure_data()
-        reducer = RedundancyReducerJbeamGenerator(obj, data, domain="edge")
+        reducer = RedundancyReducerJbeamGenerator(obj, data, domain="edge", optimize_order=a.is_export_optimize_order_enabled())
         data_actual = reducer.reduce_redundancy()
+        self.modifier_rows[0] += reducer.rows_before
+        self.modifier_rows[1] += reducer.rows_after
 
         beam_data = [] #[["id1:", "id2:"]]
         for item in data_actual:
@@ -130,8 +113,10 @@ class DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeam(bpy.types.Opera
 
         jbeam = PreJbeamStructureHelper(obj, domain="face", export_all_elements=self.export_all_elements, jbeam_path=self.jbeam_path)
         data = jbeam.structure_data()
-        reducer = RedundancyReducerJbeamGenerator(obj, data, domain="face")
+        reducer = RedundancyReducerJbeamGenerator(obj, data, domain="face", optimize_order=a.is_export_optimize_order_enabled())
         data_actual = reducer.reduce_redundancy()
+        self.modifier_rows[0] += reducer.rows_before
+        self.modifier_rows[1] += reducer.rows_after
 
         beam_data = [] #[["id1:", "id2:", "id3:"]]
         for item in data_actual:
@@ -147,6 +132,9 @@ class DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeam(bpy.types.Opera
         mesh = obj.data
         mesh.calc_loop_triangles()
 
+        start = time.perf_counter()
+        io_time = 0.0
+        self.modifier_rows = [0, 0]  # before and after ordering, summed over nodes, beams and triangles
         nodes = self.generate_jbeam_node_list(obj)
         beams = self.generate_jbeam_beam_list(obj)
         triangles = self.generate_jbeam_triangle_list(obj)
@@ -154,29 +142,13 @@ class DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeam(bpy.types.Opera
         ngons = self.get_ngons(obj)
         ref_nodes = self.find_reference_nodes(obj)
 
-        ref_nodes_keys = jr.get_refnode_labels_list()
-        ref_nodes_data = [
-            [f"{key}:" for key in ref_nodes_keys],
-            [ref_nodes.get(key, "") or "" for key in ref_nodes_keys]
-        ]
-
-        def format_list(data, prepend="", newfile=True):
-            spaces = 12 if newfile else 4
-            indent = " " * spaces
-            prepend = (indent if newfile else '') + prepend + '\n' if prepend else ""   
-            formatted_data = ',\n'.join(
-                indent + str(item)
-                .replace("'true'", "true")
-                .replace("'false'", "false")
-                .replace("'", '"')
-                for item in data
-            )
-            return prepend + formatted_data + '\n' + ' ' * (spaces - 4)
+        ref_nodes_data = JbeamSourceExporter.ref_nodes_rows(ref_nodes)
 
         overwrite_file = os.path.exists(filepath)
         is_manual_data = not overwrite_file
 
         if overwrite_file:
+            read_start = time.perf_counter()
             with open(filepath, "r", encoding="utf-8") as f:
                 try:
                     # raw_text = f.read()
@@ -194,80 +166,86 @@ class DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeam(bpy.types.Opera
                     Utils.log_and_report(f"Error parsing {filepath}", self, 'ERROR')
                     logging.debug(f"Error parsing {filepath}:, maybe check for missing commas or other json-type formatting in jbeam")
                     return False
+            io_time += time.perf_counter() - read_start
 
+        changed_sections = None  # all sections are written to a manual data file
         if is_manual_data:
             # Generate manual data .json file
             t1 = " " * 4
             t2 = " " * 8
-            json_output = "{\n"
-            json_output += f'{t1}"manual_data_file": {{"note":"you need to manually copy these nodes to the .jbeam file"}},\n'
-            json_output += f'{t1}"partname": {{\n'
-            json_output += t2 + '"refNodes": ' + '[\n' + format_list(ref_nodes_data) + '],\n'
-            json_output += t2 + '"nodes": ' + '[\n' + format_list(nodes, '["id", "posX", "posY", "posZ"],') + '],\n'
-            json_output += t2 + '"beams": ' + '[\n' + format_list(beams, '["id1:", "id2:"],') + '],\n'
-            json_output += t2 + '"triangles": ' + '[\n' + format_list(triangles, '["id1:","id2:","id3:"],') + '],\n'
-            json_output += t2 + '"quads": ' + '[\n' + format_list(quads, '["id1:","id2:","id3:","id4:"],') + '],\n'
-            json_output += t2 + '"ngons": ' + '[\n' + format_list(ngons, '["ngons:"]') + '],\n'
-            json_output += t1 + "}\n"
-            json_output += "}"
-
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(json_output)
+            write_start = time.perf_counter()
+            with StageProfiler.stage("export.write"), FileUtils.atomic_write(filepath) as f:
+                emitter = JbeamEmitter(f)
+                emitter.write("{\n")
+                emitter.write(f'{t1}"manual_data_file": {{"note":"you need to manually copy these nodes to the .jbeam file"}},\n')
+                emitter.write(f'{t1}"partname": {{\n')
+                for key, data, prepend in (
+                    ("refNodes", ref_nodes_data, ""),
+                    ("nodes", nodes, '["id", "posX", "posY", "posZ"],'),
+                    ("beams", beams, '["id1:", "id2:"],'),
+                    ("triangles", triangles, '["id1:","id2:","id3:"],'),
+                    ("quads", quads, '["id1:","id2:","id3:","id4:"],'),
+                    ("ngons", ngons, '["ngons:"]'),
+                ):
+                    emitter.write(f'{t2}"{key}": [\n')
+                    emitter.write_list(data, prepend, bare_literals=key != "refNodes")
+                    emitter.write("],\n")
+                emitter.write(t1 + "}\n")
+                emitter.write("}")
+            io_time += time.perf_counter() - write_start  # includes formatting, which is streamed to the file
         else:
             logging.debug(f"Replace nodes, beams, triangles, refNodes, etc in {filepath}")
-            refnodes_str = ',\n    '.join(str(item).replace("'", '"') for item in ref_nodes_data)
-            nodes_str = format_list(nodes, '["id", "posX", "posY", "posZ"],', False)
-            beams_str = format_list(beams, '["id1:","id2:"],', False)
-            tris_str = format_list(triangles, '["id1:","id2:","id3:"],', False)
-
-            processor = JbeamExportProcessor(existing_data_str)
-
-            # Modify "nodes", then "beams", and "triangles" successively:
-            existing_data_str = processor.insert_node_contents("refNodes", refnodes_str)
-            existing_data_str = processor.insert_node_contents("nodes", nodes_str)
-            existing_data_str = processor.insert_node_contents("beams", beams_str)
-            existing_data_str = processor.insert_node_contents("triangles", tris_str)
-
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(existing_data_str)
-
-        Utils.log_and_report(f"{obj.name}: JBeam exported to {filepath}", self, 'INFO')
+            with StageProfiler.stage("export.splice_file"):
+                processor = JbeamExportProcessor(existing_data_str)
+                sections = JbeamSourceExporter.format_sections(ref_nodes_data, nodes, beams, triangles)
+                existing_data_str = processor.replace_sections(sections, self.get_part_name(obj, filepath))
+            changed_sections = processor.changed_sections
+
+            if changed_sections:
+                write_start = time.perf_counter()
+                with StageProfiler.stage("export.write"), FileUtils.atomic_write(filepath) as f:
+                    f.write(existing_data_str)
+                io_time += time.perf_counter() - write_start
+
+        total_time = time.perf_counter() - start
+        logging.debug(f"🧮 Scope modifier rows: {self.modifier_rows[0]} -> {self.modifier_rows[1]}")
+        logging.debug(f"⏱️  Generated in {total_time - io_time:.3f}s, file I/O {io_time:.3f}s")
+        if changed_sections is None:
+            Utils.log_and_report(f"{obj.name}: JBeam exported to {filepath}", self, 'INFO')
+        elif changed_sections:
+            Utils.log_and_report(f"{obj.name}: JBeam exported to {filepath} (changed: {', '.join(changed_sections)})", self, 'INFO')
+        else:
+            Utils.log_and_report(f"{obj.name}: {filepath} is up to date, nothing written", self, 'INFO')
 
         return True
 
+    def get_part_name(self, obj, filepath):
+        """Part name of an imported node mesh, which is named '<file name>.<part name>' on import."""
+        prefix = os.path.splitext(os.path.basename(filepath))[0] + "."
+        return obj.name[len(prefix):] if obj.name.startswith(prefix) else None
+
     def get_quads(self, o):
         quads = []
+        node_ids = j.get_attribute_values(o, j.ATTR_NODE_ID)
         for poly in o.data.polygons:
             if len(poly.vertices) == 4:
-                v1, v2, v3, v4 = poly.vertices
-                quads.append([j.get_node_id(o,v1), j.get_node_id(o,v2), j.get_node_id(o,v3), j.get_node_id(o,v4)])
+                quads.append([node_ids[v] for v in poly.vertices])
         return quads
 
     def get_ngons(self, o):
         ngons = []
+        node_ids = j.get_attribute_values(o, j.ATTR_NODE_ID)
         for poly in o.data.polygons:
             if len(poly.vertices) > 4:
-                ngons.append([j.get_node_id(o,v) for v in poly.vertices])
+                ngons.append([node_ids[v] for v in poly.vertices])
         return ngons
 
     def find_reference_nodes(self, o):
         ref_nodes = jr.get_ref_nodes()  # {"ref": None, "back": None, "left": None, "up": None, "leftCorner": None, "rightCorner": None}
+        refnode_groups = jr.group_nodes_by_refnode_id(o)
         for label in ref_nodes.keys():
             refnode_enum = jr.get_refnode_from_label(label)
-            indices = jr.find_nodes_with_refnode_id(o, refnode_enum.value)
+            indices = refnode_groups.get(refnode_enum.value, [])
             if indices:
                 ref_nodes[label] = j.get_node_id(o, indices[0])
         return ref_nodes
-
-    @classmethod
-    def poll(cls, context: bpy.types.Context) -> bool:
-        obj: bpy.types.Object = context.active_object
-
-        if not obj or not j.is_node_mesh(obj) or len(context.selected_objects) > 1:
-            return False
-
-        # Check if required vertex groups exist
-        #required_groups = {"up", "left", "back", "leftCorner", "rightCorner"}
-        #existing_groups = {vg.name for vg in active_object.vertex_groups}
-        
-        return True #required_groups.issubset(existing_groups)
@@ -0,0 +1,63 @@
+import bpy
+import time
+import logging
+
+from unofficial_jbeam_editor.ui.addon_preferences import MyAddonPreferences as a
+from unofficial_jbeam_editor.utils.utils import Utils
+from unofficial_jbeam_editor.core.stage_profiler import StageProfiler
+from unofficial_jbeam_editor.operators.common.operator_generic_popup import create_profile_popup
+from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamUtils as j
+from unofficial_jbeam_editor.utils.jbeam.jbeam_mesh_validator import JbeamMeshValidator
+from unofficial_jbeam_editor.utils.jbeam.jbeam_source_exporter import JbeamSourceExporter
+from unofficial_jbeam_editor.operators.file.beamng.beamng_file_operator_stubs import DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeamSourcesStub
+
+
+class DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeamSources(DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeamSourcesStub):
+
+    def execute(self, context):
+        with StageProfiler.session(f"Export {context.active_object.name} to JBeam sources", on_finish=create_profile_popup):
+            return self.export_sources(context)
+
+    def export_sources(self, context):
+        obj = context.active_object
+        mode = obj.mode
+        if mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+        try:
+            report = JbeamMeshValidator.validate(obj)
+            for message in report.warnings:
+                Utils.log_and_report(message, self, 'WARNING')
+            if not report.is_valid:
+                for message in report.errors:
+                    Utils.log_and_report(message, self, 'ERROR')
+                return {'CANCELLED'}
+
+            start = time.perf_counter()
+            exporter = JbeamSourceExporter(obj, optimize_order=a.is_export_optimize_order_enabled(), position_precision=a.get_export_position_precision())
+            exports = exporter.collect()
+            collected = time.perf_counter()
+            results = exporter.write(exports)
+            written = time.perf_counter()
+        finally:
+            bpy.ops.object.mode_set(mode=mode)
+
+        if not results:
+            Utils.log_and_report(f"{obj.name}: No elements with a JBeam source path", self, 'WARNING')
+            return {'CANCELLED'}
+
+        failed = [result for result in results if result.error]
+        changed = [result for result in results if not result.error and result.changed_sections]
+        for result in failed:
+            Utils.log_and_report(f"Skipped 📄 {result.jbeam_path}: {result.error}", self, 'WARNING')
+        for result in results:
+            if result.error:
+                continue
+            changes = ', '.join(result.changed_sections) if result.changed_sections else "up to date"
+            logging.debug(f"📄 {result.jbeam_path}: part '{result.part_name}' ({changes}), format {result.format_time:.3f}s, I/O {result.io_time:.3f}s")
+        logging.debug(f"🧮 Scope modifier rows: {exporter.modifier_rows[0]} -> {exporter.modifier_rows[1]}")
+        logging.debug(f"⏱️  Collected in {collected - start:.3f}s, written in {written - collected:.3f}s "
+                      f"(format {sum(r.format_time for r in results):.3f}s, I/O {sum(r.io_time for r in results):.3f}s over all workers)")
+        unchanged = len(results) - len(failed) - len(changed)
+        Utils.log_and_report(f"{obj.name}: JBeam exported to {len(changed)} source file(s), {unchanged} up to date, {len(failed)} skipped", self, 'INFO' if not failed else 'WARNING')
+        return {'FINISHED'}
+
@@ -0,0 +1,77 @@
+import bpy
+
+from bpy.types import Operator
+from bpy.props import StringProperty
+from bpy_extras.io_utils import ImportHelper
+
+from unofficial_jbeam_editor.utils.lazy_operator import LazyOperator
+from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamUtils as j
+
+# Registered in place of the jbeam import and export operators, whose modules import the loader, parser, mesh creator and exporter.
+# Each operator subclasses its stub and is imported on first use, see LazyOperator.
+
+class DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportJbeamToNodeMeshStub(LazyOperator, Operator, ImportHelper):
+    """Import a .jbeam file"""
+    bl_idname = "devtools_jbeam_editor.beamng_import_jbeam_file_to_node_mesh"
+    bl_label = "DevTools: Import Jbeam File"
+    operator_path = "unofficial_jbeam_editor.operators.file.beamng.beamng_import_jbeam_as_node_mesh:DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportJbeamToNodeMesh"
+
+    filename_ext = ".jbeam"
+    filter_glob: StringProperty(
+        default="*.jbeam",
+        options={'HIDDEN'},
+        maxlen=255,
+    )  # type: ignore
+
+    force_reload: bpy.props.BoolProperty(name="Force Reload", default=True)  # type: ignore
+
+
+class DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportPcFileToNodeMeshesStub(LazyOperator, Operator, ImportHelper):
+    """Import a .pc file"""
+    bl_idname = "devtools_jbeam_editor.beamng_import_pc_file_to_node_meshes"
+    bl_label = "DevTools: Import PC File"
+    operator_path = "unofficial_jbeam_editor.operators.file.beamng.beamng_import_pc_file_as_node_meshes:DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportPcFileToNodeMeshes"
+
+    filename_ext = ".pc"
+    filter_glob: StringProperty(
+        default="*.pc",
+        options={'HIDDEN'},
+        maxlen=255,
+    )  # type: ignore
+
+    force_reload: bpy.props.BoolProperty(name="Force Reload", description="Force reloading of all selected files, bypassing the cache", default=True)  # type: ignore
+    use_single_object: bpy.props.BoolProperty(name="Join Parts into One Object", description="Combine all parts into one object rather than keeping them separate", default=True)  # type: ignore
+
+    def draw(self, context: bpy.types.Context) -> None:
+        self.operator_class().draw(self, context)
+
+
+class DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeamStub(LazyOperator, Operator):
+    bl_idname = "export.dev_tools_beamng_export_node_mesh_to_jbeam"
+    bl_label = "DevTools: Export Mesh to JBeam Format"
+    bl_description = "Export a Node Mesh to the JBeam format. In Edit Mode, the operator checks the JBeam path of the active element and exports all related elements with the same JBeam path. In Object Mode, all elements are exported to a single JBeam file."
+    bl_options = {'REGISTER'}
+    operator_path = "unofficial_jbeam_editor.operators.file.beamng.beamng_export_node_mesh_to_jbeam:DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeam"
+
+    filepath: bpy.props.StringProperty(subtype="FILE_PATH") # type: ignore
+
+    def invoke(self, context, event):
+        return self.operator_class().invoke(self, context, event)
+
+    @classmethod
+    def poll(cls, context: bpy.types.Context) -> bool:
+        obj: bpy.types.Object = context.active_object
+        return bool(obj and j.is_node_mesh(obj) and len(context.selected_objects) <= 1)
+
+
+class DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeamSourcesStub(LazyOperator, Operator):
+    bl_idname = "export.dev_tools_beamng_export_node_mesh_to_jbeam_sources"
+    bl_label = "DevTools: Export Mesh to all JBeam Sources"
+    bl_description = "Export every element of a Node Mesh back to the .jbeam file it was imported from. Each file is written once and only the part that holds its nodes is replaced"
+    bl_options = {'REGISTER'}
+    operator_path = "unofficial_jbeam_editor.operators.file.beamng.beamng_export_node_mesh_to_jbeam_sources:DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeamSources"
+
+    @classmethod
+    def poll(cls, context: bpy.types.Context) -> bool:
+        obj: bpy.types.Object = context.active_object
+        return bool(obj and j.is_node_mesh(obj) and len(context.selected_objects) <= 1)
@@ -2,33 +2,25 @@ import bpy
 import os
 import logging
 
-from bpy.types import Operator
-from bpy.props import StringProperty
-from bpy_extras.io_utils import ImportHelper
-
 from unofficial_jbeam_editor.ui.addon_preferences import MyAddonPreferences as a
 from unofficial_jbeam_editor.utils.utils import Utils
+from unofficial_jbeam_editor.operators.file.beamng.beamng_file_operator_stubs import DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportJbeamToNodeMeshStub
+from unofficial_jbeam_editor.core.stage_profiler import StageProfiler
+from unofficial_jbeam_editor.operators.common.operator_generic_popup import create_profile_popup
 from unofficial_jbeam_editor.utils.jbeam.jbeam_loader import JbeamFileLoader
-from unofficial_jbeam_editor.utils.jbeam.jbeam_parser import JbeamParser
-from unofficial_jbeam_editor.utils.jbeam.jbeam_models import JbeamLoadItem, JbeamJson, JbeamPart, JbeamPartID
+from unofficial_jbeam_editor.core.jbeam_parser import JbeamParser
+from unofficial_jbeam_editor.core.jbeam_models import JbeamLoadItem, JbeamJson, JbeamPart, JbeamPartID
 from unofficial_jbeam_editor.utils.jbeam.jbeam_node_mesh_creator import JbeamNodeMeshCreator
 from unofficial_jbeam_editor.utils.jbeam.jbeam_node_mesh_configurator import JbeamNodeMeshConfigurator
 
-class DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportJbeamToNodeMesh(Operator, ImportHelper):
+class DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportJbeamToNodeMesh(DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportJbeamToNodeMeshStub):
     """Import a .jbeam file"""
-    bl_idname = "devtools_jbeam_editor.beamng_import_jbeam_file_to_node_mesh"
-    bl_label = "DevTools: Import Jbeam File"
-
-    filename_ext = ".jbeam"
-    filter_glob: StringProperty(
-        default="*.jbeam",
-        options={'HIDDEN'},
-        maxlen=255,
-    )  # type: ignore
-
-    force_reload: bpy.props.BoolProperty(name="Force Reload", default=True)  # type: ignore
 
     def execute(self, context):
+        with StageProfiler.session(f"Import {os.path.basename(self.filepath)}", on_finish=create_profile_popup):
+            return self.import_jbeam_file()
+
+    def import_jbeam_file(self):
         bpy.ops.object.select_all(action='DESELECT')
         self.filename = os.path.basename(self.filepath)
         load_item = JbeamLoadItem(self.filepath)
@@ -2,33 +2,24 @@ import bpy
 import os
 import logging
 
-from bpy.types import Operator
-from bpy.props import StringProperty
-from bpy_extras.io_utils import ImportHelper
-
 from unofficial_jbeam_editor.ui.addon_preferences import MyAddonPreferences as a
 from unofficial_jbeam_editor.utils.utils import Utils
+from unofficial_jbeam_editor.operators.file.beamng.beamng_file_operator_stubs import DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportPcFileToNodeMeshesStub
+from unofficial_jbeam_editor.core.stage_profiler import StageProfiler
+from unofficial_jbeam_editor.operators.common.operator_generic_popup import create_profile_popup
 from unofficial_jbeam_editor.utils.jbeam.jbeam_parts_loader import JbeamPartsLoader
 from unofficial_jbeam_editor.utils.jbeam.jbeam_pc_file_loader import JbeamPcFileLoader
-from unofficial_jbeam_editor.utils.jbeam.jbeam_pc_parser import JbeamPcParser
-
+from unofficial_jbeam_editor.core.jbeam_pc_parser import JbeamPcParser
 
-class DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportPcFileToNodeMeshes(Operator, ImportHelper):
-    """Import a .jbeam file"""
-    bl_idname = "devtools_jbeam_editor.beamng_import_pc_file_to_node_meshes"
-    bl_label = "DevTools: Import PC File"
 
-    filename_ext = ".pc"
-    filter_glob: StringProperty(
-        default="*.pc",
-        options={'HIDDEN'},
-        maxlen=255,
-    )  # type: ignore
-
-    force_reload: bpy.props.BoolProperty(name="Force Reload", description="Force reloading of all selected files, bypassing the cache", default=True)  # type: ignore
-    use_single_object: bpy.props.BoolProperty(name="Join Parts into One Object", description="Combine all parts into one object rather than keeping them separate", default=True)  # type: ignore
+class DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportPcFileToNodeMeshes(DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportPcFileToNodeMeshesStub):
+    """Import a .pc file"""
 
     def execute(self, context):
+        with StageProfiler.session(f"Import {os.path.basename(self.filepath)}", on_finish=create_profile_popup):
+            return self.import_pc_file()
+
+    def import_pc_file(self):
         bpy.ops.object.select_all(action='DESELECT')
 
         loader = JbeamPcFileLoader(self.filepath, self)
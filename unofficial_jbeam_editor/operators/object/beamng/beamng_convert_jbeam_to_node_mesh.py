@@ -8,7 +8,7 @@ from unofficial_jbeam_editor.utils.utils import Utils
 from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamUtils as j
 from unofficial_jbeam_editor.utils.jbeam.jbeam_node_mesh_configurator import JbeamNodeMeshConfigurator
 from unofficial_jbeam_editor.utils.jbeam.jbeam_props_storage import JbeamPropsStorageManager
-from unofficial_jbeam_editor.utils.jbeam.jbeam_parser import JbeamParser
+from unofficial_jbeam_editor.core.jbeam_parser import JbeamParser
 
 # deprecated operator, used to convert a jbeam object mesh generated by BeamNG's Jbeam Editor into this addon's Node Mesh
 class OBJECT_OT_BeamngConvertJbeamToNodeMesh(Operator):
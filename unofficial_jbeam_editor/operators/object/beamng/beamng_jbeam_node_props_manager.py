@@ -3,7 +3,8 @@ import bmesh
 import json
 import logging
 
-from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamUtils as j, JbeamRefnodeUtils as jr
+from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamUtils as j, JbeamRefnodeUtils as jr, JbeamPropsStorage, JbeamPropsStorageManager
+from unofficial_jbeam_editor.utils.object_utils import ObjectUtils as o
 from unofficial_jbeam_editor.utils.utils import Utils
 
 def update_element_index(self, context):
@@ -217,6 +218,8 @@ class OBJECT_OT_BeamngSaveJbeamProp(bpy.types.Operator):
     prop_type = ""
     prop_name: bpy.props.StringProperty()  # type: ignore
 
+    SELECTED_COUNT = {"verts": "total_vert_sel", "edges": "total_edge_sel", "faces": "total_face_sel"}  # read from the edit BMesh counters
+
     def execute(self, context):
         obj = context.object
         if not obj or obj.type != 'MESH':
@@ -224,17 +227,15 @@ class OBJECT_OT_BeamngSaveJbeamProp(bpy.types.Operator):
             return {'CANCELLED'}
 
         bm = bmesh.from_edit_mesh(obj.data)
-        domain, attr_name, get_props, set_props = self.get_domain_data()
+        domain, attr_name = self.get_domain_data()
         if not domain:
             Utils.log_and_report(f"Unknown property type: {self.prop_type}", self, 'ERROR')
             return {'CANCELLED'}
 
-        layers = getattr(bm, domain).layers
-        layer = layers.string.get(attr_name)
-        elements = [elem for elem in getattr(bm, domain) if elem.select]
+        layer = getattr(bm, domain).layers.string.get(attr_name)
         prop_collection = context.scene.beamng_jbeam_active_structure.prop_items
 
-        if not elements:
+        if not getattr(obj.data, self.SELECTED_COUNT[domain]):
             Utils.log_and_report("No selected elements", self, 'WARNING')
             return {'CANCELLED'}
         if not layer:
@@ -255,11 +256,7 @@ class OBJECT_OT_BeamngSaveJbeamProp(bpy.types.Operator):
 
         # Apply property to selected elements
         instances = context.scene.beamng_jbeam_instance.get_selected_instances()
-        for element in elements:
-            for instance in instances:
-                props = get_props(obj, element.index, instance)
-                props[self.prop_name] = prop_to_save.value
-                set_props(obj, element.index, props, instance)
+        j.patch_props_of_selected_elements(obj, domain, {self.prop_name: prop_to_save.value}, instances=instances, bm=bm)
 
         bmesh.update_edit_mesh(obj.data)
         Utils.log_and_report(f"Saved property: {self.prop_name}", self, 'INFO')
@@ -268,7 +265,7 @@ class OBJECT_OT_BeamngSaveJbeamProp(bpy.types.Operator):
     @staticmethod
     def get_domain_data():
         """To be overridden in subclasses for domain-specific data."""
-        return None, None, None, None
+        return None, None
 
 
 class OBJECT_OT_BeamngSaveJbeamNodeProp(OBJECT_OT_BeamngSaveJbeamProp):
@@ -277,9 +274,7 @@ class OBJECT_OT_BeamngSaveJbeamNodeProp(OBJECT_OT_BeamngSaveJbeamProp):
     bl_label = "DevTools: BeamNG Save JBeam Node Property"
     prop_type = 'NODE'
 
-    get_domain_data = staticmethod(lambda: (
-        'verts', j.ATTR_NODE_PROPS, j.get_node_props, j.set_node_props
-    ))
+    get_domain_data = staticmethod(lambda: ('verts', j.ATTR_NODE_PROPS))
 
 
 class OBJECT_OT_BeamngSaveJbeamBeamProp(OBJECT_OT_BeamngSaveJbeamProp):
@@ -288,9 +283,7 @@ class OBJECT_OT_BeamngSaveJbeamBeamProp(OBJECT_OT_BeamngSaveJbeamProp):
     bl_label = "DevTools: BeamNG Save JBeam Beam Property"
     prop_type = 'BEAM'
 
-    get_domain_data = staticmethod(lambda: (
-        'edges', j.ATTR_BEAM_PROPS, j.get_beam_props, j.set_beam_props
-    ))
+    get_domain_data = staticmethod(lambda: ('edges', j.ATTR_BEAM_PROPS))
 
 
 class OBJECT_OT_BeamngSaveJbeamTriangleProp(OBJECT_OT_BeamngSaveJbeamProp):
@@ -299,9 +292,7 @@ class OBJECT_OT_BeamngSaveJbeamTriangleProp(OBJECT_OT_BeamngSaveJbeamProp):
     bl_label = "DevTools: BeamNG Save JBeam Triangle Property"
     prop_type = 'TRIANGLE'
 
-    get_domain_data = staticmethod(lambda: (
-        'faces', j.ATTR_TRIANGLE_PROPS, j.get_triangle_props, j.set_triangle_props
-    ))
+    get_domain_data = staticmethod(lambda: ('faces', j.ATTR_TRIANGLE_PROPS))
 
 
 class OBJECT_OT_BeamngSaveAllJbeamProps(bpy.types.Operator):
@@ -349,13 +340,8 @@ class OBJECT_OT_BeamngSaveAllJbeamProps(bpy.types.Operator):
                 return f"Keyword '{reserved}' is reserved.", 'CANCELLED'
 
         instances = context.scene.beamng_jbeam_instance.get_selected_instances()
-        for element in selected_elements:
-            for instance in instances:
-                props = self.get_props(obj, element.index, instance)
-                props = {k: v for k, v in props.items() if k in ui_props}  # Remove missing properties
-                for prop_name, prop_value in ui_props.items():
-                    props[prop_name] = prop_value
-                self.set_props(obj, element.index, props, instance)
+        # Remove properties missing in the UI and save all others
+        j.patch_props_of_selected_elements(obj, self.domain, ui_props, instances=instances, drop_others=True, bm=bm)
 
         bmesh.update_edit_mesh(obj.data)
         return f"Saved all {self.prop_type} properties", 'FINISHED'
@@ -376,14 +362,6 @@ class OBJECT_OT_BeamngSaveAllJbeamNodeProps(OBJECT_OT_BeamngSaveAllJbeamProps):
     def get_layer_attr(cls):
         return j.ATTR_NODE_PROPS
 
-    @staticmethod
-    def get_props(obj, index, instance):
-        return j.get_node_props(obj, index, instance)
-
-    @staticmethod
-    def set_props(obj, index, props, instance):
-        j.set_node_props(obj, index, props, instance)
-
 
 class OBJECT_OT_BeamngSaveAllJbeamBeamProps(OBJECT_OT_BeamngSaveAllJbeamProps):
     """Save all JBeam beam properties for selected edges"""
@@ -396,14 +374,6 @@ class OBJECT_OT_BeamngSaveAllJbeamBeamProps(OBJECT_OT_BeamngSaveAllJbeamProps):
     def get_layer_attr(cls):
         return j.ATTR_BEAM_PROPS
 
-    @staticmethod
-    def get_props(obj, index, instance):
-        return j.get_beam_props(obj, index, instance)
-
-    @staticmethod
-    def set_props(obj, index, props, instance):
-        j.set_beam_props(obj, index, props, instance)
-
 
 class OBJECT_OT_BeamngSaveAllJbeamTriangleProps(OBJECT_OT_BeamngSaveAllJbeamProps):
     """Save all JBeam triangle properties for selected faces"""
@@ -416,14 +386,6 @@ class OBJECT_OT_BeamngSaveAllJbeamTriangleProps(OBJECT_OT_BeamngSaveAllJbeamProp
     def get_layer_attr(cls):
         return j.ATTR_TRIANGLE_PROPS
 
-    @staticmethod
-    def get_props(obj, index, instance):
-        return j.get_triangle_props(obj, index, instance)
-
-    @staticmethod
-    def set_props(obj, index, props, instance):
-        j.set_triangle_props(obj, index, props, instance)
-
 
 class OBJECT_OT_BeamngAddJbeamProp(bpy.types.Operator):
     """Base class for adding JBeam properties"""
@@ -462,8 +424,6 @@ class OBJECT_OT_BeamngRemoveJbeamProp(bpy.types.Operator):
 
     domain = ""  # verts (node), edges (beam), faces (triangle)
     attr_layer = ""
-    get_props = None
-    set_props = None
 
     prop_name: bpy.props.StringProperty()  # type: ignore
 
@@ -510,15 +470,7 @@ class OBJECT_OT_BeamngRemoveJbeamProp(bpy.types.Operator):
         if self.do_save:
             # Remove property from mesh (SAVE MODE)
             instances = context.scene.beamng_jbeam_instance.get_selected_instances()
-            for element in selected_elements:
-                if not element[layer]:  # Ensure there's data before proceeding
-                    continue
-                for instance in instances:
-                    props = self.get_props(obj, element.index, instance)
-                    if self.prop_name in props:
-                        del props[self.prop_name]  # Remove property
-                        self.set_props(obj, element.index, props, instance)  # Update stored properties
-                        removed_from_mesh = True
+            removed_from_mesh = j.patch_props_of_selected_elements(obj, self.domain, delete_props=(self.prop_name,), instances=instances, create=False, bm=bm) > 0
 
             bmesh.update_edit_mesh(obj.data)  # Commit changes to mesh
 
@@ -538,8 +490,6 @@ class OBJECT_OT_BeamngRemoveJbeamNodeProp(OBJECT_OT_BeamngRemoveJbeamProp):
     bl_label = "DevTools: BeamNG Remove JBeam Node Property"
     domain = "verts"
     attr_layer = j.ATTR_NODE_PROPS
-    get_props = staticmethod(j.get_node_props)
-    set_props = staticmethod(j.set_node_props)
 
 class OBJECT_OT_BeamngRemoveJbeamBeamProp(OBJECT_OT_BeamngRemoveJbeamProp):
     """Remove a JBeam beam property (Shift+Click to also save)"""
@@ -547,8 +497,6 @@ class OBJECT_OT_BeamngRemoveJbeamBeamProp(OBJECT_OT_BeamngRemoveJbeamProp):
     bl_label = "DevTools: BeamNG Remove JBeam Beam Property"
     domain = "edges"
     attr_layer = j.ATTR_BEAM_PROPS
-    get_props = staticmethod(j.get_beam_props)
-    set_props = staticmethod(j.set_beam_props)
 
 class OBJECT_OT_BeamngRemoveJbeamTriangleProp(OBJECT_OT_BeamngRemoveJbeamProp):
     """Remove a JBeam triangle property (Shift+Click to also save)"""
@@ -556,8 +504,6 @@ class OBJECT_OT_BeamngRemoveJbeamTriangleProp(OBJECT_OT_BeamngRemoveJbeamProp):
     bl_label = "DevTools: BeamNG Remove JBeam Triangle Property"
     domain = "faces"
     attr_layer = j.ATTR_TRIANGLE_PROPS
-    get_props = staticmethod(j.get_triangle_props)
-    set_props = staticmethod(j.set_triangle_props)
 
 
 class OBJECT_OT_BeamngSelectByPropertyBase(bpy.types.Operator):
@@ -566,6 +512,7 @@ class OBJECT_OT_BeamngSelectByPropertyBase(bpy.types.Operator):
 
     prop_name: bpy.props.StringProperty(name="Property Name")  # type: ignore
     element_type: str = ""  # override in subclass
+    domain: str = ""  # override in subclass
 
     @classmethod
     def description(cls, context, properties):
@@ -574,14 +521,6 @@ class OBJECT_OT_BeamngSelectByPropertyBase(bpy.types.Operator):
 - Ctrl+Shift+Click: Select if value *contains* the search string.
             """
 
-    def get_elements(self, bm):
-        """Return the elements to iterate over (verts for nodes, edges for beams)."""
-        pass
-
-    def get_property_data(self, obj, element):
-        """Retrieve property data for the given element."""
-        pass
-
     def invoke(self, context, event):
         """Detect Shift and pass it to execute"""
         self.ignore_prop_value = bool(event.shift)
@@ -598,52 +537,33 @@ class OBJECT_OT_BeamngSelectByPropertyBase(bpy.types.Operator):
         prop_collection = context.scene.beamng_jbeam_active_structure.prop_items
 
         # Retrieve the property value from the UI
-        selected_prop_value = None
         selected_prop_value_orig = None
         for prop in prop_collection:
             if prop.name == self.prop_name:
                 selected_prop_value_orig = str(prop.value).strip()
-                selected_prop_value = selected_prop_value_orig.lower().strip("\"'")
                 break
 
-        if selected_prop_value is None:
+        if selected_prop_value_orig is None:
             Utils.log_and_report(f"Property '{self.prop_name}' not found in UI", self, 'WARNING')
             return {'CANCELLED'}
 
         logging.debug(f"Searching for elements with {self.prop_name} = {selected_prop_value_orig}")
 
-        # Deselect all elements first
-        for elem in self.get_elements(bm):
-            elem.select = False
-
-        bm.select_flush(False)
-        bmesh.update_edit_mesh(obj.data, loop_triangles=True)
-
-        matched_count = 0
         instances = context.scene.beamng_jbeam_instance.get_selected_instances()
-
-        for elem in self.get_elements(bm):
-            for instance in instances:
-                stored_data = self.get_property_data(obj, elem, instance)
-                stored_value = stored_data.get(self.prop_name, None)
-
-                if stored_value is None:
-                    continue
-
-                match = False
-
-                if self.contains_search:
-                    match = selected_prop_value in str(stored_value)
-                else:
-                    normalized_value = str(stored_value).strip().lower().strip("\"'")
-                    match = normalized_value == selected_prop_value or self.ignore_prop_value
-
-                if match:
-                    elem.select = True
-                    matched_count += 1
-
-        bmesh.update_edit_mesh(obj.data)
-
+        storage_inst: JbeamPropsStorage = JbeamPropsStorageManager.get_instance().get_props_storage(obj)
+        matched_keys = storage_inst.find_keys_by_prop(
+            self.domain,
+            self.prop_name,
+            value=None if self.ignore_prop_value and not self.contains_search else selected_prop_value_orig,
+            contains=self.contains_search,
+            instances=instances
+        )
+
+        keys = j.get_attribute_values(obj, j.DOMAIN_TO_JBEAM_PROPS_ATTR[self.domain], self.domain, bm)
+        mask = [bool(key) and key in matched_keys for key in keys]
+        o.set_elements_selection(obj, self.domain, mask, bm)
+
+        matched_count = sum(mask)
         logging.debug(f"Total Matched Elements: {matched_count}")
         Utils.log_and_report(f"Selected {matched_count} elements with {self.prop_name} = {selected_prop_value_orig}", self, 'INFO')
         return {'FINISHED'}
@@ -652,31 +572,16 @@ class OBJECT_OT_BeamngSelectJbeamNodesByProperty(OBJECT_OT_BeamngSelectByPropert
     bl_idname = "object.devtools_beamng_select_jbeam_nodes_by_property"
     bl_label = "DevTools: BeamNG Select JBeam Nodes by Property"
     element_type: str = "Nodes"
-
-    def get_elements(self, bm):
-        return bm.verts
-
-    def get_property_data(self, obj, element, instance):
-        return j.get_node_props(obj, element.index, instance)
+    domain: str = "verts"
 
 class OBJECT_OT_BeamngSelectJbeamBeamsByProperty(OBJECT_OT_BeamngSelectByPropertyBase):
     bl_idname = "object.devtools_beamng_select_jbeam_beams_by_property"
     bl_label = "DevTools: BeamNG Select JBeam Beams by Property"
     element_type: str = "Beams"
-
-    def get_elements(self, bm):
-        return bm.edges
-
-    def get_property_data(self, obj, element, instance):
-        return j.get_beam_props(obj, element.index, instance)
+    domain: str = "edges"
 
 class OBJECT_OT_BeamngSelectJbeamTrianglesByProperty(OBJECT_OT_BeamngSelectByPropertyBase):
     bl_idname = "object.devtools_beamng_select_jbeam_triangles_by_property"
     bl_label = "DevTools: BeamNG Select JBeam Triangles by Property"
     element_type: str = "Triangles"
-
-    def get_elements(self, bm):
-        return bm.faces
-
-    def get_property_data(self, obj, element, instance):
-        return j.get_triangle_props(obj, element.index, instance)
+    domain: str = "faces"
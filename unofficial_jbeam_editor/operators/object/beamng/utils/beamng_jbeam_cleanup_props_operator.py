@@ -0,0 +1,22 @@
+import bpy
+
+from unofficial_jbeam_editor.utils.utils import Utils
+from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamUtils as j
+
+class OBJECT_OT_BeamngJbeamCleanupProps(bpy.types.Operator):
+    """Remove stored props entries that are no longer referenced by any node, beam or triangle of the selected Node Meshes"""
+    bl_idname = "devtools_jbeameditor.beamng_jbeam_cleanup_props"
+    bl_label = "Clean Up Unused Props"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        total_entries = total_bytes = 0
+        for obj in context.selected_objects:
+            if not j.is_node_mesh(obj):
+                continue
+            entries, num_bytes = j.collect_orphaned_props(obj)
+            total_entries += entries
+            total_bytes += num_bytes
+
+        Utils.log_and_report(f"Removed {total_entries} orphaned props entries ({total_bytes} bytes reclaimed)", self, 'INFO')
+        return {'FINISHED'}
@@ -45,7 +45,7 @@ class OBJECT_OT_BeamngJbeamSelectElementByJbeamPath(bpy.types.Operator):
             return {'CANCELLED'}
 
         path = "" if self.jbeam_source_path == "." else self.jbeam_source_path
-        indices = j.find_indices_by_jbeam_path(obj, path, domain)
+        indices = j.find_indices_by_jbeam_path(obj, path, domain, bm)
 
         if not indices:
             Utils.log_and_report(f"No nodes found with jbeam path '{self.jbeam_source_path}'", self, 'INFO')
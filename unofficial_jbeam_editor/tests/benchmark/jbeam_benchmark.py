@@ -0,0 +1,334 @@
+"""Times every import and export stage on generated corpora of increasing size.
+
+    python unofficial_jbeam_editor/tests/benchmark/jbeam_benchmark.py --sizes 1000 10000 100000 --save baseline.json
+    blender --background --python unofficial_jbeam_editor/tests/benchmark/jbeam_benchmark.py -- --sizes 1000 10000 --baseline baseline.json
+
+Sizes are total nodes, beams and triangles of a vehicle written by tests/corpus/jbeam_corpus.py. With plain Python only the
+bpy-free core stages run, in Blender the mesh stages run as well. Every stage reports the median and p95 seconds over
+--repeat runs and the peak Python heap of one extra run traced with tracemalloc. With --baseline the process exits with 1
+if the median of a stage is more than --threshold slower than in the baseline.
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import logging
+import argparse
+import tempfile
+import statistics
+import tracemalloc
+
+from collections import defaultdict
+from contextlib import contextmanager
+
+ADDON_MODULE = "unofficial_jbeam_editor"
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+try:
+    import bpy
+    import addon_utils
+except ImportError:
+    bpy = None
+
+from unofficial_jbeam_editor.core.json_cleanup import json_cleanup
+from unofficial_jbeam_editor.core.jbeam_file_helper import JbeamFileHelper
+from unofficial_jbeam_editor.core.jbeam_parser import JbeamParser
+from unofficial_jbeam_editor.core.jbeam_models import JbeamLoadItem, JbeamPart
+from unofficial_jbeam_editor.core.jbeam_structure import JbeamStructureBuilder, JbeamRedundancyReducer
+from unofficial_jbeam_editor.core.jbeam_emitter import JbeamEmitter
+from unofficial_jbeam_editor.core.jbeam_export_processor import JbeamExportProcessor
+from unofficial_jbeam_editor.core.jbeam_pc_parser import JbeamPcParser
+from unofficial_jbeam_editor.core.jbeam_part_grouper import JbeamPartGrouper
+from unofficial_jbeam_editor.tests.corpus.jbeam_corpus import JbeamCorpusSpec, JbeamCorpusGenerator
+
+SECTION_HEADERS = {"nodes": '["id", "posX", "posY", "posZ"],', "beams": '["id1:","id2:"],', "triangles": '["id1:","id2:","id3:"],'}
+DOMAINS = ("vertex", "edge", "face")
+
+
+class StageTimer:
+    """Seconds per stage and run, summed over all blocks of a stage within a run. While tracing only the Python heap peak is kept."""
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.peaks: dict[str, int] = {}
+        self.trace = False
+        self._run: dict[str, float] = defaultdict(float)
+
+    @contextmanager
+    def __call__(self, stage):
+        if self.trace:
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+        if self.trace:
+            self.peaks[stage] = max(self.peaks.get(stage, 0), tracemalloc.get_traced_memory()[1] - current)
+        else:
+            self._run[stage] += elapsed
+
+    def end_run(self):
+        for stage, seconds in self._run.items():
+            self.samples[stage].append(seconds)
+        self._run.clear()
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        result = {}
+        for stage, samples in self.samples.items():
+            ordered = sorted(samples)
+            result[stage] = {
+                "median": round(statistics.median(ordered), 6),
+                "p95": round(ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)], 6),
+                "peak_kib": round(self.peaks.get(stage, 0) / 1024, 1),
+            }
+        return result
+
+
+class BenchmarkCorpus:
+    """A generated vehicle written to disk, with the decoded files kept for the stages that start after decoding."""
+
+    def __init__(self, elements, seed, directory):
+        self.spec = JbeamCorpusSpec.for_elements(elements, seed=seed)
+        self.generator = JbeamCorpusGenerator(self.spec)
+        self.paths = self.generator.write(directory)
+        self.texts = {}
+        for path in self.paths:
+            with open(path, "r", encoding="utf-8") as f:
+                self.texts[path] = f.read()
+        self.pc_path = next(path for path in self.paths if path.endswith(".pc"))
+        self.jbeam_texts = {path: text for path, text in self.texts.items() if path.endswith(".jbeam")}
+        self.data = {path: JbeamFileHelper.decode(JbeamFileHelper.attempt_fix_jbeam_commas(text)) for path, text in self.jbeam_texts.items()}
+
+
+class JbeamBenchmark:
+
+    def __init__(self, sizes, repeat=5, seed=0):
+        self.sizes = sizes
+        self.repeat = repeat
+        self.seed = seed
+
+    def run(self) -> dict:
+        results = {
+            "python": sys.version.split()[0],
+            "blender": bpy.app.version_string if bpy else None,
+            "repeat": self.repeat,
+            "seed": self.seed,
+            "sizes": {},
+        }
+        with tempfile.TemporaryDirectory(prefix="jbeam_benchmark_") as tmp_dir:
+            for size in self.sizes:
+                corpus = BenchmarkCorpus(size, self.seed, os.path.join(tmp_dir, str(size)))
+                timer = StageTimer()
+                for _ in range(self.repeat):
+                    self._run_once(corpus, timer)
+                timer.trace = True
+                tracemalloc.start()
+                try:
+                    self._run_once(corpus, timer)
+                finally:
+                    tracemalloc.stop()
+                results["sizes"][str(size)] = {"elements": corpus.generator.stats, "stages": timer.summary()}
+                print_summary(size, results["sizes"][str(size)])
+        return results
+
+    def _run_once(self, corpus: BenchmarkCorpus, t: StageTimer):
+        self._run_core_stages(corpus, t)
+        if bpy:
+            self._run_mesh_stages(corpus, t)
+        t.end_run()
+
+    @staticmethod
+    def _without_header(rows) -> list:
+        header = next((i for i, row in enumerate(rows) if isinstance(row, list)), None)
+        return rows if header is None else rows[:header] + rows[header + 1:]
+
+    def _run_core_stages(self, corpus: BenchmarkCorpus, t: StageTimer):
+        with t("comma_fix"):
+            fixed = {path: JbeamFileHelper.attempt_fix_jbeam_commas(text) for path, text in corpus.jbeam_texts.items()}
+        with t("json_cleanup"):
+            cleaned = {path: json_cleanup(text) for path, text in fixed.items()}
+        with t("decode"):
+            decoded = {path: JbeamFileHelper.validate_jbeam(JbeamFileHelper.loads_json_object(text)) for path, text in cleaned.items()}
+        with t("parse"):
+            parsers = []
+            for path, data in decoded.items():
+                parser = JbeamParser(JbeamLoadItem(path))
+                parser.parse(data)
+                parsers.append(parser)
+
+        parts = [(parser, part) for parser in parsers for part in parser.get_jbeam_parts().values()]
+        for _, part in parts:
+            part.nodes.update({node.id: node for node in part.nodes_list})
+        with t("parse_elements"):
+            for parser, part in parts:
+                part.beams_list = parser._parse_elements(part.json_beams, "beams", part.id) or []
+                part.triangles_list = parser._parse_elements(part.json_triangles, "triangles", part.id) or []
+
+        nodes = [node for _, part in parts for node in part.nodes_list]
+        node_indices = {node.id: index for index, node in enumerate(nodes)}
+        beams = [beam for _, part in parts for beam in part.beams_list]
+        triangles = [triangle for _, part in parts for triangle in part.triangles_list]
+        props = {
+            "vertex": {i: {1: node.props} for i, node in enumerate(nodes)},
+            "edge": self._element_props(beams),
+            "face": self._element_props(triangles),
+        }
+        with t("structure_data"):
+            data = {domain: JbeamStructureBuilder().build(props[domain]) for domain in DOMAINS}
+        with t("reduce_redundancy"):
+            JbeamRedundancyReducer(data["vertex"], "vertex", node_ids=[node.id for node in nodes], positions=[node.position for node in nodes]).reduce_redundancy()
+            edge_vertices = self._element_vertices(beams, node_indices)
+            JbeamRedundancyReducer(data["edge"], "edge", node_ids=[node.id for node in nodes], edge_vertices=edge_vertices).reduce_redundancy()
+            face_vertices = self._element_vertices(triangles, node_indices)
+            JbeamRedundancyReducer(data["face"], "face", node_ids=[node.id for node in nodes], face_vertices=face_vertices).reduce_redundancy()
+
+        sections = {
+            part_name: {key: JbeamEmitter.format_list(self._without_header(part_data[key]), SECTION_HEADERS[key], False) for key in SECTION_HEADERS}
+            for data in corpus.data.values() for part_name, part_data in data.items()
+        }
+        with t("export_processor"):
+            for path, text in corpus.jbeam_texts.items():
+                processor = JbeamExportProcessor(text)
+                for part_name in corpus.data[path]:
+                    node_ids = {row[0] for row in corpus.data[path][part_name]["nodes"] if isinstance(row, list)}
+                    processor.replace_sections(sections[part_name], processor.match_part(node_ids))
+
+        part_parsers = self._parse_pc_parts(corpus)
+        with t("group_parts"):
+            JbeamPartGrouper.group_parts(part_parsers)
+
+    @staticmethod
+    def _parse_pc_parts(corpus: BenchmarkCorpus) -> list[JbeamParser]:
+        """One parser per part listed in the corpus part config, like JbeamPartsLoader creates them."""
+        pc_parser = JbeamPcParser(corpus.pc_path)
+        with open(corpus.pc_path, "r", encoding="utf-8") as f:
+            pc_parser.parse(json.load(f))
+        parsers = []
+        for load_item in pc_parser.get_jbeam_load_items():
+            parser = JbeamParser(load_item)
+            parser.parse(corpus.data[load_item.file_path])
+            parsers.append(parser)
+        return parsers
+
+    @staticmethod
+    def _element_props(elements) -> dict[int, dict[int, dict]]:
+        """Props of beams or triangles keyed like PreJbeamStructureHelper.get_props, with one index per distinct element."""
+        props = {}
+        indices = {}
+        for element in elements:
+            index = indices.setdefault(element.id, len(indices))
+            props.setdefault(index, {})[element.instance - 1] = element.props
+        return props
+
+    @staticmethod
+    def _element_vertices(elements, node_indices) -> list[tuple[int, ...]]:
+        vertices = {}
+        for element in elements:
+            vertices.setdefault(element.id, tuple(node_indices.get(node_id, 0) for node_id in element.id))
+        return list(vertices.values())
+
+    def _run_mesh_stages(self, corpus: BenchmarkCorpus, t: StageTimer):
+        from unofficial_jbeam_editor.utils.jbeam.jbeam_node_mesh_creator import JbeamNodeMeshCreator
+        from unofficial_jbeam_editor.utils.jbeam.jbeam_node_mesh_configurator import JbeamNodeMeshConfigurator
+        from unofficial_jbeam_editor.utils.jbeam.jbeam_helper import PreJbeamStructureHelper, RedundancyReducerJbeamGenerator
+
+        parsers = self._parse_pc_parts(corpus)
+        creator = JbeamNodeMeshCreator()
+        obj = creator.create_object("jbeam_benchmark")
+        try:
+            init = True
+            for parser in parsers:
+                load_item = parser.parse_source
+                part_id = JbeamPart.generate_id(load_item.slot_type, load_item.part_name)
+                with t("mesh_add_vertices"):
+                    creator.add_vertices(parser.get_nodes_list(part_id))
+                parser.parse_data_for_jbeam_object_conversion(obj, part_id, False)
+                with t("attribute_configuration"):
+                    JbeamNodeMeshConfigurator.process_node_mesh_props_for_nodes(obj, parser, part_id, init)
+                init = False
+            for parser in parsers:
+                load_item = parser.parse_source
+                part_id = JbeamPart.generate_id(load_item.slot_type, load_item.part_name)
+                with t("mesh_add_edges"):
+                    creator.add_edges(parser.get_beams_list(part_id) or [])
+                with t("mesh_add_faces"):
+                    creator.add_faces(parser.get_triangles_list(part_id) or [])
+                with t("attribute_configuration"):
+                    JbeamNodeMeshConfigurator.process_node_mesh_props_for_beams_and_tris(obj, parser, part_id)
+
+            with t("mesh_structure_data"):
+                data = {domain: PreJbeamStructureHelper(obj, domain).structure_data() for domain in DOMAINS}
+            with t("mesh_reduce_redundancy"):
+                for domain in DOMAINS:
+                    RedundancyReducerJbeamGenerator(obj, data[domain], domain).reduce_redundancy()
+        finally:
+            mesh = obj.data
+            bpy.data.objects.remove(obj)
+            bpy.data.meshes.remove(mesh)
+
+
+def print_summary(size, result):
+    print(f"\n{size} elements ({', '.join(f'{k} {v}' for k, v in result['elements'].items() if k in ('nodes', 'beams', 'triangles'))})")
+    print(f"    {'stage':<26}{'median s':>12}{'p95 s':>12}{'peak KiB':>12}")
+    for stage, summary in result["stages"].items():
+        print(f"    {stage:<26}{summary['median']:>12.4f}{summary['p95']:>12.4f}{summary['peak_kib']:>12.1f}")
+
+
+def find_regressions(results, baseline, threshold, min_delta) -> list[str]:
+    """Stages whose median is more than threshold (a fraction) and more than min_delta seconds slower than in the baseline."""
+    regressions = []
+    for size, result in results["sizes"].items():
+        base_stages = baseline.get("sizes", {}).get(size, {}).get("stages", {})
+        for stage, summary in result["stages"].items():
+            base = base_stages.get(stage)
+            if base is None:
+                continue
+            delta = summary["median"] - base["median"]
+            if delta > min_delta and summary["median"] > base["median"] * (1 + threshold):
+                regressions.append(f"{size} {stage}: median {base['median']:.4f}s -> {summary['median']:.4f}s (+{delta / max(base['median'], 1e-9):.0%})")
+    return regressions
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="jbeam_benchmark", description="Time the jbeam import and export stages on generated corpora")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="total nodes, beams and triangles per corpus")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="write the results as JSON, e.g. as a new baseline")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown of a stage median, 0.2 is 20%%")
+    parser.add_argument("--min-delta", type=float, default=0.005, help="slowdowns below this many seconds are noise")
+    return parser.parse_args(argv)
+
+
+def main(argv) -> int:
+    args = parse_args(argv)
+    if bpy:
+        addon_utils.enable(ADDON_MODULE, default_set=True)
+    logging.getLogger().setLevel(logging.WARNING)  # the addon logs every part and element on debug level
+
+    results = JbeamBenchmark(args.sizes, args.repeat, args.seed).run()
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.save}")
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("blender") != results["blender"]:
+        print(f"\n⚠️  Baseline was recorded with Blender {baseline.get('blender')}, this run uses {results['blender']}")
+    regressions = find_regressions(results, baseline, args.threshold, args.min_delta)
+    for regression in regressions:
+        print(f"❌ Regression {regression}")
+    if not regressions:
+        print(f"\n✅ No stage regressed more than {args.threshold:.0%} against {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]))
@@ -0,0 +1,120 @@
+"""Times enabling the addon in fresh Blender processes.
+
+    python unofficial_jbeam_editor/tests/benchmark/startup_benchmark.py --blender /path/to/blender --repeat 10 --save startup.json
+    blender --background --python unofficial_jbeam_editor/tests/benchmark/startup_benchmark.py -- --baseline startup.json
+
+Every run starts blender --background --factory-startup and times importing the package, registering the addon and the
+first use of the jbeam import operator, which imports the loader, parser and mesh creator behind its stub. It also counts
+the addon modules imported once the addon is enabled. With --baseline the process exits with 1 if a stage median is more
+than --threshold slower than in the baseline.
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, REPO_ROOT)
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+from unofficial_jbeam_editor.tests.benchmark.jbeam_benchmark import ADDON_MODULE, StageTimer, find_regressions
+
+RESULT_PREFIX = "STARTUP_BENCHMARK "
+
+# Runs inside each fresh Blender process, prints one line with the seconds per stage and the module counts
+CHILD_SCRIPT = f"""
+import sys, json, time, logging
+sys.path.insert(0, {REPO_ROOT!r})
+import addon_utils
+stages = {{}}
+start = time.perf_counter()
+import {ADDON_MODULE}
+stages["import_package"] = time.perf_counter() - start
+start = time.perf_counter()
+addon_utils.enable({ADDON_MODULE!r}, default_set=True)
+stages["register"] = time.perf_counter() - start
+logging.getLogger().setLevel(logging.WARNING)
+modules = sorted(name for name in sys.modules if name.startswith({ADDON_MODULE!r}))
+from {ADDON_MODULE}.operators.file.beamng.beamng_file_operator_stubs import DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportJbeamToNodeMeshStub as stub
+start = time.perf_counter()
+stub.operator_class()
+stages["first_invoke_import"] = time.perf_counter() - start
+counts = {{
+    "modules_at_enable": len(modules),
+    "modules_after_first_invoke": sum(1 for name in sys.modules if name.startswith({ADDON_MODULE!r})),
+    "jbeam_stack_at_enable": int({ADDON_MODULE + ".utils.jbeam.jbeam_node_mesh_creator"!r} in modules),
+}}
+print({RESULT_PREFIX!r} + json.dumps({{"stages": stages, "counts": counts}}), flush=True)
+"""
+
+
+def run_fresh_process(blender) -> dict:
+    command = [blender, "--background", "--factory-startup", "--python-exit-code", "1", "--python-expr", CHILD_SCRIPT]
+    output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+    line = next((line for line in output.splitlines() if line.startswith(RESULT_PREFIX)), None)
+    if line is None:
+        raise RuntimeError(f"No result printed by {blender}:\n{output}")
+    return json.loads(line[len(RESULT_PREFIX):])
+
+
+def run(blender, repeat) -> dict:
+    timer = StageTimer()
+    counts = {}
+    for _ in range(repeat):
+        result = run_fresh_process(blender)
+        for stage, seconds in result["stages"].items():
+            timer.samples[stage].append(seconds)
+        counts = result["counts"]
+    version = subprocess.run([blender, "--version"], capture_output=True, text=True).stdout.split("\n")[0]
+    return {"blender": version.strip(), "repeat": repeat, "sizes": {"startup": {"elements": counts, "stages": timer.summary()}}}
+
+
+def print_summary(result):
+    print("\n" + ", ".join(f"{k} {v}" for k, v in result["elements"].items()))
+    print(f"    {'stage':<26}{'median s':>12}{'p95 s':>12}")
+    for stage, summary in result["stages"].items():
+        print(f"    {stage:<26}{summary['median']:>12.4f}{summary['p95']:>12.4f}")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="startup_benchmark", description="Time enabling the addon in fresh Blender processes")
+    parser.add_argument("--blender", default=bpy.app.binary_path if bpy else "blender", help="Blender executable to start")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--save", help="write the results as JSON, e.g. as a new baseline")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown of a stage median, 0.2 is 20%%")
+    parser.add_argument("--min-delta", type=float, default=0.005, help="slowdowns below this many seconds are noise")
+    return parser.parse_args(argv)
+
+
+def main(argv) -> int:
+    args = parse_args(argv)
+    results = run(args.blender, args.repeat)
+    print_summary(results["sizes"]["startup"])
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.save}")
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("blender") != results["blender"]:
+        print(f"\n⚠️  Baseline was recorded with {baseline.get('blender')}, this run uses {results['blender']}")
+    regressions = find_regressions(results, baseline, args.threshold, args.min_delta)
+    for regression in regressions:
+        print(f"❌ Regression {regression}")
+    if not regressions:
+        print(f"\n✅ No startup stage regressed more than {args.threshold:.0%} against {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]))
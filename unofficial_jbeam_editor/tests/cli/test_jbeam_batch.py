@@ -0,0 +1,67 @@
+import os
+import shutil
+import argparse
+import tempfile
+import unittest
+import logging
+
+from unofficial_jbeam_editor.cli.jbeam_batch import bpy, collect_files, common_root, mirror_path, run_workers
+
+# NOTE: Runs outside of Blender with the repository root on PYTHONPATH. The worker test needs Blender:
+# blender --background --python unofficial_jbeam_editor/tests/cli/test_jbeam_batch.py
+TEST_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "test_data", "test.jbeam")
+
+
+class TestJbeamBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp(prefix="jbeam_batch_test_")
+        self.files = {}
+        for name in ("mods/a/body.jbeam", "mods/b/body.jbeam", "mods/a/car.pc", "mods/a/readme.txt", "out/car.blend"):
+            path = self.files[name] = os.path.join(self.tmp_dir, *name.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            shutil.copyfile(TEST_FILE, path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_collect_files(self):
+        pattern = os.path.join(self.tmp_dir, "mods", "**", "*")
+        expected = [self.files[name] for name in ("mods/a/body.jbeam", "mods/a/car.pc", "mods/b/body.jbeam")]
+        self.assertEqual(collect_files([pattern, pattern], "import"), expected)  # filtered by extension, sorted and without duplicates
+        self.assertEqual(collect_files([pattern], "export"), [])
+        self.assertEqual(collect_files([self.files["out/car.blend"], os.path.join(self.tmp_dir, "missing.blend")], "export"), [self.files["out/car.blend"]])
+        logging.debug("✅ TEST PASSED: test_collect_files")
+
+    def test_mirror_path(self):
+        files = [self.files["mods/a/body.jbeam"], self.files["mods/b/body.jbeam"]]
+        root = common_root(files)
+        self.assertEqual(root, os.path.join(self.tmp_dir, "mods"))
+        output = os.path.join(self.tmp_dir, "export")
+        self.assertEqual([mirror_path(output, root, f) for f in files], [os.path.join(output, "a", "body.jbeam"), os.path.join(output, "b", "body.jbeam")])
+        self.assertEqual(mirror_path(output, root, files[0], ".blend"), os.path.join(output, "a", "body.blend"))
+        outside = mirror_path(output, root, self.files["out/car.blend"])  # not below the root: the whole path is kept
+        self.assertTrue(outside.startswith(output + os.sep))
+        self.assertTrue(outside.endswith(os.path.join("out", "car.blend")))
+        self.assertEqual(mirror_path(output, None, files[0]), mirror_path(output, None, files[0]))
+        self.assertNotEqual(mirror_path(output, None, files[0]), mirror_path(output, None, files[1]))
+        logging.debug("✅ TEST PASSED: test_mirror_path")
+
+    @unittest.skipIf(bpy is None, "starts worker Blender processes")
+    def test_run_workers(self):
+        files = [self.files["mods/a/body.jbeam"], self.files["mods/b/body.jbeam"], os.path.join(self.tmp_dir, "mods", "missing.jbeam")]
+        output = os.path.join(self.tmp_dir, "blend")
+        args = argparse.Namespace(mode="import", output=output, jobs=2, verbose=False, source_root=common_root(files))
+        results = {result["file"]: result for result in run_workers(args, files)}
+        self.assertEqual(set(results), set(files))
+        self.assertEqual(results[files[2]]["status"], "error")
+        outputs = [results[f]["outputs"][0] for f in files[:2]]
+        self.assertEqual(outputs, [os.path.join(output, "a", "body.blend"), os.path.join(output, "b", "body.blend")])
+        self.assertTrue(all(os.path.isfile(path) for path in outputs))
+        logging.debug("✅ TEST PASSED: test_run_workers")
+
+def run_tests():
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestJbeamBatch)
+    unittest.TextTestRunner().run(suite)
+
+run_tests()
@@ -0,0 +1,300 @@
+"""Deterministic synthetic .jbeam/.pc vehicles for scale tests and benchmarks.
+
+    python -m unofficial_jbeam_editor.tests.corpus.jbeam_corpus --elements 100000 --parts 6 --seed 1 --output /tmp/corpus
+
+Every part is a jittered node lattice with beams to its lattice neighbours and triangles over its cells. Child parts
+hang off a slot tree of the configured depth and beam their first nodes to their parent part. Scope modifier rows,
+comments, missing commas and numbers like .5 are injected at configurable rates, so the files exercise the same
+cleanup and fix paths as real mods. The same spec always produces the same files.
+"""
+
+import os
+import json
+import math
+import random
+import argparse
+
+NODE_MODIFIERS = {
+    "nodeWeight": [0.5, 1, 1.5, 2, 3.25, 5],
+    "frictionCoef": [0.5, 0.7, 1.0, 1.2],
+    "nodeMaterial": ["|NM_METAL", "|NM_PLASTIC", "|NM_RUBBER"],
+    "collision": [True, False],
+    "selfCollision": [True, False],
+}
+BEAM_MODIFIERS = {
+    "beamSpring": [401000, 601000, 801000, 1501000],
+    "beamDamp": [50, 100, 150, 250],
+    "beamDeform": [20000, 30000, 45000, "FLT_MAX"],
+    "beamStrength": ["FLT_MAX", 120000],
+    "beamPrecompression": [1, 0.95, 1.05],
+}
+TRIANGLE_MODIFIERS = {
+    "groundModel": ["metal", "plastic", "asphalt"],
+    "dragCoef": [0, 5, 10],
+}
+
+# lattice offsets of the beams of a node, axis beams first, then face and space diagonals
+BEAM_OFFSETS = [(1, 0, 0), (0, 1, 0), (0, 0, 1), (1, 1, 0), (1, -1, 0), (1, 0, 1), (0, 1, 1), (1, 0, -1), (0, 1, -1),
+                (1, 1, 1), (1, -1, 1), (1, 1, -1), (1, -1, -1)]
+NODE_SPACING = 0.25
+ATTACH_NODES = 4  # beams from the first nodes of a child part to its parent part
+
+
+class JbeamCorpusSpec:
+    """Size and shape of a synthetic vehicle. Rates are probabilities per row."""
+
+    def __init__(self, name="synthetic", seed=0, nodes=1000, beams_per_node=3.0, triangle_density=0.5, modifier_churn=0.05,
+                 parts=4, slot_depth=2, parts_per_file=2, comment_rate=0.02, missing_comma_rate=0.01, short_number_rate=0.2):
+        self.name = name
+        self.seed = seed
+        self.nodes = nodes
+        self.beams_per_node = min(beams_per_node, len(BEAM_OFFSETS))
+        self.triangle_density = triangle_density  # share of lattice cells covered by two triangles
+        self.modifier_churn = modifier_churn
+        self.parts = max(1, parts)
+        self.slot_depth = max(1, slot_depth)
+        self.parts_per_file = max(1, parts_per_file)
+        self.comment_rate = comment_rate
+        self.missing_comma_rate = missing_comma_rate
+        self.short_number_rate = short_number_rate
+
+    @classmethod
+    def for_elements(cls, elements, **kwargs):
+        """Spec with about elements nodes, beams and triangles in total."""
+        spec = cls(**kwargs)
+        spec.nodes = max(spec.parts * 8, round(elements / (1 + spec.beams_per_node + 2 * spec.triangle_density)))
+        return spec
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({', '.join(f'{k}={v!r}' for k, v in vars(self).items())})"
+
+
+class CorpusPart:
+
+    def __init__(self, index, name, slot_type, level, parent):
+        self.index = index
+        self.name = name
+        self.slot_type = slot_type
+        self.level = level
+        self.parent: CorpusPart | None = parent
+        self.children: list[CorpusPart] = []
+        self.node_ids: list[str] = []
+
+
+class JbeamCorpusGenerator:
+    """Generates the .jbeam files and the .pc file of one vehicle from a JbeamCorpusSpec."""
+
+    def __init__(self, spec: JbeamCorpusSpec):
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.parts: list[CorpusPart] = []
+        self.stats: dict[str, int] = {}
+
+    def generate(self) -> dict[str, str]:
+        """file name -> text of all .jbeam files and the .pc file"""
+        self.rng.seed(self.spec.seed)
+        self.stats = {"nodes": 0, "beams": 0, "triangles": 0, "modifiers": 0, "comments": 0, "missing_commas": 0, "short_numbers": 0}
+        self._create_slot_tree()
+        files = {}
+        for start in range(0, len(self.parts), self.spec.parts_per_file):
+            chunk = self.parts[start:start + self.spec.parts_per_file]
+            file_name = f"{self.spec.name}.jbeam" if start == 0 else f"{chunk[0].name}.jbeam"
+            files[file_name] = "{\n" + ",\n".join(self._write_part(part) for part in chunk) + "\n}\n"
+        pc = {"format": 2, "model": self.spec.name, "parts": {part.slot_type: part.name for part in self.parts}}
+        files[f"{self.spec.name}.pc"] = json.dumps(pc, indent=2) + "\n"
+        return files
+
+    def write(self, output_dir) -> list[str]:
+        os.makedirs(output_dir, exist_ok=True)
+        paths = []
+        for file_name, text in self.generate().items():
+            path = os.path.join(output_dir, file_name)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            paths.append(path)
+        return paths
+
+    def _create_slot_tree(self):
+        """Main part first, then the other parts spread over slot_depth levels, each with a parent on the level above."""
+        name = self.spec.name
+        main = CorpusPart(0, f"{name}_main", "main", 0, None)
+        self.parts = [main]
+        levels = [[main]]
+        for index in range(1, self.spec.parts):
+            level = 1 + (index - 1) % self.spec.slot_depth
+            while level > len(levels):
+                level -= 1
+            parent = self.rng.choice(levels[level - 1])
+            part = CorpusPart(index, f"{name}_part{index}", f"{name}_slot{index}", level, parent)
+            parent.children.append(part)
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(part)
+            self.parts.append(part)
+
+    def _write_part(self, part: CorpusPart) -> str:
+        count = self.spec.nodes // self.spec.parts + (1 if part.index < self.spec.nodes % self.spec.parts else 0)
+        nz = max(1, round((count / 16) ** (1 / 3)))
+        ny = 4 * nz
+        nx = max(1, math.ceil(count / (ny * nz)))
+        part.node_ids = [f"p{part.index}n{k}" for k in range(count)]
+
+        lines = [f'    "{part.name}": {{',
+                 f'        "information": {{"authors": "jbeam_corpus", "name": "Synthetic part {part.index}", "value": {100 + part.index}}},',
+                 f'        "slotType": "{part.slot_type}",']
+        if part.children:
+            lines.append('        "slots": [')
+            rows = [["type", "default", "description"]] + [[c.slot_type, c.name, f"Synthetic slot {c.index}"] for c in part.children]
+            lines.extend(self._rows(rows, {}, 0))
+            lines.append('        ],')
+        if part.parent is None:
+            ref = part.node_ids
+            lines.append('        "refNodes": [')
+            lines.append('            ["ref:", "back:", "left:", "up:"],')
+            lines.append(f'            ["{ref[0]}", "{ref[min(nx, count - 1)]}", "{ref[min(1, count - 1)]}", "{ref[min(nx * ny, count - 1)]}"]')
+            lines.append('        ],')
+
+        def lattice(k):
+            return k % nx, (k // nx) % ny, k // (nx * ny)
+
+        def node_at(ix, iy, iz):
+            if 0 <= ix < nx and 0 <= iy < ny and 0 <= iz < nz:
+                k = ix + iy * nx + iz * nx * ny
+                return k if k < count else None
+            return None
+
+        nodes = [["id", "posX", "posY", "posZ"]]
+        for k, node_id in enumerate(part.node_ids):
+            ix, iy, iz = lattice(k)
+            x = round((ix - nx / 2) * NODE_SPACING + self.rng.uniform(-0.02, 0.02), 3)
+            y = round((iy + part.index * ny) * NODE_SPACING + self.rng.uniform(-0.02, 0.02), 3)
+            z = round(iz * NODE_SPACING + self.rng.uniform(-0.02, 0.02), 3)
+            nodes.append([node_id, x, y, z])
+        self.stats["nodes"] += count
+        lines.append('        "nodes": [')
+        lines.extend(self._rows(nodes, NODE_MODIFIERS, 1, {"group": part.name}))
+        lines.append('        ],')
+
+        beams = [["id1:", "id2:"]]
+        whole, fraction = int(self.spec.beams_per_node), self.spec.beams_per_node % 1
+        for k, node_id in enumerate(part.node_ids):
+            ix, iy, iz = lattice(k)
+            wanted = whole + (1 if self.rng.random() < fraction else 0)
+            for dx, dy, dz in BEAM_OFFSETS:
+                if wanted == 0:
+                    break
+                other = node_at(ix + dx, iy + dy, iz + dz)
+                if other is not None:
+                    beams.append([node_id, part.node_ids[other]])
+                    wanted -= 1
+        if part.parent is not None and part.parent.node_ids:
+            for k in range(min(ATTACH_NODES, count)):
+                beams.append([part.node_ids[k], part.parent.node_ids[k % len(part.parent.node_ids)]])
+        self.stats["beams"] += len(beams) - 1
+        lines.append('        "beams": [')
+        lines.extend(self._rows(beams, BEAM_MODIFIERS, 1, {"deformGroup": ""}))
+        lines.append('        ],')
+
+        triangles = [["id1:", "id2:", "id3:"]]
+        for k in range(count):
+            ix, iy, iz = lattice(k)
+            right, up, diagonal = node_at(ix + 1, iy, iz), node_at(ix, iy + 1, iz), node_at(ix + 1, iy + 1, iz)
+            if None in (right, up, diagonal) or self.rng.random() >= self.spec.triangle_density:
+                continue
+            ids = part.node_ids
+            triangles.append([ids[k], ids[right], ids[diagonal]])
+            triangles.append([ids[k], ids[diagonal], ids[up]])
+        self.stats["triangles"] += len(triangles) - 1
+        lines.append('        "triangles": [')
+        lines.extend(self._rows(triangles, TRIANGLE_MODIFIERS, 1, {"group": part.name}))
+        lines.append('        ]')
+        lines.append('    }')
+        return "\n".join(lines)
+
+    def _rows(self, rows, modifiers, header_rows, initial=None) -> list[str]:
+        """Lines of a section with scope modifier rows, comments, missing commas and short numbers mixed in.
+        The modifiers are reset to their first values after the last row."""
+        spec = self.spec
+        rng = self.rng
+        indent = " " * 12
+        lines = []
+        current = {key: values[0] for key, values in modifiers.items()}
+        if modifiers:
+            current.update(initial or {})
+            lines.append(indent + self._format(current) + ",")
+            self.stats["modifiers"] += 1
+        for i, row in enumerate(rows):
+            if i >= header_rows and modifiers and rng.random() < spec.modifier_churn:
+                changed = {}
+                for key in rng.sample(sorted(modifiers), min(2, len(modifiers))):
+                    value = rng.choice(modifiers[key])
+                    if value != current[key]:
+                        changed[key] = current[key] = value
+                if changed:
+                    lines.append(indent + self._format(changed) + ",")
+                    self.stats["modifiers"] += 1
+            line = indent + self._format(row)
+            if i >= header_rows and rng.random() < spec.missing_comma_rate:
+                self.stats["missing_commas"] += 1
+            else:
+                line += ","
+            if rng.random() < spec.comment_rate:
+                self.stats["comments"] += 1
+                if rng.random() < 0.5:
+                    line += f" // row {i}"
+                else:
+                    lines.extend((f"{indent}/*", f"{indent}    row {i}", f"{indent}*/"))  # JbeamFileHelper only ends block comments on a later line
+            lines.append(line)
+        if modifiers:
+            reset = {key: values[0] for key, values in modifiers.items() if current.get(key) != values[0]}
+            reset.update({key: "" for key, value in (initial or {}).items() if value != ""})
+            if reset:
+                lines.append(indent + self._format(reset) + ",")
+                self.stats["modifiers"] += 1
+        return lines
+
+    def _format(self, value) -> str:
+        if isinstance(value, list):
+            return "[" + ", ".join(self._format(v) for v in value) + "]"
+        if isinstance(value, dict):
+            return "{" + ", ".join(f'"{k}": {self._format(v)}' for k, v in value.items()) + "}"
+        if isinstance(value, float) and -1 < value < 1 and value != 0 and self.rng.random() < self.spec.short_number_rate:
+            self.stats["short_numbers"] += 1
+            return repr(value).replace("0.", ".", 1)  # .5 and -.25 like hand written jbeam
+        return json.dumps(value)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="jbeam_corpus", description="Write a deterministic synthetic .jbeam/.pc vehicle")
+    parser.add_argument("--output", required=True, help="output directory")
+    parser.add_argument("--name", default="synthetic")
+    parser.add_argument("--seed", type=int, default=0)
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument("--nodes", type=int, default=1000)
+    size.add_argument("--elements", type=int, help="total nodes, beams and triangles, overrides --nodes")
+    parser.add_argument("--beams-per-node", type=float, default=3.0)
+    parser.add_argument("--triangle-density", type=float, default=0.5)
+    parser.add_argument("--modifier-churn", type=float, default=0.05)
+    parser.add_argument("--parts", type=int, default=4)
+    parser.add_argument("--slot-depth", type=int, default=2)
+    parser.add_argument("--parts-per-file", type=int, default=2)
+    parser.add_argument("--comment-rate", type=float, default=0.02)
+    parser.add_argument("--missing-comma-rate", type=float, default=0.01)
+    parser.add_argument("--short-number-rate", type=float, default=0.2)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    options = dict(name=args.name, seed=args.seed, beams_per_node=args.beams_per_node, triangle_density=args.triangle_density,
+                   modifier_churn=args.modifier_churn, parts=args.parts, slot_depth=args.slot_depth, parts_per_file=args.parts_per_file,
+                   comment_rate=args.comment_rate, missing_comma_rate=args.missing_comma_rate, short_number_rate=args.short_number_rate)
+    spec = JbeamCorpusSpec.for_elements(args.elements, **options) if args.elements else JbeamCorpusSpec(nodes=args.nodes, **options)
+    generator = JbeamCorpusGenerator(spec)
+    paths = generator.write(args.output)
+    print(json.dumps({"files": paths, **generator.stats}))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
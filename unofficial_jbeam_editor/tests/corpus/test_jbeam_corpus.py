@@ -0,0 +1,72 @@
+import json
+import tempfile
+import unittest
+import logging
+
+from unofficial_jbeam_editor.core.jbeam_file_helper import JbeamFileHelper
+from unofficial_jbeam_editor.core.jbeam_parser import JbeamParser
+from unofficial_jbeam_editor.core.jbeam_models import JbeamLoadItem
+from unofficial_jbeam_editor.core.jbeam_pc_parser import JbeamPcParser
+from unofficial_jbeam_editor.core.jbeam_part_grouper import JbeamPartGrouper
+from unofficial_jbeam_editor.tests.corpus.jbeam_corpus import JbeamCorpusSpec, JbeamCorpusGenerator
+
+# NOTE: Runs outside of Blender with the repository root on PYTHONPATH.
+
+
+class TestJbeamCorpus(unittest.TestCase):
+
+    def setUp(self):
+        self.spec = JbeamCorpusSpec.for_elements(5000, seed=7, parts=5, slot_depth=3, comment_rate=0.05, missing_comma_rate=0.05)
+
+    def test_same_seed_same_files(self):
+        self.assertEqual(JbeamCorpusGenerator(self.spec).generate(), JbeamCorpusGenerator(self.spec).generate())
+        logging.debug("✅ TEST PASSED: test_same_seed_same_files")
+
+    def test_files_load(self):
+        generator = JbeamCorpusGenerator(self.spec)
+        files = generator.generate()
+        self.assertGreater(generator.stats["missing_commas"], 0)
+        self.assertGreater(generator.stats["short_numbers"], 0)
+        nodes = beams = triangles = 0
+        for file_name, text in files.items():
+            if not file_name.endswith(".jbeam"):
+                continue
+            try:
+                data = JbeamFileHelper.decode(text)
+            except ValueError:
+                data = JbeamFileHelper.decode(JbeamFileHelper.attempt_fix_jbeam_commas(text))
+            parser = JbeamParser(JbeamLoadItem(file_name))
+            parser.parse(data)
+            for part in parser.get_jbeam_parts().values():
+                nodes += len(part.nodes_list)
+                beams += sum(1 for row in part.json_beams if isinstance(row, list)) - 1  # without the header row
+                triangles += sum(1 for row in part.json_triangles if isinstance(row, list)) - 1
+        self.assertEqual((nodes, beams, triangles), (generator.stats["nodes"], generator.stats["beams"], generator.stats["triangles"]))
+        logging.debug("✅ TEST PASSED: test_files_load")
+
+    def test_parts_grouped_by_slots(self):
+        generator = JbeamCorpusGenerator(self.spec)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pc_path = next(path for path in generator.write(tmp_dir) if path.endswith(".pc"))
+            pc_parser = JbeamPcParser(pc_path)
+            with open(pc_path, "r", encoding="utf-8") as f:
+                self.assertTrue(pc_parser.parse(json.load(f)))
+            parsers = []
+            for load_item in pc_parser.get_jbeam_load_items():
+                with open(load_item.file_path, "r", encoding="utf-8") as f:
+                    data = JbeamFileHelper.decode(JbeamFileHelper.attempt_fix_jbeam_commas(f.read()))
+                parser = JbeamParser(load_item)
+                parser.parse(data)
+                parsers.append(parser)
+
+        parsers.sort(key=lambda parser: parser.parse_source.slot_type != "main")  # the main part roots the slot tree
+        grouped = JbeamPartGrouper.group_parts(parsers)
+        self.assertEqual({part.group_id for part in grouped}, {0})
+        self.assertEqual({part.id: part.level for part in grouped}, {f"{part.slot_type}:{part.name}": part.level for part in generator.parts})
+        logging.debug("✅ TEST PASSED: test_parts_grouped_by_slots")
+
+def run_tests():
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestJbeamCorpus)
+    unittest.TextTestRunner().run(suite)
+
+run_tests()
@@ -0,0 +1,57 @@
+import os
+import unittest
+import logging
+
+from unofficial_jbeam_editor.core.jbeam_file_helper import JbeamFileHelper
+from unofficial_jbeam_editor.core.jbeam_parser import JbeamParser
+from unofficial_jbeam_editor.core.jbeam_models import JbeamLoadItem
+from unofficial_jbeam_editor.core.jbeam_structure import JbeamStructureBuilder, JbeamRedundancyReducer
+from unofficial_jbeam_editor.core.jbeam_emitter import JbeamEmitter
+from unofficial_jbeam_editor.core.jbeam_export_processor import JbeamExportProcessor
+
+# NOTE: The core package has no bpy dependency, so this test also runs outside of Blender with the repository root on PYTHONPATH.
+TEST_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "test_data", "test.jbeam")
+
+
+class TestJbeamCore(unittest.TestCase):
+
+    def setUp(self):
+        with open(TEST_FILE, "r", encoding="utf-8") as f:
+            self.text = f.read()
+        try:
+            data = JbeamFileHelper.decode(self.text)
+        except ValueError:  # json.JSONDecodeError is a ValueError
+            data = JbeamFileHelper.decode(JbeamFileHelper.attempt_fix_jbeam_commas(self.text))
+        self.parser = JbeamParser(JbeamLoadItem(TEST_FILE))
+        self.parser.parse(data)
+        self.part = self.parser.get_jbeam_part()
+
+    def test_node_positions_are_tuples(self):
+        self.assertTrue(self.part.nodes_list)
+        for node in self.part.nodes_list:
+            self.assertIsInstance(node.position, tuple)
+            self.assertEqual(len(node.position), 3)
+        logging.debug("✅ TEST PASSED: test_node_positions_are_tuples")
+
+    def test_nodes_roundtrip(self):
+        nodes = self.part.nodes_list
+        props = {i: {1: node.props} for i, node in enumerate(nodes)}
+        data = JbeamStructureBuilder().build(props)
+        rows = JbeamRedundancyReducer(data, "vertex", node_ids=[n.id for n in nodes], positions=[n.position for n in nodes]).reduce_redundancy()
+        written = {row[0]: tuple(row[1:4]) for row in rows if isinstance(row, list)}
+        self.assertEqual(written, {n.id: n.position for n in nodes})
+
+        processor = JbeamExportProcessor(self.text)
+        part_name = processor.match_part(written.keys())
+        self.assertEqual(part_name, self.part.part_name)
+        result = processor.replace_sections({"nodes": JbeamEmitter.format_list(rows, '["id", "posX", "posY", "posZ"],', False)}, part_name)
+        reparsed = JbeamParser(JbeamLoadItem(TEST_FILE))
+        reparsed.parse(JbeamFileHelper.decode(JbeamFileHelper.attempt_fix_jbeam_commas(result)))
+        self.assertEqual({n.id: n.position for n in reparsed.get_jbeam_part().nodes_list}, written)
+        logging.debug("✅ TEST PASSED: test_nodes_roundtrip")
+
+def run_tests():
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestJbeamCore)
+    unittest.TextTestRunner().run(suite)
+
+run_tests()
@@ -0,0 +1,93 @@
+import bpy
+import unittest
+import logging
+
+from unofficial_jbeam_editor.utils.jbeam.jbeam_element_index import JbeamElementIndexManager
+from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamUtils as j
+
+# NOTE: Runs inside Blender, e.g. blender --background --python unofficial_jbeam_editor/tests/jbeam/test_jbeam_element_index.py
+
+NODE_IDS = ["n0", "n1", "n2", "n0"]  # vertex 3 repeats the id of vertex 0, so edge (3, 1) duplicates beam (0, 1)
+
+
+class TestJbeamElementIndex(unittest.TestCase):
+
+    def setUp(self):
+        mesh = bpy.data.meshes.new("jbeam_index_test_mesh")
+        mesh.from_pydata([(0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)], [(0, 1), (1, 2), (2, 0), (3, 1)], [(0, 1, 2)])
+        mesh.update()
+        self.obj = bpy.data.objects.new("jbeam_index_test_object", mesh)
+        bpy.context.collection.objects.link(self.obj)
+        j.create_node_mesh_attributes(self.obj)
+        for index, node_id in enumerate(NODE_IDS):
+            j.set_node_id(self.obj, index, node_id)
+            j.set_attribute_value(self.obj, index, j.ATTR_NODE_SOURCE_JBEAM, "a.jbeam" if index < 2 else "b.jbeam")
+        self.manager = JbeamElementIndexManager.get_instance()
+        self.manager.invalidate(self.obj)
+
+    def test_node_lookups(self):
+        index = self.manager.get_node_index(self.obj)
+        self.assertEqual(index.node_indices("n0"), [0, 3])
+        self.assertEqual(index.node_index("n2"), 2)
+        self.assertEqual(index.node_index("missing"), -1)
+        self.assertEqual(index.duplicate_node_ids, {"n0": [0, 3]})
+        logging.debug("✅ TEST PASSED: test_node_lookups")
+
+    def test_element_lookups(self):
+        index = self.manager.get_element_index(self.obj)
+        edge = next(i for i, vertices in enumerate(index.edge_vertices) if set(vertices) == {1, 2})
+        self.assertEqual(index.beam_index("n2", "n1"), edge)  # node order does not matter
+        self.assertEqual(len(index.beam_indices("n0", "n1")), 2)
+        self.assertEqual(index.beam_index("n1", "missing"), -1)
+        self.assertEqual(index.duplicate_beams, {("n0", "n1"): index.beam_indices("n1", "n0")})
+        self.assertEqual(index.face_index("n2", "n0", "n1"), 0)
+        self.assertEqual(index.face_indices("n0", "n1", "n3"), [])
+        logging.debug("✅ TEST PASSED: test_element_lookups")
+
+    def test_source_lookups(self):
+        index = self.manager.get_source_index(self.obj)
+        self.assertEqual(index.source_indices("a.jbeam"), [0, 1])
+        self.assertEqual(index.source_indices("b.jbeam"), [2, 3])
+        self.assertEqual(index.source_paths, {"verts": ["a.jbeam", "b.jbeam"]})
+        logging.debug("✅ TEST PASSED: test_source_lookups")
+
+    def test_cached_until_invalidated(self):
+        index = self.manager.get_element_index(self.obj)
+        self.assertIs(self.manager.get_element_index(self.obj), index)
+        self.manager.invalidate(self.obj)
+        self.assertIsNot(self.manager.get_element_index(self.obj), index)
+        logging.debug("✅ TEST PASSED: test_cached_until_invalidated")
+
+    def test_node_id_write_invalidates(self):
+        self.assertEqual(self.manager.get_node_index(self.obj).node_index("n2"), 2)
+        j.set_node_id(self.obj, 2, "renamed")
+        index = self.manager.get_node_index(self.obj)
+        self.assertEqual(index.node_index("n2"), -1)
+        self.assertEqual(index.node_index("renamed"), 2)
+        logging.debug("✅ TEST PASSED: test_node_id_write_invalidates")
+
+    def test_element_count_change_invalidates(self):
+        index = self.manager.get_node_index(self.obj)
+        self.obj.data.vertices.add(1)
+        self.assertIsNot(self.manager.get_node_index(self.obj), index)
+        logging.debug("✅ TEST PASSED: test_element_count_change_invalidates")
+
+    def test_invalidate_sources_keeps_element_tables(self):
+        index = self.manager.get_element_index(self.obj)
+        self.manager.get_source_index(self.obj)
+        self.manager.invalidate_sources(self.obj)
+        self.assertEqual(index.source_paths, {})
+        self.assertIs(self.manager.get_element_index(self.obj), index)
+        logging.debug("✅ TEST PASSED: test_invalidate_sources_keeps_element_tables")
+
+    def tearDown(self):
+        self.manager.invalidate(self.obj)
+        mesh = self.obj.data
+        bpy.data.objects.remove(self.obj)
+        bpy.data.meshes.remove(mesh)
+
+def run_tests():
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestJbeamElementIndex)
+    unittest.TextTestRunner().run(suite)
+
+run_tests()
@@ -0,0 +1,92 @@
+import bpy
+import os
+import json
+import difflib
+import unittest
+import logging
+
+from unofficial_jbeam_editor.utils.jbeam.jbeam_helper import PreJbeamStructureHelper, RedundancyReducerJbeamGenerator
+from unofficial_jbeam_editor.utils.jbeam.jbeam_props_storage import JbeamPropsStorageManager
+from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamUtils as j
+
+# NOTE: The golden file holds the nodes, beams and triangles lists the exporter writes for the mesh below.
+# Set UPDATE_GOLDEN to True and run once only when an export format change is intended.
+GOLDEN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "export_golden.txt")
+UPDATE_GOLDEN = False
+
+NODE_IDS = ["fl1", "fr1", "rl1", "rr1", "fl2", "fr2", "rl2", "rr2"]
+VERTICES = [(i % 2 * 1.0, (i // 2) % 2 * 0.5, (i // 4) * 0.25) for i in range(8)]
+EDGES = [(0, 1), (1, 3), (3, 2), (2, 0), (4, 5), (5, 7), (7, 6), (6, 4), (0, 4), (1, 5), (3, 7), (2, 6), (0, 3), (4, 7)]
+FACES = [(0, 1, 3), (0, 3, 2), (4, 5, 7), (4, 7, 6)]
+
+BASE_NODE_PROPS = {"frictionCoef": "0.7", "nodeMaterial": "\"|NM_METAL\"", "nodeWeight": "1.5", "collision": "true", "selfCollision": "false", "group": "[\"box_base\"]"}
+TOP_NODE_PROPS = {"frictionCoef": "0.7", "nodeMaterial": "\"|NM_RUBBER\"", "nodeWeight": "2", "collision": "true", "selfCollision": "true", "group": "[\"box_top\", \"box_base\"]"}
+NODE_PROPS = {i: (BASE_NODE_PROPS if i < 4 else TOP_NODE_PROPS) for i in range(8)}
+NODE_PROPS[3] = dict(BASE_NODE_PROPS, nodeWeight="3.25", fixed="true")
+
+RING_BEAM_PROPS = {"beamSpring": "801000", "beamDamp": "150", "beamDeform": "30000", "beamStrength": "\"FLT_MAX\"", "deformGroup": "\"box\""}
+SIDE_BEAM_PROPS = {"beamSpring": "601000", "beamDamp": "120", "beamType": "\"|NORMAL\"", "beamPrecompression": "1.05"}
+BEAM_PROPS = {i: [RING_BEAM_PROPS if i < 8 else SIDE_BEAM_PROPS] for i in range(len(EDGES))}
+BEAM_PROPS[12] = [RING_BEAM_PROPS, dict(SIDE_BEAM_PROPS, beamType="\"|BOUNDED\"", beamLongBound="1.1", beamShortBound="0.9")]  # two instances of the same beam
+BEAM_PROPS[13] = []
+
+TRIANGLE_PROPS = {0: [{"groundModel": "\"metal\"", "dragCoef": "10"}], 1: [{"groundModel": "\"metal\"", "dragCoef": "10"}], 2: [{"dragCoef": "5"}], 3: []}
+
+
+class TestJbeamExportGolden(unittest.TestCase):
+
+    def setUp(self):
+        mesh = bpy.data.meshes.new("jbeam_golden_test_mesh")
+        self.obj = bpy.data.objects.new("jbeam_golden_test_object", mesh)
+        bpy.context.collection.objects.link(self.obj)
+        bpy.context.view_layer.objects.active = self.obj
+        mesh.from_pydata(VERTICES, EDGES, FACES)
+        mesh.update()
+        JbeamPropsStorageManager.get_instance().register_object(self.obj)
+        j.create_node_mesh_attributes(self.obj)
+
+        for i, node_id in enumerate(NODE_IDS):
+            j.set_node_id(self.obj, i, node_id)
+            j.set_node_props(self.obj, i, NODE_PROPS[i])
+        for i, instances in BEAM_PROPS.items():
+            for instance, props in enumerate(instances, start=1):
+                j.set_beam_props(self.obj, i, props, instance)
+        for i, instances in TRIANGLE_PROPS.items():
+            for instance, props in enumerate(instances, start=1):
+                j.set_triangle_props(self.obj, i, props, instance)
+
+    def export_lists(self) -> str:
+        text = ""
+        for key, domain in (("nodes", "vertex"), ("beams", "edge"), ("triangles", "face")):
+            data = PreJbeamStructureHelper(self.obj, domain=domain).structure_data()
+            items = RedundancyReducerJbeamGenerator(self.obj, data, domain=domain).reduce_redundancy()
+            text += f"{key}:\n" + "".join(json.dumps(item) + "\n" for item in items)
+        return text
+
+    def test_export_matches_golden_file(self):
+        actual = self.export_lists()
+        if UPDATE_GOLDEN:
+            with open(GOLDEN_FILE, "w", encoding="utf-8", newline="\n") as f:
+                f.write(actual)
+            logging.debug(f"📝 Golden file updated: {GOLDEN_FILE}")
+
+        with open(GOLDEN_FILE, "r", encoding="utf-8", newline="\n") as f:
+            expected = f.read()
+
+        diff_list = list(difflib.unified_diff(expected.splitlines(), actual.splitlines(), fromfile="Golden", tofile="Actual", lineterm=""))
+        if diff_list:
+            logging.debug("❌ TEST FAILED: test_export_matches_golden_file\n")
+            logging.debug("🔍 Differences:")
+            logging.debug("\n".join(diff_list))
+
+        self.assertEqual(expected, actual, "Export output differs from the golden file")
+        logging.debug("✅ TEST PASSED: test_export_matches_golden_file")
+
+    def tearDown(self):
+        bpy.data.objects.remove(self.obj)
+
+def run_tests():
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestJbeamExportGolden)
+    unittest.TextTestRunner().run(suite)
+
+run_tests()
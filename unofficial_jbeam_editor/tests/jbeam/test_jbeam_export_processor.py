@@ -0,0 +1,134 @@
+import unittest
+import logging
+
+from unofficial_jbeam_editor.core.jbeam_file_helper import JbeamFileHelper
+from unofficial_jbeam_editor.core.jbeam_emitter import JbeamEmitter
+from unofficial_jbeam_editor.core.jbeam_export_processor import JbeamExportProcessor
+
+# NOTE: The core package has no bpy dependency, so this test also runs outside of Blender with the repository root on PYTHONPATH.
+
+NODES_HEADER = '["id", "posX", "posY", "posZ"],'
+BEAMS_HEADER = '["id1:","id2:"],'
+
+JBEAM_TEXT = """{
+    // parts: "a" ] } [ {
+    "part_a": {
+        "information": {"name": "A [front] {1}", "value": "quote \\" ] }"},
+        "slotType": "a",
+        "nodes": [
+            ["id", "posX", "posY", "posZ"],
+            /* removed: ["a9", 9, 9, 9], ] */
+            {"group": "[x]"},
+            ["a1", 0, 0, 0],
+            ["a2", 1, 0, 0], // last node ]
+        ],
+        "beams": [
+            ["id1:", "id2:"],
+            ["a1", "a2"],
+        ],
+    },
+    "part_b": {
+        "slotType": "b",
+        "nodes": [
+            ["id", "posX", "posY", "posZ"],
+            ["b1", 0, 1, 0],
+            ["b2", 1, 1, 0],
+        ],
+        "beams": [
+            ["id1:", "id2:"],
+            ["b1", "b2"],
+        ],
+        "triangles": [
+            ["id1:", "id2:", "id3:"],
+        ],
+    },
+}
+"""
+
+
+class TestJbeamExportProcessor(unittest.TestCase):
+
+    def decode(self, text) -> dict:
+        return JbeamFileHelper.decode(text)  # no comma fixing, it would rewrite the brackets inside the strings
+
+    def test_sections_found_per_part(self):
+        spans = JbeamExportProcessor(JBEAM_TEXT).find_part_sections(("nodes", "beams", "triangles"))
+        self.assertEqual({part: [span[0] for span in part_spans] for part, part_spans in spans.items()},
+                         {"part_a": ["nodes", "beams"], "part_b": ["nodes", "beams", "triangles"]})
+        for part_spans in spans.values():
+            for key, key_end, section_end, indent in part_spans:
+                self.assertEqual(JBEAM_TEXT[section_end - 1], "]")
+                self.assertEqual(indent, " " * 8)
+        logging.debug("✅ TEST PASSED: test_sections_found_per_part")
+
+    def test_replace_only_touches_given_part(self):
+        processor = JbeamExportProcessor(JBEAM_TEXT)
+        rows = [["b1", 0, 2, 0], ["b2", 1, 2, 0]]
+        result = processor.replace_sections({"nodes": JbeamEmitter.format_list(rows, NODES_HEADER, False)}, "part_b")
+        self.assertEqual(processor.changed_sections, ["nodes"])
+        data = self.decode(result)
+        self.assertEqual(data["part_b"]["nodes"][1:], rows)
+        self.assertEqual(data["part_a"], self.decode(JBEAM_TEXT)["part_a"])
+        part_a_end = JBEAM_TEXT.index('"part_b"')
+        self.assertEqual(result[:part_a_end], JBEAM_TEXT[:part_a_end])
+        logging.debug("✅ TEST PASSED: test_replace_only_touches_given_part")
+
+    def test_brackets_in_strings_and_comments_kept(self):
+        processor = JbeamExportProcessor(JBEAM_TEXT)
+        result = processor.replace_sections({"beams": JbeamEmitter.format_list([["a2", "a1"]], BEAMS_HEADER, False)}, "part_a")
+        for text in ('// parts: "a" ] } [ {', '"A [front] {1}"', '"quote \\" ] }"', "/* removed: [\"a9\", 9, 9, 9], ] */", "// last node ]"):
+            self.assertIn(text, result)
+        data = self.decode(result)
+        self.assertEqual(data["part_a"]["beams"][1:], [["a2", "a1"]])
+        self.assertEqual(data["part_b"]["beams"][1:], [["b1", "b2"]])
+        logging.debug("✅ TEST PASSED: test_brackets_in_strings_and_comments_kept")
+
+    def test_multiple_sections_spliced_in_one_pass(self):
+        processor = JbeamExportProcessor(JBEAM_TEXT)
+        sections = {
+            "nodes": JbeamEmitter.format_list([["b1", 0, 1, 0], ["b3", 2, 1, 0]], NODES_HEADER, False),
+            "beams": JbeamEmitter.format_list([["b1", "b3"]], BEAMS_HEADER, False),
+            "triangles": JbeamEmitter.format_list([], '["id1:","id2:","id3:"],', False),
+        }
+        result = processor.replace_sections(sections, "part_b")
+        self.assertEqual(processor.changed_sections, ["nodes", "beams", "triangles"])
+        part_b = self.decode(result)["part_b"]
+        self.assertEqual(part_b["nodes"][1:], [["b1", 0, 1, 0], ["b3", 2, 1, 0]])
+        self.assertEqual(part_b["beams"][1:], [["b1", "b3"]])
+        self.assertEqual(part_b["triangles"], [["id1:", "id2:", "id3:"]])
+
+        processor.replace_sections(sections, "part_b")
+        self.assertEqual(processor.changed_sections, [])  # same contents again
+        self.assertEqual(processor.get_result(), result)
+        logging.debug("✅ TEST PASSED: test_multiple_sections_spliced_in_one_pass")
+
+    def test_single_row_sections(self):
+        text = '{"part_c": {"slotType": "c", "nodes": [], "beams": [ ["id1:", "id2:"] ], "slots": ["x", "y"]}}'
+        processor = JbeamExportProcessor(text)
+        self.assertEqual([span[0] for span in processor.find_part_sections(("nodes", "beams", "slots"))["part_c"]], ["nodes", "beams", "slots"])
+        result = processor.replace_sections({"nodes": JbeamEmitter.format_list([["c1", 0, 0, 0]], NODES_HEADER, False)}, "part_c")
+        data = self.decode(result)
+        self.assertEqual(data["part_c"]["nodes"], [["id", "posX", "posY", "posZ"], ["c1", 0, 0, 0]])
+        self.assertEqual(data["part_c"]["slots"], ["x", "y"])
+        logging.debug("✅ TEST PASSED: test_single_row_sections")
+
+    def test_match_part(self):
+        processor = JbeamExportProcessor(JBEAM_TEXT)
+        self.assertEqual(processor.match_part({"b1", "b2", "a1"}), "part_b")
+        self.assertEqual(processor.match_part({"a1"}), "part_a")
+        self.assertIsNone(processor.match_part({"x1"}))  # two parts have nodes, none lists x1
+        logging.debug("✅ TEST PASSED: test_match_part")
+
+    def test_unknown_part_replaces_all_parts(self):
+        processor = JbeamExportProcessor(JBEAM_TEXT)
+        processor.replace_sections({"beams": JbeamEmitter.format_list([["n1", "n2"]], BEAMS_HEADER, False)}, "missing_part")
+        data = self.decode(processor.get_result())
+        self.assertEqual(processor.changed_sections, ["beams", "beams"])
+        self.assertEqual([data[part]["beams"][1:] for part in ("part_a", "part_b")], [[["n1", "n2"]]] * 2)
+        logging.debug("✅ TEST PASSED: test_unknown_part_replaces_all_parts")
+
+def run_tests():
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestJbeamExportProcessor)
+    unittest.TextTestRunner().run(suite)
+
+run_tests()
@@ -0,0 +1,80 @@
+import bpy
+import unittest
+import logging
+
+from unofficial_jbeam_editor.utils.jbeam.jbeam_mesh_validator import JbeamMeshValidator as v, JbeamValidationReport
+from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamRefnodeUtils as jr
+
+# NOTE: Runs inside Blender, e.g. blender --background --python unofficial_jbeam_editor/tests/jbeam/test_jbeam_mesh_validator.py
+
+NODE_IDS = ["n0", "n1", "n2", "n3"]
+POSITIONS = [(0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 0)]
+
+
+class TestJbeamMeshValidator(unittest.TestCase):
+
+    def setUp(self):
+        self.report = JbeamValidationReport()
+
+    def test_valid_mesh_has_no_problems(self):
+        v._check_node_ids(self.report, NODE_IDS)
+        v._check_refnodes(self.report, NODE_IDS, [jr.RefNode.REF.value, jr.RefNode.UP.value, 0, 0])
+        v._check_beams(self.report, NODE_IDS, POSITIONS, [(0, 1), (1, 2), (2, 3)], [(0, 1, 2)], {})
+        v._check_faces(self.report, NODE_IDS, POSITIONS, [(0, 1, 2)])
+        self.assertTrue(self.report.is_valid)
+        self.assertEqual(self.report.warnings, [])
+        logging.debug("✅ TEST PASSED: test_valid_mesh_has_no_problems")
+
+    def test_empty_and_duplicate_node_ids(self):
+        v._check_node_ids(self.report, ["n0", " ", "n0", "n1"])
+        self.assertFalse(self.report.is_valid)
+        self.assertEqual(self.report.errors, ["Nodes with an empty name (1): index 1", "Duplicate node names (1): 'n0'"])
+        logging.debug("✅ TEST PASSED: test_empty_and_duplicate_node_ids")
+
+    def test_duplicate_refnodes(self):
+        v._check_refnodes(self.report, NODE_IDS, [jr.RefNode.REF.value, jr.RefNode.REF.value, jr.RefNode.UP.value, 0])
+        self.assertEqual(len(self.report.errors), 1)
+        self.assertIn("REF", self.report.errors[0])
+        self.assertTrue(self.report.errors[0].endswith("(2): n0, n1"))
+        logging.debug("✅ TEST PASSED: test_duplicate_refnodes")
+
+    def test_ngons_are_errors(self):
+        v._check_faces(self.report, NODE_IDS, POSITIONS, [(0, 1, 3, 2)])
+        self.assertEqual(len(self.report.errors), 1)
+        self.assertTrue(self.report.errors[0].endswith("(1): [n0, n1, n3, n2]"))
+        logging.debug("✅ TEST PASSED: test_ngons_are_errors")
+
+    def test_degenerate_triangles(self):
+        positions = [(0, 0, 0), (1, 0, 0), (2, 0, 0), (1, 1, 0)]  # n0, n1 and n2 lie on one line
+        v._check_faces(self.report, NODE_IDS, positions, [(0, 1, 2), (0, 1, 3)])
+        self.assertTrue(self.report.is_valid)
+        self.assertEqual(self.report.warnings, ["Degenerate triangles (1): [n0, n1, n2]"])
+        logging.debug("✅ TEST PASSED: test_degenerate_triangles")
+
+    def test_zero_length_duplicate_beams_and_orphan_nodes(self):
+        positions = [(0, 0, 0), (0, 0, 0), (0, 1, 0), (1, 1, 0)]  # n1 sits on n0
+        v._check_beams(self.report, NODE_IDS, positions, [(0, 1), (0, 2), (2, 0)], [], {("n0", "n2"): [1, 2]})
+        self.assertTrue(self.report.is_valid)
+        self.assertEqual(self.report.warnings, [
+            "Zero-length beams (1): [n0, n1]",
+            "Duplicate beams (1): [n0, n2]",
+            "Nodes not used by any beam or triangle (1): n3",
+        ])
+        logging.debug("✅ TEST PASSED: test_zero_length_duplicate_beams_and_orphan_nodes")
+
+    def test_nodes_used_by_triangles_are_not_orphans(self):
+        v._check_beams(self.report, NODE_IDS, POSITIONS, [(0, 1)], [(1, 2, 3)], {})
+        self.assertEqual(self.report.warnings, [])
+        logging.debug("✅ TEST PASSED: test_nodes_used_by_triangles_are_not_orphans")
+
+    def test_long_lists_are_summarized(self):
+        node_ids = [f"n{i}" for i in range(8)]
+        v._check_beams(self.report, node_ids, [(i, 0, 0) for i in range(8)], [], [], {})
+        self.assertEqual(self.report.warnings, ["Nodes not used by any beam or triangle (8): n0, n1, n2, n3, n4 (+3 more)"])
+        logging.debug("✅ TEST PASSED: test_long_lists_are_summarized")
+
+def run_tests():
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestJbeamMeshValidator)
+    unittest.TextTestRunner().run(suite)
+
+run_tests()
@@ -0,0 +1,93 @@
+import bpy
+import json
+import unittest
+import logging
+
+from unofficial_jbeam_editor.utils.jbeam.jbeam_props_storage import JbeamPropsStorageManager
+from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamUtils as j
+
+# NOTE: Runs inside Blender, e.g. blender --background --python unofficial_jbeam_editor/tests/jbeam/test_jbeam_props_sweep.py
+
+
+class TestJbeamPropsSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.objects = []
+        self.obj = self.create_node_mesh("jbeam_sweep_test_object")
+        self.storage = JbeamPropsStorageManager.get_instance().get_props_storage(self.obj)
+        j.set_node_props(self.obj, 0, {"nodeWeight": 1.5})
+        j.set_beam_props(self.obj, 0, {"beamSpring": 1000})
+        j.set_triangle_props(self.obj, 0, {"dragCoef": 10})
+        self.live = {domain: set(self.storage.storage[domain]) for domain in ("verts", "edges", "faces")}
+        self.orphans = {domain: self.storage.store_props(domain, None, {"unused": 1}) for domain in self.live}  # referenced by no element
+
+    def create_node_mesh(self, name):
+        mesh = bpy.data.meshes.new(f"{name}_mesh")
+        mesh.from_pydata([(0, 0, 0), (1, 0, 0), (0, 1, 0)], [(0, 1), (1, 2), (2, 0)], [(0, 1, 2)])
+        mesh.update()
+        obj = bpy.data.objects.new(name, mesh)
+        bpy.context.collection.objects.link(obj)
+        bpy.context.view_layer.objects.active = obj
+        JbeamPropsStorageManager.get_instance().register_object(obj)
+        j.create_node_mesh_attributes(obj)
+        self.objects.append(obj)
+        return obj
+
+    def test_orphans_removed_live_keys_kept(self):
+        entries, _ = j.collect_orphaned_props(self.obj)
+        self.assertEqual(entries, 3)
+        for domain, keys in self.live.items():
+            self.assertEqual(set(self.storage.storage[domain]), keys)
+        logging.debug("✅ TEST PASSED: test_orphans_removed_live_keys_kept")
+
+    def test_missing_attribute_keeps_domain(self):
+        self.obj.data.attributes.remove(self.obj.data.attributes[j.ATTR_TRIANGLE_PROPS])
+        j.collect_orphaned_props(self.obj)
+        self.assertIn(self.orphans["faces"], self.storage.storage["faces"])
+        self.assertNotIn(self.orphans["verts"], self.storage.storage["verts"])
+        logging.debug("✅ TEST PASSED: test_missing_attribute_keeps_domain")
+
+    def test_unreadable_mode_skips_object(self):
+        bpy.ops.object.mode_set(mode='SCULPT')
+        try:
+            self.assertEqual(j.collect_orphaned_props(self.obj), (0, 0))
+        finally:
+            bpy.ops.object.mode_set(mode='OBJECT')
+        for domain, key in self.orphans.items():
+            self.assertIn(key, self.storage.storage[domain])
+        logging.debug("✅ TEST PASSED: test_unreadable_mode_skips_object")
+
+    def test_duplicates_share_live_keys(self):
+        duplicate = self.obj.copy()
+        duplicate.data = self.obj.data.copy()
+        bpy.context.collection.objects.link(duplicate)
+        self.objects.append(duplicate)
+        j.set_node_props(duplicate, 1, {"nodeWeight": 7})  # new key that only the duplicate references
+        duplicate_key = j.get_attribute_value(duplicate, 1, j.ATTR_NODE_PROPS, "verts")
+
+        j.collect_orphaned_props(self.obj)
+        self.assertIn(duplicate_key, self.storage.storage["verts"])
+        self.assertNotIn(self.orphans["verts"], self.storage.storage["verts"])
+        logging.debug("✅ TEST PASSED: test_duplicates_share_live_keys")
+
+    def test_save_leaves_orphans_in_memory(self):
+        self.assertGreaterEqual(j.save_all_jbeam_props_to_mesh(), 3)
+        saved = json.loads(self.obj[self.storage.SAVED_JBEAM_PROPS])
+        for domain, key in self.orphans.items():
+            self.assertNotIn(key, saved[domain])
+            self.assertIn(key, self.storage.storage[domain])  # an undo after the save can bring its element back
+        for domain, keys in self.live.items():
+            self.assertEqual(set(saved[domain]), keys)
+        logging.debug("✅ TEST PASSED: test_save_leaves_orphans_in_memory")
+
+    def tearDown(self):
+        for obj in self.objects:
+            mesh = obj.data
+            bpy.data.objects.remove(obj)
+            bpy.data.meshes.remove(mesh)
+
+def run_tests():
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestJbeamPropsSweep)
+    unittest.TextTestRunner().run(suite)
+
+run_tests()
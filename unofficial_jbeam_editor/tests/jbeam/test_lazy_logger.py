@@ -0,0 +1,52 @@
+import unittest
+import logging
+
+from unofficial_jbeam_editor.core.lazy_logger import LazyLogger
+
+# NOTE: Runs outside of Blender with the repository root on PYTHONPATH.
+
+
+class FormatCounter:
+    formatted = 0
+
+    def __str__(self):
+        FormatCounter.formatted += 1
+        return "node"
+
+
+class TestLazyLogger(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = logging.getLogger("unofficial_jbeam_editor.test_lazy_logger")
+        FormatCounter.formatted = 0
+
+    def test_disabled_level_formats_nothing(self):
+        self.logger.setLevel(logging.CRITICAL)
+        with LazyLogger(logger=self.logger) as log:
+            self.assertFalse(log.enabled)
+            for _ in range(1000):
+                log.count("Duplicate node '%s'", FormatCounter())
+                log.log("Node '%s'", FormatCounter())
+        self.assertEqual(FormatCounter.formatted, 0)
+        logging.debug("✅ TEST PASSED: test_disabled_level_formats_nothing")
+
+    def test_repeated_messages_are_summarized(self):
+        self.logger.setLevel(logging.DEBUG)
+        with self.assertLogs(self.logger, level="DEBUG") as logs:
+            with LazyLogger(logger=self.logger, max_examples=2) as log:
+                for i in range(10):
+                    log.count("Duplicate node '%s'", i)
+                self.assertEqual(log.total("Duplicate node '%s'"), 10)
+        self.assertEqual(logs.output, [
+            "DEBUG:unofficial_jbeam_editor.test_lazy_logger:Duplicate node '0'",
+            "DEBUG:unofficial_jbeam_editor.test_lazy_logger:Duplicate node '1'",
+            "DEBUG:unofficial_jbeam_editor.test_lazy_logger:    ... 8 more like this omitted (10 in total)",
+        ])
+        self.assertEqual(FormatCounter.formatted, 0)
+        logging.debug("✅ TEST PASSED: test_repeated_messages_are_summarized")
+
+def run_tests():
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestLazyLogger)
+    unittest.TextTestRunner().run(suite)
+
+run_tests()
@@ -0,0 +1,52 @@
+import random
+import unittest
+import logging
+
+from unofficial_jbeam_editor.core.jbeam_structure import ScopeModifierOrderOptimizer
+
+# NOTE: Runs outside of Blender with the repository root on PYTHONPATH.
+PROP_VALUES = {
+    "nodeWeight": [1.5, 3, 25],
+    "collision": ["true", "false"],
+    "group": [["body"], ["body", "door"], ""],
+    "nodeMaterial": ["|NM_METAL", "|NM_RUBBER"],
+}
+
+
+class TestScopeModifierOrderOptimizer(unittest.TestCase):
+
+    @staticmethod
+    def random_data(rng, count, missing_rate=0.0) -> dict:
+        data = {}
+        for i in range(count):
+            data[str(i)] = {key: rng.choice(values) for key, values in PROP_VALUES.items() if rng.random() >= missing_rate}
+        return data
+
+    def assert_order(self, data):
+        items = list(data.keys())
+        order = ScopeModifierOrderOptimizer.optimize(data)
+        self.assertEqual(sorted(order), sorted(items))
+        self.assertEqual(len(order), len(items))
+        self.assertLessEqual(ScopeModifierOrderOptimizer.count_modifier_rows(data, order), ScopeModifierOrderOptimizer.count_modifier_rows(data, items))
+        return order
+
+    def test_never_more_rows_and_keeps_every_element(self):
+        rng = random.Random(0)
+        for count in (0, 1, 2, 5, 40, 300):
+            for missing_rate in (0.0, 0.3):
+                self.assert_order(self.random_data(rng, count, missing_rate))
+        logging.debug("✅ TEST PASSED: test_never_more_rows_and_keeps_every_element")
+
+    def test_interleaved_groups_are_merged(self):
+        a = {"nodeWeight": 1.5, "collision": "true"}
+        b = {"nodeWeight": 3, "collision": "false"}
+        data = {str(i): dict(a if i % 2 else b) for i in range(20)}
+        order = self.assert_order(data)
+        self.assertLess(ScopeModifierOrderOptimizer.count_modifier_rows(data, order), ScopeModifierOrderOptimizer.count_modifier_rows(data, list(data)))
+        logging.debug("✅ TEST PASSED: test_interleaved_groups_are_merged")
+
+def run_tests():
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestScopeModifierOrderOptimizer)
+    unittest.TextTestRunner().run(suite)
+
+run_tests()
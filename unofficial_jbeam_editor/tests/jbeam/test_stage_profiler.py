@@ -0,0 +1,55 @@
+import os
+import json
+import unittest
+import logging
+
+from unofficial_jbeam_editor.core.stage_profiler import StageProfiler, PROFILE_LOGGER
+from unofficial_jbeam_editor.core.jbeam_file_helper import JbeamFileHelper
+from unofficial_jbeam_editor.core.jbeam_parser import JbeamParser
+from unofficial_jbeam_editor.core.jbeam_models import JbeamLoadItem
+
+# NOTE: Runs outside of Blender with the repository root on PYTHONPATH.
+TEST_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "test_data", "test.jbeam")
+
+
+class TestStageProfiler(unittest.TestCase):
+
+    def parse_test_file(self):
+        with open(TEST_FILE, "r", encoding="utf-8") as f:
+            data = JbeamFileHelper.decode(JbeamFileHelper.attempt_fix_jbeam_commas(f.read()))
+        parser = JbeamParser(JbeamLoadItem(TEST_FILE))
+        parser.parse(data)
+        return parser
+
+    def test_no_session_records_nothing(self):
+        self.parse_test_file()
+        StageProfiler.count("nodes")
+        self.assertIsNone(StageProfiler.active())
+        logging.debug("✅ TEST PASSED: test_no_session_records_nothing")
+
+    def test_session_stages_and_json_line(self):
+        finished = []
+        with self.assertLogs(PROFILE_LOGGER, level="INFO") as logs:
+            with StageProfiler.session("Import test.jbeam", on_finish=finished.append) as session:
+                with StageProfiler.session("Nested import") as nested:  # records into the outer session
+                    self.assertIs(nested, session)
+                    parser = self.parse_test_file()
+        self.assertEqual(finished, [session])
+        self.assertIsNone(StageProfiler.active())
+        self.assertEqual(session.counters["nodes"], len(parser.get_jbeam_part().nodes_list))
+        self.assertEqual(session.stages["parse.nodes"][1], len(parser.get_jbeam_parts()))
+
+        self.assertEqual(len(logs.records), 1)
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record["event"], "profile")
+        self.assertEqual(record["operation"], "Import test.jbeam")
+        self.assertEqual(record["counters"], session.counters)
+        self.assertIn("parse.nodes", record["stages"])
+        self.assertIn("parse.nodes", session.popup_message().split("|")[1])
+        logging.debug("✅ TEST PASSED: test_session_stages_and_json_line")
+
+def run_tests():
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestStageProfiler)
+    unittest.TextTestRunner().run(suite)
+
+run_tests()
@@ -18,6 +18,11 @@ def on_property_update(self, _: bpy.types.Context, sample_type: str) -> None:
     logging.debug(f"on_property_update: {self}::{sample_type}")
     on_addon_preferences_change()
 
+def on_feature_group_update(self, context: bpy.types.Context, sample_type: str) -> None:
+    from unofficial_jbeam_editor.utils.devtools_register import DevToolsRegister  # imports the operators, which import these preferences
+    DevToolsRegister.update_feature_groups()
+    on_property_update(self, context, sample_type)
+
 class PREFERENCES_OT_CheckCheckboxesOperator(bpy.types.Operator):
     bl_idname = "preferences.dev_tools_check_checkboxes"
     bl_label = "Check All"
@@ -63,25 +68,55 @@ class MyAddonPreferences(bpy.types.AddonPreferences):
         update=lambda self, context: on_property_update(self, context, "import_warnings")
     ) # type: ignore
 
+    props_warm_up: bpy.props.BoolProperty(
+        name="Restore JBeam Props in Background",
+        description="After opening a file, restore the saved JBeam props of node meshes in the background instead of on first access",
+        default=True,
+        update=lambda self, context: on_property_update(self, context, "props_warm_up")
+    ) # type: ignore
+
+    export_optimize_order: bpy.props.BoolProperty(
+        name="Optimize Scope Modifier Order",
+        description="On export, order nodes, beams and triangles so that as few scope modifier rows as possible are written. This changes the element order of the written files",
+        default=False,
+        update=lambda self, context: on_property_update(self, context, "export_optimize_order")
+    ) # type: ignore
+
+    export_position_precision: bpy.props.IntProperty(
+        name="Node Position Decimals",
+        description="Number of decimal places of the node positions written on export",
+        default=2,
+        min=1,
+        max=9,
+        update=lambda self, context: on_property_update(self, context, "export_position_precision")
+    ) # type: ignore
+
+    show_profile_popup: bpy.props.BoolProperty(
+        name="Show Performance Breakdown",
+        description="After an import or export, show the time per stage, element counts and cache hits in a popup. The breakdown is always written to app.log",
+        default=True,
+        update=lambda self, context: on_property_update(self, context, "show_profile_popup")
+    ) # type: ignore
+
     armature_options: bpy.props.BoolProperty(
         name="Show Armature Options",
         default=False,
-        update=lambda self, context: on_property_update(self, context, "armature")
+        update=lambda self, context: on_feature_group_update(self, context, "armature")
     ) # type: ignore
 
     bake_options: bpy.props.BoolProperty(
         name="Show Bake Options",
         default=False,
-        update=lambda self, context: on_property_update(self, context, "bake")
+        update=lambda self, context: on_feature_group_update(self, context, "bake")
     ) # type: ignore
 
     empty_options: bpy.props.BoolProperty(
         name="Show Empty Object Options",
         default=False,
-        update=lambda self, context: on_property_update(self, context, "empty")
+        update=lambda self, context: on_feature_group_update(self, context, "empty")
     ) # type: ignore
 
-    CHECKBOXES: List[str] = ["debug_options", "use_vizualizer", "show_import_warnings", "armature_options", "bake_options", "empty_options"]
+    CHECKBOXES: List[str] = ["debug_options", "use_vizualizer", "show_import_warnings", "props_warm_up", "export_optimize_order", "show_profile_popup", "armature_options", "bake_options", "empty_options"]
 
     def set_checkbox(self, prop_name: str, value: bool) -> None:
         if getattr(self, prop_name) != value:
@@ -108,12 +143,16 @@ class MyAddonPreferences(bpy.types.AddonPreferences):
         box = layout.box()
         for checkbox in self.CHECKBOXES:
             box.prop(self, checkbox)
+        box.prop(self, "export_position_precision")
+
+    @staticmethod
+    def get_addon_option(option, default=None):
+        addon = bpy.context.preferences.addons.get(Utils.get_addon_module_name())
+        return getattr(addon.preferences, option, default) if addon else default
 
     @staticmethod
     def is_addon_option_enabled(option):
-        addon_name = Utils.get_addon_module_name()
-        prefs = bpy.context.preferences.addons.get(addon_name).preferences
-        return getattr(prefs, option, False)
+        return bool(MyAddonPreferences.get_addon_option(option, False))
 
     @staticmethod
     def is_addon_visualizer_enabled():
@@ -123,6 +162,22 @@ class MyAddonPreferences(bpy.types.AddonPreferences):
     def is_warnings_enabled():
         return MyAddonPreferences.is_addon_option_enabled("show_import_warnings")
 
+    @staticmethod
+    def is_props_warm_up_enabled():
+        return MyAddonPreferences.is_addon_option_enabled("props_warm_up")
+
+    @staticmethod
+    def is_export_optimize_order_enabled():
+        return MyAddonPreferences.is_addon_option_enabled("export_optimize_order")
+
+    @staticmethod
+    def is_profile_popup_enabled():
+        return MyAddonPreferences.is_addon_option_enabled("show_profile_popup")
+
+    @staticmethod
+    def get_export_position_precision() -> int:
+        return MyAddonPreferences.get_addon_option("export_position_precision", 2)
+
 def register() -> None:
     bpy.utils.register_class(MyAddonPreferences)
     bpy.utils.register_class(PREFERENCES_OT_CheckCheckboxesOperator)
@@ -4,19 +4,8 @@ import logging
 from typing import List, Tuple
 from bpy.app.handlers import persistent
 
-from unofficial_jbeam_editor.operators.file.beamng.beamng_export_node_mesh_to_jbeam import DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeam
-from unofficial_jbeam_editor.operators.file.beamng.beamng_import_jbeam_as_node_mesh import DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportJbeamToNodeMesh
-from unofficial_jbeam_editor.operators.file.beamng.beamng_import_pc_file_as_node_meshes import DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportPcFileToNodeMeshes
-from unofficial_jbeam_editor.operators.object.armature.armature_create_bones_random_vertices_operator import OBJECT_OT_ArmatureCreateBonesRandomVertices
-from unofficial_jbeam_editor.operators.object.armature.armature_create_bones_from_edge_selection_operator import OBJECT_OT_ArmatureCreateBonesFromEdgeSelection
-from unofficial_jbeam_editor.operators.object.armature.armature_assign_closest_vertex_to_bone_tails_operator import OBJECT_OT_ArmatureAssignClosestVertexToBoneTails
-from unofficial_jbeam_editor.operators.object.bake.bake_prepare_object_operator import OBJECT_OT_BakePrepareObject
-from unofficial_jbeam_editor.operators.object.bake.bake_generate_object_operator import OBJECT_OT_BakeGenerateObject
+from unofficial_jbeam_editor.operators.file.beamng.beamng_file_operator_stubs import DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportJbeamToNodeMeshStub, DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportPcFileToNodeMeshesStub, DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeamStub, DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeamSourcesStub
 from unofficial_jbeam_editor.operators.object.beamng.utils.beamng_jbeam_print_attributes_operators import OBJECT_OT_BeamngPrintJbeamNodeProps,  OBJECT_OT_BeamngPrintJbeamBeamProps, OBJECT_OT_BeamngPrintJbeamTriangleProps
-from unofficial_jbeam_editor.operators.object.beamng.beamng_create_empties_base_operator import OBJECT_OT_BeamngCreateEmptiesBase
-from unofficial_jbeam_editor.operators.object.beamng.beamng_create_metaball_cloud_operator import OBJECT_OT_BeamngCreateMetaBallCloud
-from unofficial_jbeam_editor.operators.object.beamng.beamng_parent_to_start01_empty_operator import OBJECT_OT_BeamngParentToStart01Empty, OBJECT_OT_BeamngClearChildrenStart01Empty
-from unofficial_jbeam_editor.operators.object.beamng.beamng_parent_to_start01_empty_operator import OBJECT_OT_BeamngClearChildrenStart01Empty, OBJECT_OT_BeamngParentToStart01Empty
 from unofficial_jbeam_editor.operators.object.beamng.beamng_convert_jbeam_to_node_mesh import OBJECT_OT_BeamngConvertJbeamToNodeMesh
 from unofficial_jbeam_editor.operators.object.beamng.beamng_jbeam_node_props_manager import OBJECT_OT_BeamngSaveJbeamNodeProp, OBJECT_OT_BeamngSaveJbeamBeamProp, OBJECT_OT_BeamngSaveJbeamTriangleProp, OBJECT_OT_BeamngSaveAllJbeamNodeProps, OBJECT_OT_BeamngSaveAllJbeamBeamProps, OBJECT_OT_BeamngSaveAllJbeamTriangleProps, OBJECT_OT_BeamngAddJbeamNodeProp, OBJECT_OT_BeamngAddJbeamBeamProp, OBJECT_OT_BeamngAddJbeamTriangleProp, OBJECT_OT_BeamngRemoveJbeamNodeProp, OBJECT_OT_BeamngRemoveJbeamBeamProp, OBJECT_OT_BeamngRemoveJbeamTriangleProp, OBJECT_OT_BeamngSelectJbeamNodesByProperty, OBJECT_OT_BeamngSelectJbeamBeamsByProperty, OBJECT_OT_BeamngSelectJbeamTrianglesByProperty, JbeamStructurePropertyItem, JbeamStructure, JbeamHiddenElements
 from unofficial_jbeam_editor.operators.object.beamng.beamng_jbeam_rename_selected_nodes import OBJECT_OT_BeamngJbeamRenameSelectedNodes  # type:ignore
@@ -26,6 +15,7 @@ from unofficial_jbeam_editor.operators.object.beamng.utils.beamng_jbeam_select_e
 from unofficial_jbeam_editor.operators.object.beamng.utils.beamng_jbeam_select_element_by_jbeam_path import OBJECT_OT_BeamngJbeamSelectElementByJbeamPath
 from unofficial_jbeam_editor.operators.object.beamng.utils.beamng_jbeam_select_ref_element_operator import OBJECT_OT_BeamngJbeamSelectRefNode
 from unofficial_jbeam_editor.operators.object.beamng.utils.beamng_jbeam_save_elements_jbeam_path import OBJECT_OT_BeamngJbeamSaveElementsJbeamPath
+from unofficial_jbeam_editor.operators.object.beamng.utils.beamng_jbeam_cleanup_props_operator import OBJECT_OT_BeamngJbeamCleanupProps
 from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamRefnodeUtils as jr
 from unofficial_jbeam_editor.operators.common.ui.toggle_dynamic_button_operator import ButtonItem, ButtonItemSelector, ToggleDynamicButtonOperator, ManageDynamicButtonsOperator
 
@@ -180,9 +170,9 @@ class OBJECT_PT_devtools_addon_panel(bpy.types.Panel):
         row.label(text="Armature Options")
         if s.expanded_armature_options:
             col = layout.column()
-            col.operator(OBJECT_OT_ArmatureCreateBonesRandomVertices.bl_idname, text="Create Bones Random Vertices")
-            col.operator(OBJECT_OT_ArmatureCreateBonesFromEdgeSelection.bl_idname, text="Create Edge Bones")
-            col.operator(OBJECT_OT_ArmatureAssignClosestVertexToBoneTails.bl_idname, text="Assign Vertex to Bone Tails")
+            col.operator("object.devtools_armature_create_bones_random_vertices", text="Create Bones Random Vertices")
+            col.operator("object.devtools_armature_create_bones_from_edge_selection", text="Create Edge Bones")
+            col.operator("object.devtools_armature_assign_closest_vertex_to_bone_tails", text="Assign Vertex to Bone Tails")
 
     def draw_expanded_beamng_options(self, context, layout, obj):
         s = context.scene
@@ -199,18 +189,18 @@ class OBJECT_PT_devtools_addon_panel(bpy.types.Panel):
 
         col = layout.column()
         if a.is_addon_option_enabled("empty_options"):
-            col.operator(OBJECT_OT_BeamngCreateEmptiesBase.bl_idname, text="Create Empties")
+            col.operator("object.devtools_beamng_create_empties_base", text="Create Empties")
             row = col.row(align=True)
-            row.operator(OBJECT_OT_BeamngClearChildrenStart01Empty.bl_idname, text="Clear Empty")
+            row.operator("object.devtools_beamng_clear_children_for_empty", text="Clear Empty")
             row.separator()
-            row.operator(OBJECT_OT_BeamngParentToStart01Empty.bl_idname, text="Parent Empty")
+            row.operator("object.devtools_beamng_parent_to_start01_empty", text="Parent Empty")
             col.separator()
 
         col = col.box().column()
 
         if not context.selected_objects:
-            col.operator(DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportPcFileToNodeMeshes.bl_idname, text="Import PC File", icon="IMPORT")
-            col.operator(DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportJbeamToNodeMesh.bl_idname, text="Import JBeam File", icon="IMPORT")
+            col.operator(DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportPcFileToNodeMeshesStub.bl_idname, text="Import PC File", icon="IMPORT")
+            col.operator(DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportJbeamToNodeMeshStub.bl_idname, text="Import JBeam File", icon="IMPORT")
             col.operator(OBJECT_OT_BeamngJbeamCreateNodeMesh.bl_idname, text="Create Node Mesh", icon="OUTLINER_OB_MESH")
         elif len(context.selected_objects) == 1:
             if j.is_node_mesh(context.selected_objects[0]):
@@ -219,6 +209,7 @@ class OBJECT_PT_devtools_addon_panel(bpy.types.Panel):
                     r.operator(OBJECT_OT_BeamngPrintJbeamNodeProps.bl_idname, text="Nodes Debug", icon="CONSOLE")
                     r.operator(OBJECT_OT_BeamngPrintJbeamBeamProps.bl_idname, text="Beams Debug", icon="CONSOLE")
                     r.operator(OBJECT_OT_BeamngPrintJbeamTriangleProps.bl_idname, text="Triangles Debug", icon="CONSOLE")
+                    col.operator(OBJECT_OT_BeamngJbeamCleanupProps.bl_idname, text="Clean Up Unused Props", icon="BRUSH_DATA")
             else:
                 col.operator(OBJECT_OT_BeamngConvertJbeamToNodeMesh.bl_idname, text="Convert to Node Mesh", icon="OUTLINER_OB_MESH")
 
@@ -244,7 +235,8 @@ class OBJECT_PT_devtools_addon_panel(bpy.types.Panel):
         if msg:
             col.label(text=msg)
 
-        col.operator(DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeam.bl_idname, text="Export JBeam", icon="EXPORT")
+        col.operator(DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeamStub.bl_idname, text="Export JBeam", icon="EXPORT")
+        col.operator(DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeamSourcesStub.bl_idname, text="Export All JBeam Sources", icon="EXPORT")
 
     def draw_jbeam_editor_options(self, context, box, obj):
         s = context.scene
@@ -390,8 +382,8 @@ class OBJECT_PT_devtools_addon_panel(bpy.types.Panel):
             properties: MyPropertyGroup1 = context.scene.my_property_group_pointer
             col.prop(properties, "bake_image_resolution", text="")
             col.prop(properties, "auto_bake_pack_uv_islands", text="Auto Pack UV Islands")
-            col.operator(OBJECT_OT_BakePrepareObject.bl_idname, text="Prepare Bake")
-            col.operator(OBJECT_OT_BakeGenerateObject.bl_idname, text="Generate Bake Object")
+            col.operator("object.devtools_bake_prepare_object", text="Prepare Bake")
+            col.operator("object.devtools_bake_generate_object", text="Generate Bake Object")
             
             #col.prop(data=context.scene.render,property="fps",text="Frame Rate") # https://blender.stackexchange.com/questions/317553/how-to-exposure-render-settings-to-addon-panel/317565#317565
             #self.add_layout_gn_prop(layout, context.object.modifiers["Geometry Nodes"], "Socket_2") # https://blender.stackexchange.com/questions/317571/how-can-i-expose-geometry-nodes-properties-in-my-addon-panel/317586
@@ -1,18 +1,11 @@
 import bpy
+import logging
+import importlib
 
-from unofficial_jbeam_editor.operators.file.beamng.beamng_export_node_mesh_to_jbeam import DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeam
-from unofficial_jbeam_editor.operators.file.beamng.beamng_import_jbeam_as_node_mesh import DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportJbeamToNodeMesh
-from unofficial_jbeam_editor.operators.file.beamng.beamng_import_pc_file_as_node_meshes import DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportPcFileToNodeMeshes
+from unofficial_jbeam_editor.operators.file.beamng.beamng_file_operator_stubs import DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportJbeamToNodeMeshStub, DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportPcFileToNodeMeshesStub, DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeamStub, DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeamSourcesStub
 
+from unofficial_jbeam_editor.ui.addon_preferences import MyAddonPreferences
 from unofficial_jbeam_editor.operators.debug.operator_set_log_level import DEVTOOLS_OT_logging_level
-from unofficial_jbeam_editor.operators.object.armature.armature_create_bones_random_vertices_operator import OBJECT_OT_ArmatureCreateBonesRandomVertices
-from unofficial_jbeam_editor.operators.object.armature.armature_create_bones_from_edge_selection_operator import OBJECT_OT_ArmatureCreateBonesFromEdgeSelection
-from unofficial_jbeam_editor.operators.object.armature.armature_assign_closest_vertex_to_bone_tails_operator import OBJECT_OT_ArmatureAssignClosestVertexToBoneTails
-from unofficial_jbeam_editor.operators.object.bake.bake_prepare_object_operator import OBJECT_OT_BakePrepareObject
-from unofficial_jbeam_editor.operators.object.bake.bake_generate_object_operator import OBJECT_OT_BakeGenerateObject
-from unofficial_jbeam_editor.operators.object.beamng.beamng_create_empties_base_operator import OBJECT_OT_BeamngCreateEmptiesBase
-from unofficial_jbeam_editor.operators.object.beamng.beamng_create_metaball_cloud_operator import OBJECT_OT_BeamngCreateMetaBallCloud
-from unofficial_jbeam_editor.operators.object.beamng.beamng_parent_to_start01_empty_operator import OBJECT_OT_BeamngClearChildrenStart01Empty, OBJECT_OT_BeamngParentToStart01Empty
 from unofficial_jbeam_editor.operators.object.beamng.beamng_convert_jbeam_to_node_mesh import OBJECT_OT_BeamngConvertJbeamToNodeMesh
 from unofficial_jbeam_editor.operators.object.beamng.beamng_jbeam_node_props_manager import OBJECT_OT_BeamngLoadJbeamNodeProps, OBJECT_OT_BeamngLoadJbeamBeamProps, OBJECT_OT_BeamngLoadJbeamTriangleProps, OBJECT_OT_BeamngSaveJbeamNodeProp, OBJECT_OT_BeamngSaveJbeamBeamProp, OBJECT_OT_BeamngSaveJbeamTriangleProp, OBJECT_OT_BeamngSaveAllJbeamNodeProps, OBJECT_OT_BeamngSaveAllJbeamBeamProps, OBJECT_OT_BeamngSaveAllJbeamTriangleProps, OBJECT_OT_BeamngAddJbeamTriangleProp, OBJECT_OT_BeamngAddJbeamNodeProp, OBJECT_OT_BeamngAddJbeamBeamProp, OBJECT_OT_BeamngRemoveJbeamNodeProp, OBJECT_OT_BeamngRemoveJbeamBeamProp, OBJECT_OT_BeamngRemoveJbeamTriangleProp, OBJECT_OT_BeamngSelectJbeamNodesByProperty, OBJECT_OT_BeamngSelectJbeamBeamsByProperty, OBJECT_OT_BeamngSelectJbeamTrianglesByProperty
 from unofficial_jbeam_editor.operators.object.beamng.beamng_jbeam_rename_selected_nodes import OBJECT_OT_BeamngJbeamRenameSelectedNodes
@@ -23,26 +16,19 @@ from unofficial_jbeam_editor.operators.object.beamng.utils.beamng_jbeam_select_e
 from unofficial_jbeam_editor.operators.object.beamng.utils.beamng_jbeam_select_element_by_jbeam_path import OBJECT_OT_BeamngJbeamSelectElementByJbeamPath
 from unofficial_jbeam_editor.operators.object.beamng.utils.beamng_jbeam_select_ref_element_operator import OBJECT_OT_BeamngJbeamSelectRefNode
 from unofficial_jbeam_editor.operators.object.beamng.utils.beamng_jbeam_save_elements_jbeam_path import OBJECT_OT_BeamngJbeamSaveElementsJbeamPath
+from unofficial_jbeam_editor.operators.object.beamng.utils.beamng_jbeam_cleanup_props_operator import OBJECT_OT_BeamngJbeamCleanupProps
 
 class DevToolsRegister:
     DEVTOOLS_CLASSES = [
         DEVTOOLS_OT_logging_level,
-        OBJECT_OT_ArmatureCreateBonesRandomVertices,
-        OBJECT_OT_ArmatureAssignClosestVertexToBoneTails,
-        OBJECT_OT_ArmatureCreateBonesFromEdgeSelection,
-        OBJECT_OT_BakePrepareObject,
-        OBJECT_OT_BakeGenerateObject,
         OBJECT_OT_BeamngJbeamSelectSpecificElement,
         OBJECT_OT_BeamngJbeamSelectElementByJbeamPath,
         OBJECT_OT_BeamngJbeamSelectRefNode,
         OBJECT_OT_BeamngJbeamSaveElementsJbeamPath,
-        DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportJbeamToNodeMesh,
-        DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeam,
-        DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportPcFileToNodeMeshes,
-        OBJECT_OT_BeamngCreateEmptiesBase,
-        OBJECT_OT_BeamngCreateMetaBallCloud,
-        OBJECT_OT_BeamngParentToStart01Empty,
-        OBJECT_OT_BeamngClearChildrenStart01Empty,
+        DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportJbeamToNodeMeshStub,
+        DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeamStub,
+        DEVTOOLS_JBEAMEDITOR_EXPORT_OT_BeamngExportNodeMeshToJbeamSourcesStub,
+        DEVTOOLS_JBEAMEDITOR_IMPORT_OT_BeamngImportPcFileToNodeMeshesStub,
         OBJECT_OT_BeamngConvertJbeamToNodeMesh,
         OBJECT_OT_BeamngLoadJbeamNodeProps,
         OBJECT_OT_BeamngLoadJbeamBeamProps,
@@ -67,9 +53,31 @@ class DevToolsRegister:
         OBJECT_OT_BeamngPrintJbeamNodeProps,
         OBJECT_OT_BeamngPrintJbeamBeamProps,
         OBJECT_OT_BeamngPrintJbeamTriangleProps,
+        OBJECT_OT_BeamngJbeamCleanupProps,
         OBJECT_OT_BeamngJbeamSetRefnodeOperator
     ]
 
+    # Operators of the feature groups hidden by a preference checkbox, imported and registered only while it is ticked
+    FEATURE_GROUPS = {
+        "armature_options": [
+            "unofficial_jbeam_editor.operators.object.armature.armature_create_bones_random_vertices_operator:OBJECT_OT_ArmatureCreateBonesRandomVertices",
+            "unofficial_jbeam_editor.operators.object.armature.armature_assign_closest_vertex_to_bone_tails_operator:OBJECT_OT_ArmatureAssignClosestVertexToBoneTails",
+            "unofficial_jbeam_editor.operators.object.armature.armature_create_bones_from_edge_selection_operator:OBJECT_OT_ArmatureCreateBonesFromEdgeSelection",
+        ],
+        "bake_options": [
+            "unofficial_jbeam_editor.operators.object.bake.bake_prepare_object_operator:OBJECT_OT_BakePrepareObject",
+            "unofficial_jbeam_editor.operators.object.bake.bake_generate_object_operator:OBJECT_OT_BakeGenerateObject",
+        ],
+        "empty_options": [
+            "unofficial_jbeam_editor.operators.object.beamng.beamng_create_empties_base_operator:OBJECT_OT_BeamngCreateEmptiesBase",
+            "unofficial_jbeam_editor.operators.object.beamng.beamng_create_metaball_cloud_operator:OBJECT_OT_BeamngCreateMetaBallCloud",
+            "unofficial_jbeam_editor.operators.object.beamng.beamng_parent_to_start01_empty_operator:OBJECT_OT_BeamngParentToStart01Empty",
+            "unofficial_jbeam_editor.operators.object.beamng.beamng_parent_to_start01_empty_operator:OBJECT_OT_BeamngClearChildrenStart01Empty",
+        ],
+    }
+
+    _registered_groups: dict[str, list[type]] = {}
+
     @staticmethod
     def register():
         for cls in DevToolsRegister.DEVTOOLS_CLASSES:
@@ -77,5 +85,34 @@ class DevToolsRegister:
     
     @staticmethod
     def unregister():
+        for option in list(DevToolsRegister._registered_groups):
+            DevToolsRegister.unregister_feature_group(option)
         for cls in reversed(DevToolsRegister.DEVTOOLS_CLASSES):
             bpy.utils.unregister_class(cls)
+
+    @staticmethod
+    def update_feature_groups():
+        """Register the feature groups whose preference is ticked and unregister the others. Call after the preferences are registered"""
+        for option in DevToolsRegister.FEATURE_GROUPS:
+            if MyAddonPreferences.is_addon_option_enabled(option):
+                DevToolsRegister.register_feature_group(option)
+            else:
+                DevToolsRegister.unregister_feature_group(option)
+
+    @staticmethod
+    def register_feature_group(option):
+        if option in DevToolsRegister._registered_groups:
+            return
+        classes = []
+        for path in DevToolsRegister.FEATURE_GROUPS[option]:
+            module_name, class_name = path.split(":")
+            cls = getattr(importlib.import_module(module_name), class_name)
+            bpy.utils.register_class(cls)
+            classes.append(cls)
+        DevToolsRegister._registered_groups[option] = classes
+        logging.debug("📦 Registered %d operators of '%s'", len(classes), option)
+
+    @staticmethod
+    def unregister_feature_group(option):
+        for cls in reversed(DevToolsRegister._registered_groups.pop(option, [])):
+            bpy.utils.unregister_class(cls)
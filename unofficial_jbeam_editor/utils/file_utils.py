@@ -3,6 +3,12 @@ import os
 import platform
 import shutil
 import logging
+import tempfile
+
+from contextlib import contextmanager
+
+UMASK = os.umask(0)  # the umask can only be read by setting it, so it is read once at import rather than while files are written from threads
+os.umask(UMASK)
 
 class FileUtils:
 
@@ -54,6 +60,25 @@ class FileUtils:
         parent_dir = os.path.dirname(norm_path)  # Get the parent directory of the leaf file
         return os.path.isdir(parent_dir)  # Check if the parent directory exists
 
+    @staticmethod
+    @contextmanager
+    def atomic_write(filepath, encoding="utf-8"):
+        """Yields a text stream to a temporary file next to filepath, which replaces filepath once the block succeeds.
+        Readers never see a partially written file and the original is kept if writing fails."""
+        fd, tmp_path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=os.path.dirname(os.path.abspath(filepath)))
+        try:
+            with os.fdopen(fd, "w", encoding=encoding) as f:
+                yield f
+            if os.path.exists(filepath):
+                shutil.copymode(filepath, tmp_path)
+            else:
+                os.chmod(tmp_path, 0o666 & ~UMASK)  # mkstemp creates the file owner-only
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
     @staticmethod
     def get_file_extension(file_path: str) -> str:
         return os.path.splitext(file_path)[1][1:].lower()
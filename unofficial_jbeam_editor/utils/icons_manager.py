@@ -54,10 +54,13 @@ class IconsManager:
         return icon_value
 
     def get_icon_id(self, icon_name):
+        self.init()  # previews are loaded on first use rather than at addon enable
         icon_value = self.icons_dict[icon_name].icon_id
         return icon_value
 
     def cleanup(self) -> None:
+        if self.icons_dict is None:
+            return
         bpy.utils.previews.remove(self.icons_dict)
         self.icons_dict = None
         logging.debug("Icon cleanup complete")
@@ -0,0 +1,173 @@
+import bmesh
+import logging
+
+from array import array
+
+class JbeamAttributeSession:
+    """Resolves the bmesh (Edit Mode) or mesh attributes (Object Mode) and the jbeam_* layers once for a batch of reads and writes.
+
+    with JbeamAttributeSession(obj) as s:
+        node_ids = [s.get_node_id(i) for i in range(len(obj.data.vertices))]
+    """
+
+    ATTR_NODE_ID = "jbeam_node_id"
+
+    DOMAIN_TO_ATTR_DOMAIN = {"verts": "POINT", "edges": "EDGE", "faces": "FACE"}
+    DOMAIN_TO_MESH_DATA = {"verts": "vertices", "edges": "edges", "faces": "polygons"}
+    DOMAIN_TO_ATTR_SOURCE = {"verts": "jbeam_node_source", "edges": "jbeam_beam_source", "faces": "jbeam_triangle_source"}
+
+    def __init__(self, obj, bm=None):
+        self.obj = obj
+        self.bm = bm
+        self.is_edit_mode = False
+        self._elements = {}
+        self._layers = {}  # (domain, attr_name) -> (layer or attribute data, is_string) or None if missing
+
+    def __enter__(self):
+        self.is_edit_mode = self.obj.mode == 'EDIT'
+        if self.is_edit_mode:
+            self.bm = self.bm or bmesh.from_edit_mesh(self.obj.data)
+            for domain in self.DOMAIN_TO_ATTR_DOMAIN:
+                elements = getattr(self.bm, domain)
+                elements.ensure_lookup_table()
+                self._elements[domain] = elements
+        else:
+            for domain, data_name in self.DOMAIN_TO_MESH_DATA.items():
+                self._elements[domain] = getattr(self.obj.data, data_name)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._elements.clear()
+        self._layers.clear()
+        return False
+
+    def _get_layer(self, domain, attr_name):
+        """Layer (Edit Mode) or attribute data (Object Mode) and whether it holds strings. Looked up once per session."""
+        key = (domain, attr_name)
+        if key in self._layers:
+            return self._layers[key]
+        entry = None
+        if self.is_edit_mode:
+            layers = self._elements[domain].layers
+            layer = layers.string.get(attr_name)
+            if layer is not None:
+                entry = (layer, True)
+            else:
+                layer = layers.int.get(attr_name)
+                entry = (layer, False) if layer is not None else None
+        else:
+            attr = self.obj.data.attributes.get(attr_name)
+            if attr and attr.domain == self.DOMAIN_TO_ATTR_DOMAIN[domain]:
+                entry = (attr.data, attr.data_type == 'STRING')
+        self._layers[key] = entry
+        return entry
+
+    def _create_layer(self, domain, attr_name, is_string):
+        if self.is_edit_mode:
+            layers = self._elements[domain].layers
+            layer = (layers.string if is_string else layers.int).new(attr_name)
+            self._layers[(domain, attr_name)] = (layer, is_string)
+        else:
+            self.obj.data.attributes.new(name=attr_name, type='STRING' if is_string else 'INT', domain=self.DOMAIN_TO_ATTR_DOMAIN[domain])
+            self._layers.clear()  # adding an attribute can reallocate the data of the others
+        return self._get_layer(domain, attr_name)
+
+    def elements(self, domain):
+        return self._elements[domain]
+
+    def has(self, attr_name, domain="verts") -> bool:
+        return self._get_layer(domain, attr_name) is not None
+
+    def get(self, index, attr_name, domain="verts") -> str | int | None:
+        entry = self._get_layer(domain, attr_name)
+        if entry is None:
+            return None
+        layer, is_string = entry
+        if self.is_edit_mode:
+            value = self._elements[domain][index][layer]
+        else:
+            value = layer[index].value
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+
+    def set(self, index, attr_name, attr_value: str | int, domain="verts") -> bool:
+        if not isinstance(attr_value, (str, int)):
+            logging.error(f"{repr(self.obj)}: Unsupported attribute value type")
+            return False
+        entry = self._get_layer(domain, attr_name) or self._create_layer(domain, attr_name, isinstance(attr_value, str))
+        layer, is_string = entry
+        value = attr_value.encode('utf-8') if is_string else attr_value
+        if self.is_edit_mode:
+            self._elements[domain][index][layer] = value
+        else:
+            layer[index].value = value
+        return True
+
+    def column(self, attr_name, domain="verts") -> list[str | int]:
+        """All values of an attribute in element order. Empty if the attribute does not exist."""
+        entry = self._get_layer(domain, attr_name)
+        if entry is None:
+            return []
+        layer, is_string = entry
+        if self.is_edit_mode:
+            values = [element[layer] for element in self._elements[domain]]
+        elif not is_string and self.obj.data.attributes[attr_name].data_type == 'INT':
+            values = array('i', [0]) * len(layer)
+            layer.foreach_get("value", values)
+            return values.tolist()
+        else:
+            values = [data.value for data in layer]
+        return [value.decode('utf-8') for value in values] if is_string else values
+
+    def group_by_value(self, attr_name, domain="verts") -> dict[str | int, list[int]]:
+        """value -> element indices for the whole column, so any number of values can be looked up after one read."""
+        groups = {}
+        for index, value in enumerate(self.column(attr_name, domain)):
+            groups.setdefault(value, []).append(index)
+        return groups
+
+    def get_node_id(self, vertex_index) -> str:
+        return self.get(vertex_index, self.ATTR_NODE_ID)
+
+    def get_node_ids(self) -> list[str]:
+        return self.column(self.ATTR_NODE_ID)
+
+    def get_vertex_indices(self, index, domain) -> list[int]:
+        element = self._elements[domain][index]
+        if self.is_edit_mode:
+            return [v.index for v in element.verts]
+        return list(element.vertices)
+
+    def get_vertex_positions(self, precision: int | None = None) -> list[tuple[float, float, float]]:
+        """Local coordinates of all vertices, read with one foreach_get in Object Mode and rounded to precision decimals in one pass over the flat coordinates."""
+        verts = self._elements["verts"]
+        if self.is_edit_mode:
+            flat = [c for v in verts for c in v.co]
+        else:
+            flat = array('f', [0.0]) * (3 * len(verts))
+            verts.foreach_get("co", flat)
+        if precision is not None:
+            flat = [round(c, precision) for c in flat]
+        return list(zip(flat[0::3], flat[1::3], flat[2::3]))
+
+    def get_edge_vertices(self) -> list[tuple[int, int]]:
+        """Vertex index pairs of all edges, read with one foreach_get in Object Mode."""
+        edges = self._elements["edges"]
+        if self.is_edit_mode:
+            return [(e.verts[0].index, e.verts[1].index) for e in edges]
+        flat = array('i', [0]) * (2 * len(edges))
+        edges.foreach_get("vertices", flat)
+        return list(zip(flat[0::2], flat[1::2]))
+
+    def get_face_vertices(self) -> list[tuple[int, ...]]:
+        """Vertex indices of all faces, read with foreach_get over polygons and loops in Object Mode."""
+        faces = self._elements["faces"]
+        if self.is_edit_mode:
+            return [tuple(v.index for v in f.verts) for f in faces]
+        loop_starts = array('i', [0]) * len(faces)
+        loop_totals = array('i', [0]) * len(faces)
+        faces.foreach_get("loop_start", loop_starts)
+        faces.foreach_get("loop_total", loop_totals)
+        loops = self.obj.data.loops
+        loop_vertices = array('i', [0]) * len(loops)
+        loops.foreach_get("vertex_index", loop_vertices)
+        return [tuple(loop_vertices[start:start + total]) for start, total in zip(loop_starts, loop_totals)]
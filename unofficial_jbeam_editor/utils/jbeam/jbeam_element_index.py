@@ -0,0 +1,193 @@
+import bpy
+import bmesh
+import logging
+
+from bpy.app.handlers import persistent
+
+from unofficial_jbeam_editor.utils.jbeam.jbeam_attribute_session import JbeamAttributeSession
+from unofficial_jbeam_editor.core.stage_profiler import StageProfiler
+
+class JbeamElementIndex:
+    """Lookup tables of one node mesh. Each table is built on first use from one bulk read of the attribute columns."""
+
+    def __init__(self, signature: tuple):
+        self.signature = signature
+        self._node_indices: dict[str, list[int]] | None = None
+        self._beam_indices: dict[tuple, list[int]] | None = None  # sorted node id tuple -> edge indices
+        self._face_indices: dict[tuple, list[int]] | None = None  # sorted node id tuple -> face indices
+        self.edge_vertices: list[tuple[int, int]] = []
+        self.face_vertices: list[tuple[int, ...]] = []
+        self._source_indices: dict[str, dict[str, list[int]]] = {}  # domain -> jbeam source path -> element indices
+
+    @staticmethod
+    def element_key(node_ids) -> tuple:
+        return tuple(sorted(node_ids))
+
+    def _build_node_indices(self, session: JbeamAttributeSession):
+        node_indices = {}
+        for index, node_id in enumerate(session.get_node_ids()):
+            node_indices.setdefault(node_id, []).append(index)
+        self._node_indices = node_indices
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            duplicates = self.duplicate_node_ids
+            if duplicates:
+                logging.debug("⚠️  Duplicate node IDs found: %s", ', '.join(sorted(duplicates)))
+
+    def _build_element_indices(self, session: JbeamAttributeSession):
+        node_ids = session.get_node_ids()
+        self.edge_vertices = session.get_edge_vertices()
+        self.face_vertices = session.get_face_vertices()
+        self._beam_indices = {}
+        self._face_indices = {}
+        if not node_ids:
+            return
+        for index, vertices in enumerate(self.edge_vertices):
+            self._beam_indices.setdefault(self.element_key(node_ids[v] for v in vertices), []).append(index)
+        for index, vertices in enumerate(self.face_vertices):
+            self._face_indices.setdefault(self.element_key(node_ids[v] for v in vertices), []).append(index)
+
+    def _build_source_indices(self, session: JbeamAttributeSession, domain):
+        source_indices = {}
+        for index, source in enumerate(session.column(session.DOMAIN_TO_ATTR_SOURCE[domain], domain)):
+            source_indices.setdefault(str(source).strip(), []).append(index)
+        self._source_indices[domain] = source_indices
+
+    def source_indices(self, jbeam_path: str, domain="verts") -> list[int]:
+        """Ascending indices of the elements of a domain whose jbeam source is jbeam_path."""
+        return list(self._source_indices[domain].get(str(jbeam_path).strip(), ()))
+
+    @property
+    def source_paths(self) -> dict[str, list[str]]:
+        return {domain: sorted(source_indices) for domain, source_indices in self._source_indices.items()}
+
+    def beam_indices(self, *node_ids) -> list[int]:
+        return list(self._beam_indices.get(self.element_key(node_ids), ()))
+
+    def face_indices(self, *node_ids) -> list[int]:
+        return list(self._face_indices.get(self.element_key(node_ids), ()))
+
+    def beam_index(self, *node_ids) -> int:
+        """First edge index of the beam or -1."""
+        indices = self._beam_indices.get(self.element_key(node_ids))
+        return indices[0] if indices else -1
+
+    def face_index(self, *node_ids) -> int:
+        """First face index of the triangle or -1."""
+        indices = self._face_indices.get(self.element_key(node_ids))
+        return indices[0] if indices else -1
+
+    def node_indices(self, node_id: str) -> list[int]:
+        return list(self._node_indices.get(node_id, ()))
+
+    def node_index(self, node_id: str) -> int:
+        """First vertex index of node_id or -1."""
+        indices = self._node_indices.get(node_id)
+        return indices[0] if indices else -1
+
+    @property
+    def duplicate_node_ids(self) -> dict[str, list[int]]:
+        return {node_id: indices for node_id, indices in self._node_indices.items() if len(indices) > 1}
+
+    @property
+    def duplicate_beams(self) -> dict[tuple, list[int]]:
+        """Sorted node id tuple -> edge indices of every beam that exists more than once."""
+        return {key: indices for key, indices in self._beam_indices.items() if len(indices) > 1}
+
+
+class JbeamElementIndexManager:
+    """Caches a JbeamElementIndex per node mesh. An index is dropped when the element counts change,
+    on geometry updates reported by the depsgraph, on undo/redo and when node ids are written through JbeamUtils."""
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance.indices = {}
+        return cls._instance
+
+    @classmethod
+    def get_instance(cls):
+        return cls._instance or cls()
+
+    @staticmethod
+    def _get_signature(obj, bm=None) -> tuple:
+        if obj.mode == 'EDIT':
+            bm = bm or bmesh.from_edit_mesh(obj.data)
+            return (obj.mode, len(bm.verts), len(bm.edges), len(bm.faces))
+        mesh = obj.data
+        return (obj.mode, len(mesh.vertices), len(mesh.edges), len(mesh.polygons))
+
+    def get_index(self, obj, bm=None) -> JbeamElementIndex:
+        signature = self._get_signature(obj, bm)
+        index = self.indices.get(obj.session_uid)
+        if index is None or index.signature != signature:
+            index = self.indices[obj.session_uid] = JbeamElementIndex(signature)
+        return index
+
+    def get_node_index(self, obj, bm=None) -> JbeamElementIndex:
+        index = self.get_index(obj, bm)
+        if index._node_indices is None:
+            StageProfiler.count("element_index_cache_misses")
+            with JbeamAttributeSession(obj, bm) as session:
+                index._build_node_indices(session)
+        else:
+            StageProfiler.count("element_index_cache_hits")
+        return index
+
+    def get_element_index(self, obj, bm=None) -> JbeamElementIndex:
+        index = self.get_index(obj, bm)
+        if index._beam_indices is None:
+            StageProfiler.count("element_index_cache_misses")
+            with JbeamAttributeSession(obj, bm) as session:
+                index._build_element_indices(session)
+        else:
+            StageProfiler.count("element_index_cache_hits")
+        return index
+
+    def get_source_index(self, obj, domain="verts", bm=None) -> JbeamElementIndex:
+        index = self.get_index(obj, bm)
+        if domain not in index._source_indices:
+            StageProfiler.count("element_index_cache_misses")
+            with JbeamAttributeSession(obj, bm) as session:
+                index._build_source_indices(session, domain)
+        else:
+            StageProfiler.count("element_index_cache_hits")
+        return index
+
+    def invalidate_sources(self, obj):
+        index = self.indices.get(obj.session_uid)
+        if index is not None:
+            index._source_indices.clear()
+
+    def invalidate(self, obj=None):
+        if obj is None:
+            self.indices.clear()
+        else:
+            self.indices.pop(obj.session_uid, None)
+
+    def register(self):
+        if self.depsgraph_update_handler not in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.append(self.depsgraph_update_handler)
+        for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post, bpy.app.handlers.load_post):
+            if _invalidate_all_handler not in handlers:
+                handlers.append(_invalidate_all_handler)
+
+    def unregister(self):
+        if self.depsgraph_update_handler in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.remove(self.depsgraph_update_handler)
+        for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post, bpy.app.handlers.load_post):
+            if _invalidate_all_handler in handlers:
+                handlers.remove(_invalidate_all_handler)
+        self.indices.clear()
+
+    def depsgraph_update_handler(self, scene, depsgraph):
+        if not self.indices:
+            return
+        for update in depsgraph.updates:
+            if update.is_updated_geometry and isinstance(update.id, bpy.types.Object):
+                self.indices.pop(update.id.original.session_uid, None)
+
+
+@persistent
+def _invalidate_all_handler(*args):
+    JbeamElementIndexManager.get_instance().invalidate()
@@ -4,10 +4,11 @@ import logging
 
 from abc import ABC, abstractmethod
 
-from unofficial_jbeam_editor.utils.jbeam.jbeam_models import JbeamLoadItem, JbeamJson, PcJson
+from unofficial_jbeam_editor.core.jbeam_models import JbeamLoadItem, JbeamJson, PcJson
 from unofficial_jbeam_editor.utils.temp_file_manager import TempFileManager
-from unofficial_jbeam_editor.utils.jbeam.jbeam_helper import JbeamFileHelper
-from unofficial_jbeam_editor.utils.json_cleanup import json_cleanup
+from unofficial_jbeam_editor.core.jbeam_file_helper import JbeamFileHelper
+from unofficial_jbeam_editor.core.json_cleanup import json_cleanup
+from unofficial_jbeam_editor.core.stage_profiler import StageProfiler
 from unofficial_jbeam_editor.ui.addon_preferences import MyAddonPreferences as a
 from unofficial_jbeam_editor.utils.utils import Utils
 
@@ -33,7 +34,9 @@ class JbeamLoaderBase(ABC):
                 logging.debug(f"⚠️  Cached failure for {self.filepath}, skipping reattempt.")
                 return None
             logging.debug(f"✅ Loaded from cache: {self.filepath}")
+            StageProfiler.count("loader_cache_hits")
             return cached
+        StageProfiler.count("loader_cache_misses")
 
         if not os.path.exists(self.filepath):
             Utils.log_and_report(f"❌ [FileNotFoundError] {self.filepath}", self.operator, "ERROR")
@@ -41,15 +44,19 @@ class JbeamLoaderBase(ABC):
             return None
 
         try:
-            data = self._load_main(self.filepath)
-            result = self._validate_content(data)
+            with StageProfiler.stage("load"):
+                data = self._load_main(self.filepath)
+                result = self._validate_content(data)
             cls._cache[self.filepath] = result
             return result
         except Exception as e:
             Utils.log_and_report(f"⚠️  Initial load failed with '{e}'. Attempting auto-fix...", self.operator if a.is_warnings_enabled() else None, "WARNING")
-            fixed_str = self._attempt_fix(self.filepath, e)
+            StageProfiler.count("comma_fixes")
+            with StageProfiler.stage("load.fix_commas"):
+                fixed_str = self._attempt_fix(self.filepath, e)
             try:
-                data = self._load_from_string(fixed_str)
+                with StageProfiler.stage("load.reload_fixed"):
+                    data = self._load_from_string(fixed_str)
                 result = self._validate_content(data)
                 cls._cache[self.filepath] = result
                 self._write_debug_files(fixed_str)
@@ -85,13 +92,7 @@ class JbeamLoaderBase(ABC):
 
     def json_loads(self, json_string) -> dict:
         self.json_str = json_string
-        json_data = json.loads(self.json_str)
-        if not isinstance(json_data, dict):
-            raise ValueError("❌ Expected a JSON object (dictionary) at the top level")
-        main_key = next(iter(json_data), None)
-        if main_key is None:
-            raise ValueError("❌ Empty JSON structure")
-        return json_data
+        return JbeamFileHelper.loads_json_object(self.json_str)
 
     def _write_debug_files(self, fixed_str: str):
         try:
@@ -144,11 +145,4 @@ class JbeamFileLoader(JbeamLoaderBase):
         return self.json_loads(json_cleanup(raw_text))
 
     def _validate_content(self, json_data: dict):
-        if not isinstance(json_data, dict):
-            raise ValueError("❌ Root of the JBeam file must be a dictionary.")
-        for part_name, part_data in json_data.items():
-            if not isinstance(part_data, dict):
-                raise ValueError(f"❌ Part '{part_name}' must be a dictionary.")
-            if not part_data:
-                raise ValueError(f"❌ Part '{part_name}' must not be empty.")
-        return json_data
+        return JbeamFileHelper.validate_jbeam(json_data)
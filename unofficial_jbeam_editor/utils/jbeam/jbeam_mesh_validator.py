@@ -0,0 +1,123 @@
+import logging
+
+from unofficial_jbeam_editor.utils.jbeam.jbeam_attribute_session import JbeamAttributeSession
+from unofficial_jbeam_editor.utils.jbeam.jbeam_element_index import JbeamElementIndexManager
+from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamRefnodeUtils as jr
+
+class JbeamValidationReport:
+    """Problems found by JbeamMeshValidator. Errors block the export, warnings are only reported."""
+
+    MAX_LISTED = 5  # element ids listed per problem before the rest is summarized
+
+    def __init__(self):
+        self.errors: list[str] = []
+        self.warnings: list[str] = []
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+    def add(self, is_error: bool, message: str, items: list = None):
+        if items is not None:
+            if not items:
+                return
+            listed = ", ".join(str(item) for item in items[:self.MAX_LISTED])
+            more = f" (+{len(items) - self.MAX_LISTED} more)" if len(items) > self.MAX_LISTED else ""
+            message = f"{message} ({len(items)}): {listed}{more}"
+        (self.errors if is_error else self.warnings).append(message)
+
+
+class JbeamMeshValidator:
+    """Export preflight: reads node ids, refnode ids, positions and topology in bulk and checks the whole node mesh at once."""
+
+    EPSILON = 1e-6
+
+    @staticmethod
+    def validate(obj, bm=None) -> JbeamValidationReport:
+        report = JbeamValidationReport()
+
+        with JbeamAttributeSession(obj, bm) as session:
+            node_ids = session.get_node_ids()
+            refnode_ids = session.column(jr.ATTR_REFNODE_ID)
+            positions = session.get_vertex_positions()
+        index = JbeamElementIndexManager.get_instance().get_element_index(obj, bm)
+
+        if not node_ids:
+            report.add(True, f"Attribute '{JbeamAttributeSession.ATTR_NODE_ID}' is missing")
+            return report
+
+        JbeamMeshValidator._check_node_ids(report, node_ids)
+        JbeamMeshValidator._check_refnodes(report, node_ids, refnode_ids)
+        JbeamMeshValidator._check_beams(report, node_ids, positions, index.edge_vertices, index.face_vertices, index.duplicate_beams)
+        JbeamMeshValidator._check_faces(report, node_ids, positions, index.face_vertices)
+
+        for message in report.errors:
+            logging.debug("❌ %r: %s", obj, message)
+        for message in report.warnings:
+            logging.debug("⚠️  %r: %s", obj, message)
+        return report
+
+    @staticmethod
+    def _check_node_ids(report: JbeamValidationReport, node_ids):
+        seen = set()
+        empty, duplicates = [], []
+        for vertex_index, node_id in enumerate(node_ids):
+            node_id = node_id.strip()
+            if not node_id:
+                empty.append(f"index {vertex_index}")
+            elif node_id in seen:
+                duplicates.append(f"'{node_id}'")
+            seen.add(node_id)
+        report.add(True, "Nodes with an empty name", empty)
+        report.add(True, "Duplicate node names", duplicates)
+
+    @staticmethod
+    def _check_refnodes(report: JbeamValidationReport, node_ids, refnode_ids):
+        assigned = {}
+        for vertex_index, refnode_id in enumerate(refnode_ids):
+            if refnode_id:
+                assigned.setdefault(refnode_id, []).append(node_ids[vertex_index])
+        for refnode_id, nodes in assigned.items():
+            if len(nodes) > 1:
+                enum = jr.get_refnode_name(refnode_id)
+                report.add(True, f"Only 1 Node can be labeled as {enum}", nodes)
+
+    @staticmethod
+    def _check_beams(report: JbeamValidationReport, node_ids, positions, edge_vertices, face_vertices, duplicate_beams):
+        used_vertices = set()
+        zero_length = []
+        for v1, v2 in edge_vertices:
+            used_vertices.add(v1)
+            used_vertices.add(v2)
+            if JbeamMeshValidator._distance_squared(positions[v1], positions[v2]) < JbeamMeshValidator.EPSILON ** 2:
+                zero_length.append(f"[{node_ids[v1]}, {node_ids[v2]}]")
+        for vertices in face_vertices:
+            used_vertices.update(vertices)
+        duplicates = [f"[{', '.join(key)}]" for key in duplicate_beams]
+        orphans = [node_id for vertex_index, node_id in enumerate(node_ids) if vertex_index not in used_vertices]
+        report.add(False, "Zero-length beams", zero_length)
+        report.add(False, "Duplicate beams", duplicates)
+        report.add(False, "Nodes not used by any beam or triangle", orphans)
+
+    @staticmethod
+    def _check_faces(report: JbeamValidationReport, node_ids, positions, face_vertices):
+        ngons, degenerate = [], []
+        for vertices in face_vertices:
+            face_id = f"[{', '.join(node_ids[v] for v in vertices)}]"
+            if len(vertices) > 3:
+                ngons.append(face_id)
+            elif JbeamMeshValidator._triangle_area_doubled_squared(*(positions[v] for v in vertices)) < JbeamMeshValidator.EPSILON ** 2:
+                degenerate.append(face_id)
+        if ngons:
+            report.add(True, "Jbeam does not support quads and N-gons. Triangulate these faces with Ctrl+T", ngons)
+        report.add(False, "Degenerate triangles", degenerate)
+
+    @staticmethod
+    def _distance_squared(a, b) -> float:
+        return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+    @staticmethod
+    def _triangle_area_doubled_squared(a, b, c) -> float:
+        ux, uy, uz = b[0] - a[0], b[1] - a[1], b[2] - a[2]
+        vx, vy, vz = c[0] - a[0], c[1] - a[1], c[2] - a[2]
+        return (uy * vz - uz * vy) ** 2 + (uz * vx - ux * vz) ** 2 + (ux * vy - uy * vx) ** 2
@@ -1,9 +1,11 @@
 import bpy
 import json
-import logging
 
 from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamUtils as j, JbeamRefnodeUtils as jr
 from unofficial_jbeam_editor.utils.jbeam.jbeam_props_storage import JbeamPropsStorageManager
+from unofficial_jbeam_editor.utils.jbeam.jbeam_element_index import JbeamElementIndexManager
+from unofficial_jbeam_editor.core.stage_profiler import StageProfiler
+from unofficial_jbeam_editor.core.lazy_logger import LazyLogger
 
 class JbeamNodeMeshConfigurator:
 
@@ -23,6 +25,7 @@ class JbeamNodeMeshConfigurator:
             JbeamNodeMeshConfigurator.assign_ref_nodes(obj, parser.get_ref_nodes(part_id), parser.get_nodes(part_id))
 
     @staticmethod
+    @StageProfiler.stage("attributes.nodes")
     def process_node_mesh_props_for_nodes(obj, parser, part_id, init):
         if init:
             j.set_jbeam_visuals(obj)
@@ -38,6 +41,7 @@ class JbeamNodeMeshConfigurator:
         JbeamNodeMeshConfigurator.store_node_props_in_vertex_attributes(obj, nodes_list)
 
     @staticmethod
+    @StageProfiler.stage("attributes.beams_and_triangles")
     def process_node_mesh_props_for_beams_and_tris(obj, parser=None, part_id=""):
         if not parser:
             return
@@ -52,21 +56,23 @@ class JbeamNodeMeshConfigurator:
             del obj.data[key]
 
     @staticmethod
+    @StageProfiler.stage("attributes.ref_nodes")
     def assign_ref_nodes(obj, ref_nodes, nodes) -> bool:
+        log = LazyLogger()
         for refnode_name, node_id in ref_nodes.items():
             node = nodes.get(node_id)
             ref_label = jr.get_refnode_from_label(refnode_name)
             if node is None:
-                logging.debug(f"⚠️  Unable to assign refnode '{ref_label}' to Node ID '{node_id}': node might be missing or belong to a base JBeam part.")
+                log.log("⚠️  Unable to assign refnode '%s' to Node ID '%s': node might be missing or belong to a base JBeam part.", ref_label, node_id)
                 continue
             idx = node.index
             if idx < 0:
-                logging.debug(f"❌ Error: No vertex index assigned to '{node.id}'")
+                log.log("❌ Error: No vertex index assigned to '%s'", node.id)
                 continue
             success = jr.set_refnode_id(obj, idx, ref_label.value)
             if not success:
                 return False
-            logging.debug(f"🎯 Assigned Node '{node.id}' with index {idx} as ref node '{refnode_name}({ref_label.value})'.")
+            log.log("🎯 Assigned Node '%s' with index %d as ref node '%s(%s)'.", node.id, idx, refnode_name, ref_label.value)
         return True
 
     @staticmethod
@@ -76,9 +82,10 @@ class JbeamNodeMeshConfigurator:
 
     @staticmethod
     def store_node_props_in_vertex_attributes(obj, nodes):
+        log = LazyLogger()
         for node in nodes:
             if node.index < 0:
-                logging.debug(f"❌ Error: Invalid vertex index for node '{node.id}'")
+                log.count("❌ Error: Invalid vertex index for node '%s'", node.id)
                 continue
 
             idx = node.index
@@ -87,15 +94,28 @@ class JbeamNodeMeshConfigurator:
             j.set_node_id(obj, idx, str(node.id))
             j.set_node_props(obj, idx, flat_data)
             j.set_jbeam_source(obj, idx, "verts", node.source_jbeam)
+        log.flush()
+
+    @staticmethod
+    def _resolve_index(index, fallback_index):
+        # keep the index from mesh creation if the nodes are not (yet) named in this mesh
+        return index if index >= 0 else fallback_index
 
     @staticmethod
     def store_beam_props_in_edge_attributes(obj, beams):
         if beams:
+            index = JbeamElementIndexManager.get_instance().get_element_index(obj)
+            for beam in beams:
+                beam.index = JbeamNodeMeshConfigurator._resolve_index(index.beam_index(beam.node_id1, beam.node_id2), beam.index)
             JbeamNodeMeshConfigurator.store_props_in_attributes(obj, beams, j.set_beam_props, "edges", "beams")
 
     @staticmethod
     def store_triangle_props_in_face_attributes(obj, triangles):
         if triangles:
+            # faces that already existed with another winding are skipped when the mesh is built, so resolve the actual face index by node ids
+            index = JbeamElementIndexManager.get_instance().get_element_index(obj)
+            for triangle in triangles:
+                triangle.index = JbeamNodeMeshConfigurator._resolve_index(index.face_index(triangle.node_id1, triangle.node_id2, triangle.node_id3), triangle.index)
             JbeamNodeMeshConfigurator.store_props_in_attributes(obj, triangles, j.set_triangle_props, "faces", "triangles")
 
     @staticmethod
@@ -3,7 +3,9 @@ import bmesh
 import logging
 
 from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamUtils as j
-from unofficial_jbeam_editor.utils.jbeam.jbeam_models import JBeamElement, Node, Beam, Triangle
+from unofficial_jbeam_editor.core.stage_profiler import StageProfiler
+from unofficial_jbeam_editor.core.lazy_logger import LazyLogger
+from unofficial_jbeam_editor.core.jbeam_models import JBeamElement, Node, Beam, Triangle
 
 class JbeamNodeMeshCreator:
     def __init__(self):
@@ -15,7 +17,6 @@ class JbeamNodeMeshCreator:
         self._vertices: list = []
         self._edges: list[tuple[int, int]] = []
         self._faces: list[tuple[int, int, int]] = []
-        self._missing_element_warn_count = 0
 
     def create_object(self, mesh_name="NodeMesh"):
         """Create an empty mesh object."""
@@ -29,6 +30,7 @@ class JbeamNodeMeshCreator:
         if not self.mesh:
             raise RuntimeError("❌ Mesh object has not been created yet. Call 'create_object' first.")
 
+    @StageProfiler.stage("mesh.vertices")
     def add_vertices(self, nodes_list: list[Node]) -> list[Node]:
         self.check_mesh_created()
 
@@ -37,14 +39,15 @@ class JbeamNodeMeshCreator:
         start_index = len(self.mesh.vertices)
 
         # Determine which nodes are new
-        for node in nodes_list:
-            if node.id in self.vertex_indices:
-                existing_index = self.vertex_indices[node.id]
-                node.index = existing_index
-                logging.debug(f"⚠️  Duplicate node ID ignored: '{node.id}' at position {node.position} (already exists at index {existing_index})")
-                continue
-            new_nodes_list.append(node)
-            num_new += 1
+        with LazyLogger() as log:
+            for node in nodes_list:
+                if node.id in self.vertex_indices:
+                    existing_index = self.vertex_indices[node.id]
+                    node.index = existing_index
+                    log.count("⚠️  Duplicate node ID ignored: '%s' at position %s (already exists at index %d)", node.id, node.position, existing_index)
+                    continue
+                new_nodes_list.append(node)
+                num_new += 1
 
         self.mesh.vertices.add(num_new)
 
@@ -56,7 +59,9 @@ class JbeamNodeMeshCreator:
             self._vertices.append(node.position)
             current_index += 1
 
-        logging.debug(f"    - Added {num_new} vertices (total: {len(self.mesh.vertices)}).")
+        StageProfiler.count("vertices_added", num_new)
+        StageProfiler.count("duplicate_nodes_ignored", len(nodes_list) - num_new)
+        logging.debug("    - Added %d vertices (total: %d).", num_new, len(self.mesh.vertices))
         return new_nodes_list
 
 
@@ -64,12 +69,13 @@ class JbeamNodeMeshCreator:
         result: list[tuple[int, ...]] = []
         unique_map: dict[tuple[int, ...], int] = {}
         base_index = len(self._edges if node_count == 2 else self._faces)
+        log = LazyLogger()
 
         for element in element_list:
             node_ids = get_node_ids(element)
 
             if len(node_ids) != node_count:
-                logging.debug(f"⚠️  Warning: Expected {node_count} node IDs, got {len(node_ids)}")
+                log.count("⚠️  Warning: Expected %d node IDs, got %d", node_count, len(node_ids))
                 assign_index(element, -1)
                 continue
 
@@ -83,19 +89,19 @@ class JbeamNodeMeshCreator:
 
                 assign_index(element, unique_map[key])
             else:
-                self._missing_element_warn_count += 1
-                missing = [nid for nid in node_ids if nid not in self.vertex_indices]
-                if self._missing_element_warn_count <= 3:
-                    logging.debug(f"⚠️  Warning: Cannot construct element '{j.format_node_ids(*node_ids)}' — missing node(s): {missing}")
+                if log.enabled:
+                    missing = [nid for nid in node_ids if nid not in self.vertex_indices]
+                    log.count("⚠️  Warning: Cannot construct element '%s' — missing node(s): %s", j.format_node_ids(*node_ids), missing)
                 assign_index(element, -1)
 
+        log.flush()
         return result
 
+    @StageProfiler.stage("mesh.edges")
     def add_edges(self, beam_list: list[Beam]) -> None:
         self.check_mesh_created()
         if not beam_list:
             return
-        self.reset_warning_counter()
         new_edges = self._process_elements(
             element_list=beam_list,
             node_count=2,
@@ -110,15 +116,16 @@ class JbeamNodeMeshCreator:
         for i, edge in enumerate(new_edges):
             self.mesh.edges[start_index + i].vertices = edge
             self._edges.append(edge)
-        self.print_ommited_warnings()
-        logging.debug(f"    - Added {num_new} edges (total: {len(self.mesh.edges)}).")
+        StageProfiler.count("edges_added", num_new)
+        logging.debug("    - Added %d edges (total: %d).", num_new, len(self.mesh.edges))
 
 
+    @StageProfiler.stage("mesh.faces")
     def add_faces(self, tris_list: list[Triangle]) -> None:
         self.check_mesh_created()
         if not tris_list:
             return
-        self.reset_warning_counter()
+        faces_before = len(self._faces)
         bm = bmesh.new()
         bm.from_mesh(self.mesh)
 
@@ -142,12 +149,5 @@ class JbeamNodeMeshCreator:
 
         bm.to_mesh(self.mesh)
         bm.free()
-        self.print_ommited_warnings()
-        logging.debug(f"    - Added {len(new_faces)} faces (total: {len(self.mesh.polygons)}).")
-
-    def reset_warning_counter(self):
-        self._missing_element_warn_count = 0
-
-    def print_ommited_warnings(self):
-        if self._missing_element_warn_count > 3:
-            logging.debug(f"⚠️  Warning: More missing warnings omitted... ({self._missing_element_warn_count - 3} more)")
\ No newline at end of file
+        StageProfiler.count("faces_added", len(self._faces) - faces_before)
+        logging.debug("    - Added %d faces (total: %d).", len(new_faces), len(self.mesh.polygons))
@@ -2,26 +2,16 @@ import bpy
 import logging
 from collections import defaultdict
 
-from unofficial_jbeam_editor.utils.jbeam.jbeam_pc_parser import JbeamPcParser
-from unofficial_jbeam_editor.utils.jbeam.jbeam_parser import JbeamParser
+from unofficial_jbeam_editor.core.jbeam_pc_parser import JbeamPcParser
+from unofficial_jbeam_editor.core.jbeam_parser import JbeamParser
+from unofficial_jbeam_editor.core.jbeam_part_grouper import JbeamPartGrouper, PartGroupID
 from unofficial_jbeam_editor.utils.jbeam.jbeam_loader import JbeamFileLoader
-from unofficial_jbeam_editor.utils.jbeam.jbeam_models import NodeID, Node, JbeamLoadItem, JbeamJson, JbeamPart, JbeamPartID
+from unofficial_jbeam_editor.core.jbeam_models import NodeID, Node, JbeamLoadItem, JbeamJson, JbeamPart
 from unofficial_jbeam_editor.utils.jbeam.jbeam_node_mesh_creator import JbeamNodeMeshCreator
 from unofficial_jbeam_editor.utils.jbeam.jbeam_node_mesh_configurator import JbeamNodeMeshConfigurator
+from unofficial_jbeam_editor.core.stage_profiler import StageProfiler
 from unofficial_jbeam_editor.utils.utils import Utils
 
-PartGroupID = str
-
-class GroupedPart:
-    def __init__(self, part, group_id, level, parser):
-        self.id = part.id
-        self.group_id: PartGroupID = group_id
-        self.level = level
-        self.parser = parser
-
-    def __repr__(self):
-        return f"GroupedPart(id={self.id}, group_id={self.group_id}, level={self.level}, parser={self.parser.parse_source})"
-
 class JbeamPartsLoader:
     def __init__(self, pc_parser: JbeamPcParser, operator):
         self.name = pc_parser.pc_file_stem
@@ -58,7 +48,9 @@ class JbeamPartsLoader:
 
     def _create_node_meshes(self, parsers):
         logging.debug("⏳🧩 Parsing beams and triangles to generate node meshes.")
-        grouped_parts = self._create_single_group(parsers) if self.single_object else self._group_parts(parsers)
+        with StageProfiler.stage("parts.group"):
+            grouped_parts = self._create_single_group(parsers) if self.single_object else JbeamPartGrouper.group_parts(parsers)
+        StageProfiler.count("parts", len(grouped_parts))
         self._process_grouped_parts(grouped_parts)
 
     def _create_single_group(self, parsers):
@@ -72,70 +64,6 @@ class JbeamPartsLoader:
                 grouped_parts.append(part)
         return grouped_parts
 
-
-    def _group_parts(self, parsers):
-        # logging.debug(f"🧊 Grouping Parts from selected Jbeam files")
-        visited_parts: set[JbeamPartID] = set()
-        grouped_parts: list[GroupedPart] = []
-        group_counter: PartGroupID = 0
-
-        parsers_by_id = {
-            part.id: parser
-            for parser in parsers
-            for part in parser.jbeam_parts.values()
-        }
-
-        def can_be_grouped_with(source, candidate):
-            # logging.debug(f"Evaluating if '{candidate.slot_type}:{candidate.id}' can fit into slots of '{source.slot_type}:{source.id}'")
-            for slot in source.slots:
-                slot_type = slot[0] if isinstance(slot, (list, tuple)) else slot
-                # logging.debug(f"Source slot accepts: '{slot_type}'")
-                if candidate.slot_type == slot_type:
-                    # logging.debug(f"✅ MATCH: Candidate slotType fits into source slotType")
-                    return True
-            # logging.debug(f"❌ No match found for slot type '{slot_type}'")
-            return False
-
-        for parser in parsers:
-            load_item = parser.parse_source
-            jbeam_part = parser.get_jbeam_part(load_item.part_id)
-            if not jbeam_part or jbeam_part.id in visited_parts:
-                continue
-
-            # logging.debug(f"🔹 Starting new group {group_counter} from root part: {jbeam_part.slot_type}:{jbeam_part.id}")
-            group = self._explore_and_group_parts(parsers_by_id, jbeam_part, visited_parts, group_counter, can_be_grouped_with)
-            grouped_parts.extend(group)
-            # logging.debug(f"Finalized group {group_counter} with {len(group)} part(s): {[p.id for p in group]}")
-            group_counter += 1
-
-        return grouped_parts
-
-    def _explore_and_group_parts(self, parsers_by_id, root_part, visited_parts, group_counter, can_be_grouped_with):
-        group: list[GroupedPart] = []
-        queue = [(root_part, 0)]  # Start with root part at level 0
-
-        while queue:
-            current_part, level = queue.pop(0)
-            if current_part.id in visited_parts:
-                continue
-
-            # logging.debug(f"Exploring part: {current_part.slot_type}:{current_part.id} (Level {level})")
-            current_parser = parsers_by_id.get(current_part.id)
-            if not current_parser:
-                continue
-
-            group.append(GroupedPart(current_part, group_counter, level, current_parser))
-            visited_parts.add(current_part.id)
-
-            for other_parser in parsers_by_id.values():
-                for candidate in other_parser.jbeam_parts.values():
-                    if candidate.id in visited_parts or candidate.id == current_part.id:
-                        continue
-                    if can_be_grouped_with(current_part, candidate):
-                        queue.append((candidate, level + 1))
-
-        return group
-
     def _process_grouped_parts(self, grouped_parts):
         grouped_by_id = defaultdict(list)
         for part in grouped_parts:
@@ -5,7 +5,7 @@ from pathlib import Path
 
 from unofficial_jbeam_editor.ui.addon_preferences import MyAddonPreferences as a
 from unofficial_jbeam_editor.utils.jbeam.jbeam_loader import JbeamLoaderBase
-from unofficial_jbeam_editor.utils.jbeam.jbeam_models import PcJson
+from unofficial_jbeam_editor.core.jbeam_models import PcJson
 
 
 class JbeamPcFileLoader(JbeamLoaderBase):
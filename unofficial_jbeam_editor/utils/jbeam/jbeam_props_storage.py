@@ -3,6 +3,7 @@ import bpy
 import json
 import copy
 import logging
+from collections import deque
 
 class JbeamPropsStorage:
 
@@ -20,6 +21,8 @@ class JbeamPropsStorage:
             "edges": {},
             "faces": {}
         }
+        self.restored = False  # True once the saved props of the owner mesh have been decoded
+        self._prop_index = None  # {domain: {prop_name: {normalized_value: {(key, instance)}}}}, built on first query
 
     @property
     def owner(self):
@@ -47,9 +50,60 @@ class JbeamPropsStorage:
             self.storage[domain][key] = {}
 
         # Store a deep copy of the instance-specific properties
+        self._unindex_key(domain, key)
         self.storage[domain][key][f"{instance}"] = copy.deepcopy(props)
+        self._index_key(domain, key)
         return key
 
+    def patch_props(self, domain: str, keys: list, set_props: dict = None, delete_props=(), instances=(1,), drop_others: bool = False, create: bool = True) -> tuple[list, int]:
+        """Applies one patch to the given instances of many keys in one call: set_props are added or overwritten, delete_props are removed and
+        drop_others removes every prop not in set_props. Unknown keys get a new key unless create is False.
+        Returns the resulting keys (in the order given) and the number of instances that changed."""
+        domain = self.resolve_domain(domain)
+        if domain not in self.storage:
+            raise ValueError(f"Invalid domain: {domain}")
+
+        set_props = set_props or {}
+        domain_storage = self.storage[domain]
+        result_keys = []
+        patched_keys = set()
+        changed = 0
+
+        for key in keys:
+            if not key or key not in domain_storage:
+                if not create:
+                    result_keys.append(key)
+                    continue
+                key = uuid.uuid4().hex[:12]
+                domain_storage[key] = {}
+            result_keys.append(key)
+            if key in patched_keys:
+                continue
+            patched_keys.add(key)
+
+            self._unindex_key(domain, key)
+            key_storage = domain_storage[key]
+            for instance in instances:
+                props = key_storage.get(str(instance))
+                if props is None:
+                    if not create:
+                        continue
+                    props = key_storage[str(instance)] = {}
+
+                modified = False
+                removed_props = [name for name in props if name not in set_props] if drop_others else delete_props
+                for name in removed_props:
+                    if name in props:
+                        del props[name]
+                        modified = True
+                if set_props:
+                    props.update(copy.deepcopy(set_props))
+                    modified = True
+                changed += modified
+            self._index_key(domain, key)
+
+        return result_keys, changed
+
     def fetch_props(self, domain: str, key: str, instance: int = 1) -> dict:
         """Retrieves properties for a specific instance in the specified domain."""
         domain = self.resolve_domain(domain)
@@ -75,6 +129,7 @@ class JbeamPropsStorage:
 
         if instance is None:
             # Delete all instances for the key
+            self._unindex_key(domain, key)
             del self.storage[domain][key]
         else:
             instance_key = str(instance)
@@ -84,6 +139,7 @@ class JbeamPropsStorage:
                 logging.debug(f"Instance {instance} not found for key '{key}' in domain '{domain}'. Ignore")
                 return
 
+            self._unindex_key(domain, key)
             del self.storage[domain][key][instance_key]  # Delete the specific instance
 
             # Renumber remaining instances
@@ -97,6 +153,8 @@ class JbeamPropsStorage:
             # Remove key if all instances are deleted
             if not self.storage[domain][key]:
                 del self.storage[domain][key]
+            else:
+                self._index_key(domain, key)
 
         logging.debug(f"Deleted instance {instance} from key '{key}' in domain '{domain}'.")
 
@@ -120,27 +178,116 @@ class JbeamPropsStorage:
 
         for key in unused_keys:
             if key in self.storage[domain]:
+                self._unindex_key(domain, key)
                 del self.storage[domain][key]
 
-    def save_jbeam_props_to_mesh(self):
-        """Save this object's properties to its mesh's custom properties."""
+    @staticmethod
+    def normalize_prop_value(value) -> str:
+        return str(value).strip().lower().strip("\"'")
+
+    def _index_key(self, domain: str, key: str):
+        if self._prop_index is None:
+            return
+        domain_index = self._prop_index[domain]
+        for instance, props in self.storage[domain].get(key, {}).items():
+            for prop_name, value in props.items():
+                domain_index.setdefault(prop_name, {}).setdefault(self.normalize_prop_value(value), set()).add((key, instance))
+
+    def _unindex_key(self, domain: str, key: str):
+        if self._prop_index is None:
+            return
+        domain_index = self._prop_index[domain]
+        for instance, props in self.storage[domain].get(key, {}).items():
+            for prop_name, value in props.items():
+                values = domain_index.get(prop_name)
+                if not values:
+                    continue
+                normalized_value = self.normalize_prop_value(value)
+                entries = values.get(normalized_value)
+                if entries is None:
+                    continue
+                entries.discard((key, instance))
+                if not entries:
+                    del values[normalized_value]
+                    if not values:
+                        del domain_index[prop_name]
+
+    def _ensure_prop_index(self):
+        if self._prop_index is not None:
+            return
+        self._prop_index = {domain: {} for domain in self.storage}
+        for domain, keys in self.storage.items():
+            for key in keys:
+                self._index_key(domain, key)
+
+    def find_keys_by_prop(self, domain: str, prop_name: str, value=None, contains: bool = False, instances=None) -> set[str]:
+        """Returns the keys having prop_name in any of the given instances. value None matches any value, contains does a substring match on the normalized value."""
+        domain = self.resolve_domain(domain)
+        if domain not in self.storage:
+            raise ValueError(f"Invalid domain: {domain}")
+
+        self._ensure_prop_index()
+        values = self._prop_index[domain].get(prop_name, {})
+        if value is None:
+            matched = values.values()
+        else:
+            value = self.normalize_prop_value(value)
+            if contains:
+                matched = [entries for normalized_value, entries in values.items() if value in normalized_value]
+            else:
+                matched = [values.get(value, ())]
+
+        wanted_instances = None if instances is None else {str(i) for i in instances}
+        return {key for entries in matched for key, instance in entries if wanted_instances is None or instance in wanted_instances}
+
+    def sweep(self, live_keys: dict[str, set]) -> tuple[int, int]:
+        """Removes every key not in live_keys (per domain). Domains missing from live_keys are left untouched.
+        Returns the number of entries and blob bytes reclaimed."""
+        unused_keys = self.unused_keys(live_keys)
+        entries = sum(len(keys) for keys in unused_keys.values())
+        if not entries:
+            return 0, 0
+        size_before = len(json.dumps(self.storage))
+        for domain, keys in unused_keys.items():
+            self.cleanup(domain, keys)
+        return entries, size_before - len(json.dumps(self.storage))
+
+    def unused_keys(self, live_keys: dict[str, set]) -> dict[str, set]:
+        """Keys per domain that are not in live_keys. Domains missing from live_keys are left out."""
+        return {domain: self.storage[domain].keys() - live_keys[domain] for domain in self.storage if domain in live_keys}
+
+    def save_jbeam_props_to_mesh(self, live_keys: dict[str, set] | None = None) -> int:
+        """Save this object's properties to its mesh's custom properties. With live_keys, entries that are not live are left out
+        of the saved data but stay in memory, so undoing an element deletion after the save still finds their props.
+        Returns the number of entries left out."""
         logging.debug("Saving file... Storing JbeamPropsStorage data.")
         obj = self.owner
+        storage = self.storage
+        unused_keys = self.unused_keys(live_keys) if live_keys else {}
+        left_out = sum(len(keys) for keys in unused_keys.values())
+        if left_out:
+            storage = {
+                domain: {key: value for key, value in entries.items() if key not in unused_keys.get(domain, ())}
+                for domain, entries in self.storage.items()
+            }
         try:
-            obj[self.SAVED_JBEAM_PROPS] = json.dumps(self.storage)
+            obj[self.SAVED_JBEAM_PROPS] = json.dumps(storage)
             logging.debug(f"💾 Saved/Updated JbeamPropsStorage data for {obj.name}.")
         except Exception as e:
             logging.error(f"❌ Failed to save JbeamPropsStorage for {obj.name}: {e}")
+        return left_out
 
-    def load_jbeam_props_from_mesh(self):
+    def load_jbeam_props_from_mesh(self, obj=None):
         """Load the properties from the mesh's custom properties into the JbeamPropsStorage."""
-        obj = self.owner
+        obj = obj or self.owner
+        self.restored = True
         if self.SAVED_JBEAM_PROPS not in obj:
             logging.debug(f"No saved Jbeam props found in {obj.name}'s mesh. Skipping.")
             return
         try:
             restored_data = json.loads(obj[self.SAVED_JBEAM_PROPS])
             self.storage.update(restored_data)
+            self._prop_index = None
             logging.debug(f"🔄 Restored JbeamPropsStorage data from {obj.name}'s mesh.")
         except (json.JSONDecodeError, TypeError, Exception) as e:
             logging.debug(f"❌ Failed to restore JbeamPropsStorage from {obj.name}: {e}")
@@ -160,12 +307,14 @@ class JbeamPropsStorage:
 class JbeamPropsStorageManager:
     """Manager class to register and manage JbeamPropsStorage instances."""
     JBEAM_OBJECT_ID = "jbeam_object_id"
+    WARM_UP_INTERVAL = 0.05  # seconds between restoring two storages in the background
     _instance = None
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance.objects = {}
+            cls._instance.warm_up_queue = deque()  # names of the node meshes the warm-up still has to restore
         return cls._instance
 
     @classmethod
@@ -178,42 +327,88 @@ class JbeamPropsStorageManager:
         if id_key not in obj:
             obj_id = uuid.uuid4().hex
             obj[id_key] = obj_id
-            self.objects[obj_id] = JbeamPropsStorage(obj)
+            storage = JbeamPropsStorage(obj)
+            storage.restored = True  # fresh object, nothing saved on the mesh yet
+            self.objects[obj_id] = storage
             logging.debug(f"Registered jbeam object '{obj.name}' with '{id_key}' = {obj_id}")
         else:
-            obj_id = obj[id_key]
-            if obj_id not in self.objects:
-                self.objects[obj_id] = JbeamPropsStorage(obj)
-            logging.debug(f"Object {obj.name} already registered with '{id_key}' = {obj_id}")
+            self.get_props_storage(obj)
+            logging.debug(f"Object {obj.name} already registered with '{id_key}' = {obj[id_key]}")
 
     def get_props_storage(self, obj):
-        """Get the JbeamPropsStorage instance for a registered object."""
+        """Get the JbeamPropsStorage instance for a registered object, restoring it from the mesh on first access."""
         id_key = self.JBEAM_OBJECT_ID
         if id_key not in obj:
             raise ValueError(f"Object {obj.name} is not registered.")
         obj_id = obj[id_key]
-        return self.objects.get(obj_id)
+        storage = self.objects.get(obj_id)
+        if storage is None:
+            storage = self.objects[obj_id] = JbeamPropsStorage(obj)
+            logging.debug(f"Rebuilt jbeam storage for '{obj.name}' with ID {obj_id}")
+        if not storage.restored:
+            storage.load_jbeam_props_from_mesh(obj)
+        return storage
 
     def save_all_jbeam_props_to_mesh(self):
         """Save all registered object's properties to their meshes."""
-        for obj_id, storage in self.objects.items():
+        # storages that were never restored are skipped, the saved blob on their mesh is still the latest state
+        for obj, storage in self.iter_restored_storages():
+            storage.save_jbeam_props_to_mesh()
+
+    def iter_restored_storages(self):
+        """Yields (obj, storage) for every registered storage that has been restored from its mesh."""
+        for storage in list(self.objects.values()):
+            if not storage.restored:
+                continue
             obj = storage.owner
             if obj and obj.type == 'MESH':
-                storage.save_jbeam_props_to_mesh()
+                yield obj, storage
 
-    def load_all_jbeam_props_from_mesh(self):
-        """Rebuild registry and load JBeam props from mesh safely after file load."""
+    def _iter_jbeam_meshes(self):
         for obj in list(bpy.data.objects):
             try:
-                if obj.type != 'MESH' or self.JBEAM_OBJECT_ID not in obj:
-                    continue
-                obj_id = obj[self.JBEAM_OBJECT_ID]
-                if obj_id not in self.objects:
-                    self.objects[obj_id] = JbeamPropsStorage(obj)
-                    logging.debug(f"Rebuilt jbeam storage for '{obj.name}' with ID {obj_id}")
-                storage = self.objects[obj_id]
-                storage.load_jbeam_props_from_mesh()
+                if obj.type == 'MESH' and self.JBEAM_OBJECT_ID in obj:
+                    yield obj
             except ReferenceError:
                 logging.warning(f"Skipped invalid object during load: {getattr(obj, 'name', '[unknown]')}")
+
+    def reset_after_file_load(self, warm_up=True):
+        """Drop storages of the previous file. Storages are restored lazily on first access or by the background warm-up."""
+        self.objects.clear()
+        self.warm_up_queue.clear()
+        if warm_up:
+            self.warm_up_queue.extend(obj.name for obj in self._iter_jbeam_meshes())
+            self.start_warm_up()
+
+    def start_warm_up(self):
+        if not bpy.app.timers.is_registered(_props_warm_up_timer):
+            bpy.app.timers.register(_props_warm_up_timer, first_interval=self.WARM_UP_INTERVAL)
+
+    def stop_warm_up(self):
+        if bpy.app.timers.is_registered(_props_warm_up_timer):
+            bpy.app.timers.unregister(_props_warm_up_timer)
+
+    def warm_up_next_storage(self) -> bool:
+        """Restore the next queued node mesh storage that was not accessed yet. Returns False once the queue is empty."""
+        while self.warm_up_queue:
+            obj = bpy.data.objects.get(self.warm_up_queue.popleft())
+            if obj is None or obj.type != 'MESH' or self.JBEAM_OBJECT_ID not in obj:
+                continue  # deleted or renamed since the file was loaded, restored lazily on first access
+            storage = self.objects.get(obj[self.JBEAM_OBJECT_ID])
+            if storage is not None and storage.restored:
+                continue
+            try:
+                self.get_props_storage(obj)
             except Exception as e:
                 logging.error(f"Error restoring jbeam props for {getattr(obj, 'name', '[unknown]')}: {e}")
+                self.objects[obj[self.JBEAM_OBJECT_ID]].restored = True  # don't retry a broken blob every tick
+            return True
+        return False
+
+
+def _props_warm_up_timer():
+    manager = JbeamPropsStorageManager.get_instance()
+    if manager.warm_up_next_storage():
+        return manager.WARM_UP_INTERVAL
+    logging.debug("🔥 JbeamPropsStorage warm-up complete")
+    return None
@@ -2,6 +2,7 @@ import bpy
 import bmesh
 import json
 
+from itertools import compress
 from typing import Optional
 
 from unofficial_jbeam_editor.ui.addon_preferences import MyAddonPreferences as a
@@ -13,6 +14,8 @@ from unofficial_jbeam_editor.operators.common.ui.toggle_dynamic_button_operator
 class JbeamSelectionTracker:
     _instance = None
 
+    UPDATE_INTERVAL = 1 / 60  # depsgraph updates within one frame are coalesced into a single selection check
+
     def __init__(self):
         self.vertex_count: int = -1
         self.edge_count: int = -1
@@ -22,6 +25,8 @@ class JbeamSelectionTracker:
         self.face_selection: Optional[set[int]] = None  # set of selected face indices
         self.selection_mode: int = -1  # selection modes: 1 (vertex), 2 (edge), or 3 (edge)
         self.instances_selection: set[int] = []  # instances start at 1, 2, 3, etc
+        self.select_flags: Optional[list[bool]] = None  # select flags of the current domain as of the last check
+        self.selection_signature: Optional[tuple] = None  # element counts, selected counts and active element as of the last check
 
     @classmethod
     def get_instance(cls):
@@ -39,12 +44,53 @@ class JbeamSelectionTracker:
     def unregister(self):
         if self.selection_update_handler in bpy.app.handlers.depsgraph_update_post:
             bpy.app.handlers.depsgraph_update_post.remove(self.selection_update_handler)
+        if bpy.app.timers.is_registered(_selection_update_timer):
+            bpy.app.timers.unregister(_selection_update_timer)
 
     def selection_update_handler(self, scene, depsgraph):
         obj = bpy.context.object
         if not j.is_node_mesh(obj) or obj.mode != 'EDIT':
             return
-        self.check_selection_change(scene)
+        if bpy.app.timers.is_registered(_selection_update_timer):
+            return
+        mesh = obj.data
+        if not any(update.id.original == mesh for update in depsgraph.updates):
+            return  # selecting, hiding and switching the select mode tag the mesh, navigating and editing other data do not
+        bpy.app.timers.register(_selection_update_timer, first_interval=self.UPDATE_INTERVAL)
+
+    def run_scheduled_update(self):
+        obj = bpy.context.object
+        if not j.is_node_mesh(obj) or obj.mode != 'EDIT':
+            return
+        self.check_selection_change(bpy.context.scene)
+
+    @staticmethod
+    def get_selection_signature(mesh, bm) -> tuple:
+        """Changes with nearly every selection change and costs no pass over the elements, the selected counts are kept by the BMesh."""
+        active = bm.select_history.active
+        return (
+            len(bm.verts), len(bm.edges), len(bm.faces),
+            mesh.total_vert_sel, mesh.total_edge_sel, mesh.total_face_sel,
+            (type(active).__name__, active.index) if active else None,
+        )
+
+    @staticmethod
+    def read_flags(elements) -> tuple[list[bool], int]:
+        """Select flags and the number of hidden elements of a BMesh sequence in one pass."""
+        select_flags = []
+        append = select_flags.append
+        num_hidden = 0
+        for elem in elements:
+            append(elem.select)
+            num_hidden += elem.hide
+        return select_flags, num_hidden
+
+    def read_selection_change(self, flags) -> Optional[list[int]]:
+        """Sorted indices of the selected elements, or None if the select flags did not change since the last check."""
+        if flags == self.select_flags:
+            return None
+        self.select_flags = flags
+        return list(compress(range(len(flags)), flags))
 
     def get_instances_selection_str(self, scene) -> str:
         instances_selection = scene.beamng_jbeam_instance.get_selected_instances()
@@ -87,6 +133,8 @@ class JbeamSelectionTracker:
         self.vertex_selection: set[int] = None
         self.edge_selection = None
         self.face_selection = None
+        self.select_flags = None
+        self.selection_signature = None
 
     def check_selection_change(self, scene):
         if scene.beamng_jbeam_active_structure.update_in_progress:  # useless check, doesn't work because it will already be False by now. Supposed to be used in conjunction with beamng_jbeam_node_props_manager.py::update_element_index so we could select the element while setting JbeamStructure::index IntProperty in panel
@@ -99,13 +147,13 @@ class JbeamSelectionTracker:
             self.reset_selection(scene)
             reset = True
 
-        bm = bmesh.from_edit_mesh(obj.data)
-        num_verts = len(bm.verts)
-        num_edges = len(bm.edges)
-        num_faces = len(bm.faces)
-        scene.beamng_jbeam_hidden_elements.num_hidden_nodes = sum(1 for v in bm.verts if v.hide)
-        scene.beamng_jbeam_hidden_elements.num_hidden_beams = sum(1 for e in bm.edges if e.hide)
-        scene.beamng_jbeam_hidden_elements.num_hidden_faces =sum(1 for f in bm.faces if f.hide)
+        mesh = obj.data
+        bm = bmesh.from_edit_mesh(mesh)
+        signature = self.get_selection_signature(mesh, bm)
+        if signature == self.selection_signature:
+            return
+        self.selection_signature = signature
+        num_verts, num_edges, num_faces = signature[:3]
 
         if num_verts > self.vertex_count or num_edges > self.edge_count or num_faces > self.face_count:
             j.validate_and_fix_storage_keys(obj, bm)
@@ -114,12 +162,23 @@ class JbeamSelectionTracker:
         self.edge_count = num_edges
         self.face_count = num_faces
 
+        # only the domain of the select mode is read, the hidden count of another domain is refreshed once its select mode is used
+        hidden = scene.beamng_jbeam_hidden_elements
         if o.is_vertex_selection_mode():
-            self.update_node_data(scene, obj, bm)
+            select_flags, hidden_count = self.read_flags(bm.verts)
+            if hidden.num_hidden_nodes != hidden_count:  # every assignment tags the scene for another depsgraph update
+                hidden.num_hidden_nodes = hidden_count
+            self.update_node_data(scene, obj, bm, select_flags)
         elif o.is_edge_selection_mode():
-            self.update_beam_data(scene, obj, bm)
+            select_flags, hidden_count = self.read_flags(bm.edges)
+            if hidden.num_hidden_beams != hidden_count:
+                hidden.num_hidden_beams = hidden_count
+            self.update_beam_data(scene, obj, bm, select_flags)
         elif o.is_face_selection_mode():
-            self.update_triangle_data(scene, obj, bm)
+            select_flags, hidden_count = self.read_flags(bm.faces)
+            if hidden.num_hidden_faces != hidden_count:
+                hidden.num_hidden_faces = hidden_count
+            self.update_triangle_data(scene, obj, bm, select_flags)
         elif reset:
             obj.data.update()
 
@@ -144,9 +203,12 @@ class JbeamSelectionTracker:
         set_gn_index(obj, active_index)
         return struct
 
-    def update_node_data(self, scene, obj, bm):
+    def update_node_data(self, scene, obj, bm, select_flags):
         bm.verts.ensure_lookup_table()
-        selection = {v.index for v in bm.verts if v.select}
+        selected = self.read_selection_change(select_flags)
+        if selected is None:
+            return
+        selection = set(selected)
 
         if self.vertex_selection == selection:
             return
@@ -176,10 +238,13 @@ class JbeamSelectionTracker:
         scene.beamng_jbeam_instance.buttons.clear()
         bpy.ops.wm.beamng_jbeam_manage_jbeam_instance_buttons(action='ADD', button_name=ButtonItem.BUTTON_NAME, button_amount=struct.num_instances)
 
-    def update_beam_data(self, scene, obj, bm):
+    def update_beam_data(self, scene, obj, bm, select_flags):
         bm.edges.ensure_lookup_table()
-        selection = {e.index for e in bm.edges if e.select}
-        
+        selected = self.read_selection_change(select_flags)
+        if selected is None:
+            return
+        selection = set(selected)
+
         if self.edge_selection == selection:
             return
 
@@ -199,9 +264,11 @@ class JbeamSelectionTracker:
         UiUtils.force_update_ui(bpy.context)
         obj.data.update()
 
-    def update_triangle_data(self, scene, obj, bm):
+    def update_triangle_data(self, scene, obj, bm, select_flags):
         bm.faces.ensure_lookup_table()
-        selection = [f.index for f in bm.faces if f.select]
+        selection = self.read_selection_change(select_flags)
+        if selection is None:
+            return
 
         if self.face_selection == selection:
             return
@@ -229,3 +296,11 @@ class JbeamSelectionTracker:
         bpy.ops.object.devtools_beamng_load_jbeam_triangle_props()
         UiUtils.force_update_ui(bpy.context)
         obj.data.update()
+
+def _selection_update_timer():
+    window = next(iter(bpy.context.window_manager.windows), None)
+    if window is None:
+        return None
+    with bpy.context.temp_override(window=window):  # timers run without a window, the panel refresh and the props operators need one
+        JbeamSelectionTracker.get_instance().run_scheduled_update()
+    return None
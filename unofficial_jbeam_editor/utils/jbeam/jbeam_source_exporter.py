@@ -0,0 +1,141 @@
+import os
+import time
+import logging
+
+from concurrent.futures import ThreadPoolExecutor
+
+from unofficial_jbeam_editor.utils.file_utils import FileUtils
+from unofficial_jbeam_editor.utils.jbeam.jbeam_utils import JbeamUtils as j, JbeamRefnodeUtils as jr
+from unofficial_jbeam_editor.utils.jbeam.jbeam_helper import PreJbeamStructureHelper, RedundancyReducerJbeamGenerator
+from unofficial_jbeam_editor.core.jbeam_emitter import JbeamEmitter
+from unofficial_jbeam_editor.core.jbeam_export_processor import JbeamExportProcessor
+from unofficial_jbeam_editor.core.stage_profiler import StageProfiler
+
+class JbeamSourceExport:
+    """Sections of one jbeam source file collected from a node mesh."""
+
+    def __init__(self, jbeam_path):
+        self.jbeam_path = jbeam_path
+        self.output_path = jbeam_path  # written in place unless redirected
+        self.ref_nodes = None  # refNodes rows, None if no ref node belongs to this file
+        self.nodes = []
+        self.beams = []
+        self.triangles = []
+        self.part_name = None
+        self.changed_sections: list[str] = []  # empty if the file was up to date and not written
+        self.format_time = 0.0
+        self.io_time = 0.0
+        self.error = None
+
+    @property
+    def node_ids(self) -> set[str]:
+        return {row[0] for row in self.nodes if isinstance(row, list)}
+
+
+class JbeamSourceExporter:
+    """Writes the elements of a node mesh back to the jbeam files they were imported from, each file once.
+    The mesh is read on the main thread since bpy data must not be accessed from other threads.
+    Formatting, splicing and writing of the files run in a thread pool. The GIL serializes the formatting and splicing,
+    so the pool only overlaps the file reads and writes."""
+
+    MAX_WORKERS = 8
+    DOMAIN_TO_SECTION = {"vertex": "nodes", "edge": "beams", "face": "triangles"}
+
+    def __init__(self, obj, optimize_order=False, position_precision=2):
+        self.obj = obj
+        self.optimize_order = optimize_order
+        self.position_precision = position_precision
+        self.modifier_rows = [0, 0]  # before and after ordering, summed over all files
+
+    @staticmethod
+    def ref_nodes_rows(ref_nodes: dict[str, str | None]) -> list[list[str]]:
+        labels = jr.get_refnode_labels_list()
+        return [
+            [f"{label}:" for label in labels],
+            [ref_nodes.get(label, "") or "" for label in labels]
+        ]
+
+    @staticmethod
+    def format_sections(ref_nodes_rows, nodes, beams, triangles) -> dict[str, str]:
+        """Section contents for JbeamExportProcessor.replace_sections. refNodes is left out if ref_nodes_rows is None."""
+        sections = {
+            "nodes": JbeamEmitter.format_list(nodes, '["id", "posX", "posY", "posZ"],', False),
+            "beams": JbeamEmitter.format_list(beams, '["id1:","id2:"],', False),
+            "triangles": JbeamEmitter.format_list(triangles, '["id1:","id2:","id3:"],', False),
+        }
+        if ref_nodes_rows is not None:
+            emitter = JbeamEmitter(None)
+            sections["refNodes"] = ',\n    '.join(emitter.format_value(row, bare_literals=False) for row in ref_nodes_rows)
+        return sections
+
+    def collect(self) -> dict[str, JbeamSourceExport]:
+        """jbeam path -> sections, with the elements partitioned by source path once per domain.
+        Node ids and positions are read once and shared by the files."""
+        exports: dict[str, JbeamSourceExport] = {}
+        node_ids = j.get_attribute_values(self.obj, j.ATTR_NODE_ID)
+        positions = j.get_vertex_positions(self.obj, self.position_precision)
+        for domain, section in self.DOMAIN_TO_SECTION.items():
+            for jbeam_path, data in PreJbeamStructureHelper.structure_data_by_source(self.obj, domain).items():
+                if not jbeam_path:
+                    continue  # elements created in Blender have no file to go to
+                reducer = RedundancyReducerJbeamGenerator(self.obj, data, domain, self.optimize_order, node_ids, self.position_precision, positions)
+                rows = reducer.reduce_redundancy()
+                self.modifier_rows[0] += reducer.rows_before
+                self.modifier_rows[1] += reducer.rows_after
+                if jbeam_path not in exports:
+                    exports[jbeam_path] = JbeamSourceExport(jbeam_path)
+                setattr(exports[jbeam_path], section, rows)
+        self._collect_ref_nodes(exports, node_ids)
+        return exports
+
+    def _collect_ref_nodes(self, exports, node_ids):
+        node_sources = j.get_attribute_values(self.obj, j.ATTR_NODE_SOURCE_JBEAM)
+        refnode_groups = jr.group_nodes_by_refnode_id(self.obj)
+        ref_nodes_by_path = {}
+        for label in jr.get_ref_nodes():
+            indices = refnode_groups.get(jr.get_refnode_from_label(label).value, [])
+            if not indices or not node_sources:
+                continue
+            jbeam_path = str(node_sources[indices[0]]).strip()
+            ref_nodes_by_path.setdefault(jbeam_path, jr.get_ref_nodes())[label] = node_ids[indices[0]]
+        for jbeam_path, ref_nodes in ref_nodes_by_path.items():
+            if jbeam_path in exports:
+                exports[jbeam_path].ref_nodes = self.ref_nodes_rows(ref_nodes)
+
+    @staticmethod
+    @StageProfiler.stage("export.splice_file")
+    def splice_file(export: JbeamSourceExport) -> JbeamSourceExport:
+        """Splice the sections into the source file and write the result to the output file.
+        A file written in place is only replaced if a section changed."""
+        try:
+            start = time.perf_counter()
+            with open(export.jbeam_path, "r", encoding="utf-8") as f:
+                processor = JbeamExportProcessor(f.read())
+            read = time.perf_counter()
+            export.part_name = processor.match_part(export.node_ids)
+            if export.part_name is None:
+                export.error = "No part in the file lists the exported nodes"
+                return export
+            sections = JbeamSourceExporter.format_sections(export.ref_nodes, export.nodes, export.beams, export.triangles)
+            result = processor.replace_sections(sections, export.part_name)
+            export.changed_sections = processor.changed_sections
+            formatted = time.perf_counter()
+            if export.changed_sections or export.output_path != export.jbeam_path:
+                with FileUtils.atomic_write(export.output_path) as f:
+                    f.write(result)
+                StageProfiler.count("files_written")
+            export.format_time = formatted - read
+            export.io_time = (read - start) + (time.perf_counter() - formatted)
+        except Exception as e:  # one unreadable or malformed file must not abort the others
+            export.error = f"{type(e).__name__}: {e}"
+            logging.debug("❌ Export to %s failed", export.jbeam_path, exc_info=True)
+        return export
+
+    def write(self, exports: dict[str, JbeamSourceExport], max_workers=None) -> list[JbeamSourceExport]:
+        """Splice the sections into every file. Returns the exports in the order of exports, with error set on failure."""
+        if not exports:
+            return []
+        workers = max(1, min(max_workers or self.MAX_WORKERS, len(exports), os.cpu_count() or 1))
+        logging.debug(f"🧵 Writing {len(exports)} jbeam file(s) with {workers} worker(s)")
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.splice_file, exports.values()))
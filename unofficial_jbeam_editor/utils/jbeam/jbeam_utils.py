@@ -12,6 +12,9 @@ from unofficial_jbeam_editor.ui.addon_preferences import MyAddonPreferences as a
 from unofficial_jbeam_editor.utils.file_utils import FileUtils
 from unofficial_jbeam_editor.utils.object_utils import ObjectUtils
 from unofficial_jbeam_editor.utils.jbeam.jbeam_props_storage import JbeamPropsStorage, JbeamPropsStorageManager
+from unofficial_jbeam_editor.utils.jbeam.jbeam_attribute_session import JbeamAttributeSession
+from unofficial_jbeam_editor.utils.jbeam.jbeam_element_index import JbeamElementIndexManager
+from unofficial_jbeam_editor.core.lazy_logger import LazyLogger
 
 class JbeamUtils:
 
@@ -33,6 +36,7 @@ class JbeamUtils:
         }
 
     DOMAIN_TO_JBEAM_SOURCE_ATTR = create_domain_dict(ATTR_NODE_SOURCE_JBEAM, ATTR_BEAM_SOURCE_JBEAM, ATTR_TRIANGLE_SOURCE_JBEAM)
+    DOMAIN_TO_JBEAM_PROPS_ATTR = create_domain_dict(ATTR_NODE_PROPS, ATTR_BEAM_PROPS, ATTR_TRIANGLE_PROPS)
 
     RESERVED_KEYWORDS = []
 
@@ -57,7 +61,7 @@ class JbeamUtils:
     @staticmethod
     def remove_old_jbeam_attributes(obj):
         if not obj or obj.type != 'MESH':
-            logging.debug(f"Cannot remove attributes from invalid object: {repr(obj)}")
+            logging.debug("Cannot remove attributes from invalid object: %r", obj)
             return
 
         mesh = obj.data
@@ -65,18 +69,18 @@ class JbeamUtils:
 
         for attr_name in attributes_to_remove:
             mesh.attributes.remove(mesh.attributes[attr_name])
-            logging.debug(f"Removed attribute '{attr_name}' from {repr(obj)}")
+            logging.debug("Removed attribute '%s' from %r", attr_name, obj)
 
     @staticmethod
     def create_attribute(obj, attr_name, type="STRING", domain="POINT"):
         if not obj or obj.type != 'MESH':
-            logging.debug(f"Cannot add attribute '{attr_name}' to invalid object: {repr(obj)}")
+            logging.debug("Cannot add attribute '%s' to invalid object: %r", attr_name, obj)
             return None
 
         mesh = obj.data
 
         if attr_name in mesh.attributes:
-            logging.debug(f"{repr(obj)}: already has attribute '{attr_name}'")
+            logging.debug("%r: already has attribute '%s'", obj, attr_name)
             return mesh.attributes[attr_name]
 
         return mesh.attributes.new(name=attr_name, type=type, domain=domain)
@@ -101,19 +105,19 @@ class JbeamUtils:
             bm_data = getattr(bm, domain, None)
 
             if not bm_data:
-                logging.error(f"{repr(obj)}: Unsupported domain '{domain}' in Edit Mode")
+                logging.error("%r: Unsupported domain '%s' in Edit Mode", obj, domain)
                 return None
 
             bm_data.ensure_lookup_table()
 
             if index >= len(bm_data):
-                logging.error(f"{repr(obj)}: Index {index} out of range in Edit Mode ({domain})")
+                logging.error("%r: Index %s out of range in Edit Mode (%s)", obj, index, domain)
                 return None
 
             element = bm_data[index]
             layer = bm_data.layers.string.get(attr_name) or bm_data.layers.int.get(attr_name)
             if not layer:
-                logging.error(f"{repr(obj)}: Layer '{attr_name}' not found in Edit Mode ({domain})")
+                logging.error("%r: Layer '%s' not found in Edit Mode (%s)", obj, attr_name, domain)
                 return None
 
             value = element[layer]
@@ -122,73 +126,56 @@ class JbeamUtils:
         elif obj.mode == 'OBJECT':
             attr = mesh.attributes.get(attr_name)
             if not attr:
-                logging.error(f"{repr(obj)}: Attribute '{attr_name}' not found in Object Mode ({domain})")
+                logging.error("%r: Attribute '%s' not found in Object Mode (%s)", obj, attr_name, domain)
                 return None
 
             attr_data = attr.data
             if index >= len(attr_data):
-                logging.error(f"Get:{repr(obj)}: Index {index} out of range in Object Mode ({domain})")
+                logging.error("Get:%r: Index %s out of range in Object Mode (%s)", obj, index, domain)
                 return None
 
             value = attr_data[index].value
             return value.decode('utf-8') if isinstance(value, bytes) else value
 
-        logging.error(f"{repr(obj)}: Unknown object mode '{obj.mode}'")
+        logging.error("%r: Unknown object mode '%s'", obj, obj.mode)
         return None
 
     @staticmethod
-    def find_elements_with_attribute_value(obj, attr_name, attr_value, domain="verts", bm=None) -> list[int]:
-        """Finds the indices of elements (vertices, edges, or faces) with a specific attribute value."""
-        mesh = obj.data
-        matching_element_indices = []
-
-        if obj.mode == 'EDIT':
-            # If bm is not provided, get the current bmesh from the mesh
-            if not bm:
-                bm = bmesh.from_edit_mesh(obj.data)
-            
-            bm_data = getattr(bm, domain, None)
-            if not bm_data:
-                logging.error(f"{repr(obj)}: Unsupported domain '{domain}' in Edit Mode")
-                return []
-
-            bm_data.ensure_lookup_table()
-
-            string_layer = bm_data.layers.string.get(attr_name)
-            int_layer = bm_data.layers.int.get(attr_name)
+    def get_attribute_values(obj, attr_name, domain="verts", bm=None) -> list[str | int]:
+        """Reads the whole attribute column of a domain in one pass. Returns an empty list if the attribute is missing."""
+        if obj.mode not in ('EDIT', 'OBJECT'):
+            logging.error("%r: Unknown object mode '%s'", obj, obj.mode)
+            return []
+        with JbeamAttributeSession(obj, bm) as session:
+            return session.column(attr_name, domain)
 
-            # Iterate through each element in the bm_data (verts, edges, or faces)
-            for idx, element in enumerate(bm_data):
-                value = None
-                if string_layer:
-                    value = element[string_layer].decode('utf-8')
-                elif int_layer:
-                    value = element[int_layer]
+    @staticmethod
+    def get_vertex_positions(obj, precision: int | None = None, bm=None) -> list[tuple[float, float, float]]:
+        """Local coordinates of all vertices in one pass, rounded to precision decimals if given."""
+        with JbeamAttributeSession(obj, bm) as session:
+            return session.get_vertex_positions(precision)
 
-                if value == attr_value:
-                    matching_element_indices.append(idx)  # Append the index of the element
+    @staticmethod
+    def find_elements_with_attribute_value(obj, attr_name, attr_value, domain="verts", bm=None) -> list[int]:
+        """Finds the indices of elements (vertices, edges, or faces) with a specific attribute value."""
+        if obj.mode not in ('EDIT', 'OBJECT'):
+            logging.error("%r: Unknown object mode '%s'", obj, obj.mode)
+            return []
 
-        elif obj.mode == 'OBJECT':
-            if attr_name not in mesh.attributes:
-                logging.debug(f"{repr(obj)}: Attribute '{attr_name}' not found in Object Mode ({domain})")
+        with JbeamAttributeSession(obj, bm) as session:
+            if not session.has(attr_name, domain):
+                logging.debug("%r: Attribute '%s' not found (%s)", obj, attr_name, domain)
                 return []
+            return [i for i, value in enumerate(session.column(attr_name, domain)) if value == attr_value]
 
-            attr_data = mesh.attributes[attr_name].data
-
-            # In OBJECT mode, we cannot directly access BMVerts, BMEdges, or BMFaces, 
-            # but we can lookup the index of the element and retrieve them by index from the mesh.
-            for idx, entry in enumerate(attr_data):
-                value = entry.value
-                if isinstance(value, bytes):
-                    value = value.decode('utf-8')
-
-                if value == attr_value:
-                    matching_element_indices.append(idx)  # Append the index of the element
-
-        else:
-            logging.error(f"{repr(obj)}: Unknown object mode '{obj.mode}'")
-
-        return matching_element_indices
+    @staticmethod
+    def group_elements_by_attribute_value(obj, attr_name, domain="verts", bm=None) -> dict[str | int, list[int]]:
+        """Maps every value of an attribute to the indices of the elements holding it. Empty if the attribute is missing."""
+        if obj.mode not in ('EDIT', 'OBJECT'):
+            logging.error("%r: Unknown object mode '%s'", obj, obj.mode)
+            return {}
+        with JbeamAttributeSession(obj, bm) as session:
+            return session.group_by_value(attr_name, domain)
 
 
     @staticmethod
@@ -199,31 +186,14 @@ class JbeamUtils:
     def get_beam_id(obj, edge_index, bm=None) -> str:
         if edge_index < 0:
             return None
-        if bm is None:
-            mesh = obj.data
-            edge = mesh.edges[edge_index]
-            v1, v2 = sorted(edge.vertices)
-        else:
-            edge = bm.edges[edge_index]
-            v1, v2 = sorted(edge.verts, key=lambda v: v.index)
-            v1, v2 = v1.index, v2.index
-        n1 = JbeamUtils.get_node_id(obj, v1) or "?"
-        n2 = JbeamUtils.get_node_id(obj, v2) or "?"
-        return JbeamUtils.format_node_ids(n1, n2)
+        return JbeamUtils.format_node_ids(*JbeamUtils.get_beam_node_ids(obj, edge_index, bm))
 
     @staticmethod
     def get_triangle_id(obj, face_index, bm=None) -> str:
         if face_index < 0:
             return None
-        if bm is None:
-            mesh = obj.data
-            face = mesh.polygons[face_index]
-            verts = face.vertices  # Get all vertex indices of the face
-        else:
-            face = bm.faces[face_index]
-            verts = [v.index for v in face.verts]  # Get all vertex indices
-
-        node_ids = [JbeamUtils.get_node_id(obj, v) or "?" for v in verts]
+        with JbeamAttributeSession(obj, bm) as session:
+            node_ids = [session.get_node_id(v) or "?" for v in session.get_vertex_indices(face_index, "faces")]
         return JbeamUtils.format_node_ids(*node_ids)
 
     @staticmethod
@@ -231,20 +201,20 @@ class JbeamUtils:
         return f"[{'|'.join(sorted(map(lambda x: x or '?', node_ids)))}]"  # Format the result as "[id1|id2|id3|...]"
 
     @staticmethod
-    def get_beam_node_ids(obj, edge_index) -> tuple[str, str]:
-        edge = obj.data.edges[edge_index]
-        v1_idx, v2_idx = sorted(edge.vertices)
-        n1 = JbeamUtils.get_node_id(obj, v1_idx) or "?"
-        n2 = JbeamUtils.get_node_id(obj, v2_idx) or "?"
+    def get_beam_node_ids(obj, edge_index, bm=None) -> tuple[str, str]:
+        with JbeamAttributeSession(obj, bm) as session:
+            v1_idx, v2_idx = sorted(session.get_vertex_indices(edge_index, "edges"))
+            n1 = session.get_node_id(v1_idx) or "?"
+            n2 = session.get_node_id(v2_idx) or "?"
         return n1, n2
 
     @staticmethod
-    def get_triangle_node_ids(obj, face_index) -> tuple[str, str, str]:
-        face = obj.data.polygons[face_index]
-        v1_idx, v2_idx, v3_idx = face.vertices
-        n1 = JbeamUtils.get_node_id(obj, v1_idx) or "?"
-        n2 = JbeamUtils.get_node_id(obj, v2_idx) or "?"
-        n3 = JbeamUtils.get_node_id(obj, v3_idx) or "?"
+    def get_triangle_node_ids(obj, face_index, bm=None) -> tuple[str, str, str]:
+        with JbeamAttributeSession(obj, bm) as session:
+            v1_idx, v2_idx, v3_idx = session.get_vertex_indices(face_index, "faces")
+            n1 = session.get_node_id(v1_idx) or "?"
+            n2 = session.get_node_id(v2_idx) or "?"
+            n3 = session.get_node_id(v3_idx) or "?"
         return n1, n2, n3
 
     @staticmethod
@@ -284,9 +254,28 @@ class JbeamUtils:
         key = storage_inst.store_props(domain, key, props, instance=instance)
         return JbeamUtils.set_attribute_value(obj, index, attribute, key, domain=domain)
 
+    @staticmethod
+    def patch_props_of_selected_elements(obj, domain, set_props: dict = None, delete_props=(), instances=(1,), drop_others=False, create=True, bm=None) -> int:
+        """Edit Mode: applies one props patch to all selected elements of a domain. Returns the number of instances changed."""
+        bm = bm or bmesh.from_edit_mesh(obj.data)
+        elements = getattr(bm, domain)
+        attr_name = JbeamUtils.DOMAIN_TO_JBEAM_PROPS_ATTR[domain]
+        layer = elements.layers.string.get(attr_name) or elements.layers.string.new(attr_name)
+
+        selected_elements = [elem for elem in elements if elem.select]
+        keys = [elem[layer].decode('utf-8') for elem in selected_elements]
+        storage_inst: JbeamPropsStorage = JbeamPropsStorageManager.get_instance().get_props_storage(obj)
+        new_keys, changed = storage_inst.patch_props(domain, keys, set_props, delete_props, instances, drop_others, create)
+
+        for elem, key, new_key in zip(selected_elements, keys, new_keys):
+            if key != new_key:
+                elem[layer] = new_key.encode('utf-8')
+        return changed
+
     @staticmethod
     def set_jbeam_source(obj, index, domain, jbeam_path: str) -> bool:
         attr_name = JbeamUtils.DOMAIN_TO_JBEAM_SOURCE_ATTR.get(domain)
+        JbeamElementIndexManager.get_instance().invalidate_sources(obj)
         JbeamUtils.set_attribute_value(obj, index, attr_name, str(jbeam_path).strip(), domain=domain)
 
     @staticmethod
@@ -295,13 +284,13 @@ class JbeamUtils:
         return JbeamUtils.get_attribute_value(obj, index, attr_name, domain=domain)
 
     @staticmethod
-    def find_indices_by_jbeam_path(obj, path, domain):
-        attr_name = JbeamUtils.DOMAIN_TO_JBEAM_SOURCE_ATTR.get(domain)
-        return JbeamUtils.find_elements_with_attribute_value(obj, attr_name, path, domain=domain)
+    def find_indices_by_jbeam_path(obj, path, domain, bm=None) -> list[int]:
+        return JbeamElementIndexManager.get_instance().get_source_index(obj, domain, bm).source_indices(path, domain)
 
     @staticmethod
     def set_jbeam_path_for_selected_elements(obj, jbeam_path, domain) -> int:
         attr_name = JbeamUtils.DOMAIN_TO_JBEAM_SOURCE_ATTR.get(domain)
+        JbeamElementIndexManager.get_instance().invalidate_sources(obj)
         return JbeamUtils.set_attribute_value_for_selected_elements(obj, attr_name, jbeam_path, domain)
 
     @staticmethod
@@ -340,6 +329,57 @@ class JbeamUtils:
         storage_inst: JbeamPropsStorage = JbeamPropsStorageManager.get_instance().get_props_storage(obj)
         return storage_inst.get_total_instances(domain, key)
 
+    @staticmethod
+    def get_live_props_keys(obj, bm=None) -> dict[str, set] | None:
+        """Keys referenced by the props attributes per domain. A domain whose attribute is missing is left out since its keys are unknown.
+        None if the object is in neither Edit nor Object Mode, where the attributes cannot be read."""
+        if obj.mode not in ('EDIT', 'OBJECT'):
+            return None
+        live_keys = {}
+        with JbeamAttributeSession(obj, bm) as session:
+            for domain, attr_name in JbeamUtils.DOMAIN_TO_JBEAM_PROPS_ATTR.items():
+                if session.has(attr_name, domain):
+                    live_keys[domain] = set(session.column(attr_name, domain))
+        return live_keys
+
+    @staticmethod
+    def get_shared_live_props_keys(obj, bm=None) -> dict[str, set] | None:
+        """Live keys of every object sharing the storage of obj (duplicates keep the jbeam_object_id). Only domains that could be read
+        on all of those objects are included. None if one of them is in a mode where the attributes cannot be read."""
+        obj_id = obj[JbeamPropsStorageManager.JBEAM_OBJECT_ID]
+        sharing = [o for o in bpy.data.objects if o != obj and o.type == 'MESH' and o.get(JbeamPropsStorageManager.JBEAM_OBJECT_ID) == obj_id]
+        live_keys = None
+        for user in [obj] + sharing:
+            keys = JbeamUtils.get_live_props_keys(user, bm if user == obj else None)
+            if keys is None:
+                logging.debug("🧹 %s: Live props keys unknown, '%s' is in %s mode", obj.name, user.name, user.mode)
+                return None
+            live_keys = keys if live_keys is None else {domain: live_keys[domain] | keys[domain] for domain in live_keys.keys() & keys.keys()}
+        return live_keys
+
+    @staticmethod
+    def collect_orphaned_props(obj, bm=None) -> tuple[int, int]:
+        """Mark and sweep: keys referenced by the props attributes of any object sharing the storage are live, every other storage entry
+        is removed. Not undoable, the storage is not part of Blender's undo steps."""
+        storage_inst: JbeamPropsStorage = JbeamPropsStorageManager.get_instance().get_props_storage(obj)
+        live_keys = JbeamUtils.get_shared_live_props_keys(obj, bm)
+        if live_keys is None:
+            return 0, 0
+        entries, num_bytes = storage_inst.sweep(live_keys)
+        if entries:
+            logging.debug(f"🧹 {obj.name}: Removed {entries} orphaned props entries ({num_bytes} bytes)")
+        return entries, num_bytes
+
+    @staticmethod
+    def save_all_jbeam_props_to_mesh() -> int:
+        """Save every restored storage to its mesh without the entries no element references. Those entries stay in memory,
+        an undo after the save can bring their elements back. Returns the number of entries left out."""
+        left_out = 0
+        for obj, storage in JbeamPropsStorageManager.get_instance().iter_restored_storages():
+            live_keys = JbeamUtils.get_shared_live_props_keys(obj) if JbeamUtils.is_node_mesh(obj) else None
+            left_out += storage.save_jbeam_props_to_mesh(live_keys)
+        return left_out
+
     @staticmethod
     def validate_and_fix_storage_keys(obj, bm):
         """Ensures unique keys in attributes and fixes duplicates for each domain separately."""
@@ -356,20 +396,21 @@ class JbeamUtils:
         }
         modified = False
         storage_inst: JbeamPropsStorage = JbeamPropsStorageManager.get_instance().get_props_storage(obj)
-        for domain, (elements, attr_name) in domains.items():
-            layer = elements.layers.string.get(attr_name)
-            if not layer:
-                continue
-            for elem in elements:
-                key = elem[layer].decode('utf-8') if elem[layer] else None
-                if key and key in key_sets[domain]:
-                    props = storage_inst.fetch_props(domain, key)
-                    new_key = storage_inst.store_props(domain, None, copy.deepcopy(props))
-                    elem[layer] = new_key.encode('utf-8')
-                    logging.debug(f"🔧 Duplicate detected in domain '{domain}' for key '{key}'. Generated new key: '{new_key}'")
-                    modified = True
-                else:
-                    key_sets[domain].add(key)
+        with LazyLogger() as log:
+            for domain, (elements, attr_name) in domains.items():
+                layer = elements.layers.string.get(attr_name)
+                if not layer:
+                    continue
+                for elem in elements:
+                    key = elem[layer].decode('utf-8') if elem[layer] else None
+                    if key and key in key_sets[domain]:
+                        props = storage_inst.fetch_props(domain, key)
+                        new_key = storage_inst.store_props(domain, None, copy.deepcopy(props))
+                        elem[layer] = new_key.encode('utf-8')
+                        log.count("🔧 Duplicate detected in domain '%s' for key '%s'. Generated new key: '%s'", domain, key, new_key)
+                        modified = True
+                    else:
+                        key_sets[domain].add(key)
         if modified:
             bmesh.update_edit_mesh(obj.data)
         else:
@@ -378,6 +419,8 @@ class JbeamUtils:
     @staticmethod
     def set_attribute_value(obj, index: int, attr_name: str, attr_value: str | int, domain="verts", alert_error=True) -> bool:
         mesh = obj.data
+        if attr_name == JbeamUtils.ATTR_NODE_ID:
+            JbeamElementIndexManager.get_instance().invalidate(obj)
 
         # Handle 'EDIT' mode
         if obj.mode == 'EDIT':
@@ -385,7 +428,7 @@ class JbeamUtils:
             bm_data = getattr(bm, domain)  # Access verts, edges, or faces dynamically
 
             if index >= len(bm_data):
-                logging.warning(f"{repr(obj)}: Index {index} out of range in Edit Mode ({domain})")
+                logging.warning("%r: Index %s out of range in Edit Mode (%s)", obj, index, domain)
                 return False
 
             element = bm_data[index]
@@ -396,7 +439,7 @@ class JbeamUtils:
                 layer = bm_data.layers.int.get(attr_name) or bm_data.layers.int.new(attr_name)
                 element[layer] = attr_value
             else:
-                logging.error(f"{repr(obj)}: Unsupported attribute value type")
+                logging.error("%r: Unsupported attribute value type", obj)
                 return False
             return True
 
@@ -405,7 +448,7 @@ class JbeamUtils:
             domain_map = {"verts": "POINT", "edges": "EDGE", "faces": "FACE"}
 
             if domain not in domain_map:
-                logging.error(f"{repr(obj)}: Unsupported domain '{domain}'")
+                logging.error("%r: Unsupported domain '%s'", obj, domain)
                 return False
 
             if attr_name not in mesh.attributes:
@@ -419,7 +462,7 @@ class JbeamUtils:
 
             if index >= len(attr_data):
                 if alert_error:
-                    logging.error(f"Set:{repr(obj)}: Try set '{attr_name}' with value '{attr_value}' failed with: Index {index} out of range in Object Mode ({domain})")
+                    logging.error("Set:%r: Try set '%s' with value '%s' failed with: Index %s out of range in Object Mode (%s)", obj, attr_name, attr_value, index, domain)
                 return False
 
             if isinstance(attr_value, str):  # For string values
@@ -427,12 +470,12 @@ class JbeamUtils:
             elif isinstance(attr_value, int):  # For integer values
                 attr_data[index].value = attr_value
             else:
-                logging.error(f"{repr(obj)}: Unsupported attribute value type")
+                logging.error("%r: Unsupported attribute value type", obj)
                 return False
 
             return True
 
-        logging.error(f"{repr(obj)}: Unknown object mode {obj.mode}")
+        logging.error("%r: Unknown object mode %s", obj, obj.mode)
         return False
 
     @staticmethod
@@ -489,9 +532,13 @@ class JbeamUtils:
         }
         JbeamUtils.create_node_mesh_attributes(obj)
 
-        for vertex_idx in range(num_verts):
-            JbeamUtils.set_node_id(obj, vertex_idx, node_ids[vertex_idx])
-            JbeamUtils.set_node_props(obj, vertex_idx, node_props[vertex_idx])
+        storage_inst: JbeamPropsStorage = JbeamPropsStorageManager.get_instance().get_props_storage(obj)
+        with JbeamAttributeSession(obj) as session:
+            for vertex_idx in range(num_verts):
+                session.set(vertex_idx, JbeamUtils.ATTR_NODE_ID, node_ids[vertex_idx])
+                key = storage_inst.store_props("verts", session.get(vertex_idx, JbeamUtils.ATTR_NODE_PROPS), node_props[vertex_idx])
+                session.set(vertex_idx, JbeamUtils.ATTR_NODE_PROPS, key)
+        JbeamElementIndexManager.get_instance().invalidate(obj)
 
     @staticmethod
     def set_jbeam_visuals(obj):
@@ -617,84 +664,31 @@ class JbeamUtils:
 
     @staticmethod
     def get_indices_by_id(obj, target_id, domain, attr_name) -> list[int]:
-        mesh = obj.data
-        indices = []  # List to store matching indices
-
-        if obj.mode == 'EDIT':
-            bm = bmesh.from_edit_mesh(mesh)
-            bm_data = getattr(bm, domain, None)
-            if bm_data:
-                bm_data.ensure_lookup_table()
-            else:
-                logging.error(f"{obj!r}: Unsupported domain '{domain}' in Edit Mode")
-                return []
-
-            # Iterate through elements and check for the ID
-            for index, element in enumerate(bm_data):
-                layer = bm_data.layers.string.get(attr_name)
-                if layer is None:
-                    logging.error(f"{repr(obj)}: Layer '{attr_name}' not found in Edit Mode ({domain})")
-                    return []
-
-                if element[layer].decode('utf-8') == target_id:
-                    indices.append(index)  # Add index to the list
-
-            if not indices:
-                logging.error(f"{repr(obj)}: {attr_name} '{target_id}' not found in Edit Mode ({domain})")
-            return indices
+        if obj.mode not in ('EDIT', 'OBJECT'):
+            logging.error("%r: Unknown object mode %s", obj, obj.mode)
+            return []
 
-        elif obj.mode == 'OBJECT':
-            if attr_name not in mesh.attributes:
-                logging.debug(f"{repr(obj)}: Attribute '{attr_name}' not found in Object Mode ({domain})")
+        with JbeamAttributeSession(obj) as session:
+            if not session.has(attr_name, domain):
+                logging.error("%r: Layer '%s' not found (%s)", obj, attr_name, domain)
                 return []
+            indices = [index for index, value in enumerate(session.column(attr_name, domain)) if value == target_id]
 
-            attr_data = mesh.attributes[attr_name].data
-
-            # Iterate through elements and check for the ID
-            for index, data in enumerate(attr_data):
-                if data.value.decode('utf-8') == target_id:
-                    indices.append(index)  # Add index to the list
-
-            if not indices:
-                logging.debug(f"{repr(obj)}: {attr_name} '{target_id}' not found in Object Mode ({domain})")
-            return indices
-
-        logging.error(f"{repr(obj)}: Unknown object mode {obj.mode}")
-        return []
+        if not indices:
+            logging.debug("%r: %s '%s' not found (%s)", obj, attr_name, target_id, domain)
+        return indices
 
     @staticmethod
     def get_beam_indices(obj, node_id1, node_id2, bm=None):
         """
         Get the indices of the beams defined by two node IDs (node_id1, node_id2).
         """
-        # List to store matching indices
-        indices = []
-
-        # Iterate through all the edges in the mesh
-        mesh = obj.data
-        if obj.mode == 'EDIT':
-            if not bm:
-                bm = bmesh.from_edit_mesh(mesh)
-                bm.edges.ensure_lookup_table()
-            bm_data = bm.edges
-        elif obj.mode == 'OBJECT':
-            bm_data = mesh.edges
-        else:
-            logging.error(f"{repr(obj)}: Unknown object mode {obj.mode}")
+        if obj.mode not in ('EDIT', 'OBJECT'):
+            logging.error("%r: Unknown object mode %s", obj, obj.mode)
             return []
-
-        # Iterate through all edges (beams)
-        for index, edge in enumerate(bm_data):
-            v1, v2 = sorted(edge.verts, key=lambda v: v.index)
-            n1 = JbeamUtils.get_node_id(obj, v1.index)
-            n2 = JbeamUtils.get_node_id(obj, v2.index)
-            # Check if the node IDs match
-            if {n1, n2} == {node_id1, node_id2}:
-                indices.append(index)  # Add index to the list if the IDs match
-
+        indices = JbeamElementIndexManager.get_instance().get_element_index(obj, bm).beam_indices(node_id1, node_id2)
         if not indices:
-            logging.debug(f"{repr(obj)}: Beam with node IDs '{node_id1}' and '{node_id2}' not found")
-        
+            logging.debug("%r: Beam with node IDs '%s' and '%s' not found", obj, node_id1, node_id2)
         return indices  # Return all matching indices
 
     @staticmethod
@@ -702,56 +696,21 @@ class JbeamUtils:
         """
         Get the indices of faces (triangles, n-gons) defined by the given node IDs.
         """
-        # Ensure we have a sorted list of node IDs for comparison
-        target_node_ids = sorted(node_ids)
-        indices = []
-        mesh = obj.data
-        if obj.mode == 'EDIT':
-            if not bm:
-                bm = bmesh.from_edit_mesh(mesh)
-                bm.faces.ensure_lookup_table()
-            bm_data = bm.faces
-        elif obj.mode == 'OBJECT':
-            bm_data = mesh.polygons
-        else:
-            logging.error(f"{repr(obj)}: Unknown object mode {obj.mode}")
+        if obj.mode not in ('EDIT', 'OBJECT'):
+            logging.error("%r: Unknown object mode %s", obj, obj.mode)
             return []
-
-        # Iterate through all faces
-        for index, face in enumerate(bm_data):
-            verts = face.verts if hasattr(face, "verts") else face.vertices
-            face_node_ids = sorted([JbeamUtils.get_node_id(obj, v.index) for v in verts])
-
-            # Check if the face contains the same node IDs (order-independent)
-            if face_node_ids == target_node_ids:
-                indices.append(index)
-
+        indices = JbeamElementIndexManager.get_instance().get_element_index(obj, bm).face_indices(*node_ids)
         if not indices:
-            logging.error(f"{repr(obj)}: Face with node IDs {target_node_ids} not found")
-        
+            logging.error("%r: Face with node IDs %s not found", obj, sorted(node_ids))
         return indices  # Return all matching face indices
 
     @staticmethod
-    def get_node_indices(obj, node_id) -> list[int]:
-        return JbeamUtils.get_indices_by_id(obj, node_id, domain="verts", attr_name=JbeamUtils.ATTR_NODE_ID)
+    def get_node_indices(obj, node_id, bm=None) -> list[int]:
+        return JbeamElementIndexManager.get_instance().get_node_index(obj, bm).node_indices(node_id)
 
     @staticmethod
-    def check_unique_node_names(obj: bpy.types.Object) -> tuple[bool, str]:
-        """Checks if all nodes have a unique name."""
-        node_names = set()
-
-        for index in range(len(obj.data.vertices)):
-            node_name = JbeamUtils.get_node_id(obj, index).strip()
-
-            if not node_name:
-                return False, f"Node at index {index} has an empty name."
-
-            if node_name in node_names:
-                return False, f"Duplicate node name detected: '{node_name}' at index {index}."
-
-            node_names.add(node_name)
-
-        return True
+    def get_duplicate_node_ids(obj, bm=None) -> dict[str, list[int]]:
+        return JbeamElementIndexManager.get_instance().get_node_index(obj, bm).duplicate_node_ids
 
 
 class JbeamRefnodeUtils:
@@ -829,3 +788,8 @@ class JbeamRefnodeUtils:
         indices = JbeamUtils.find_elements_with_attribute_value(obj, JbeamRefnodeUtils.ATTR_REFNODE_ID, refnode, domain="verts")
         return indices
 
+    @staticmethod
+    def group_nodes_by_refnode_id(obj) -> dict[int, list[int]]:
+        """refnode id -> vertex indices, read in one pass for checks over all refnodes."""
+        return JbeamUtils.group_elements_by_attribute_value(obj, JbeamRefnodeUtils.ATTR_REFNODE_ID, domain=JbeamRefnodeUtils.DOMAIN)
+
@@ -0,0 +1,36 @@
+import time
+import inspect
+import logging
+import importlib
+
+
+class LazyOperator:
+    """Mixin of a light operator stub that is registered in place of an operator whose module is heavy to import.
+    The stub declares bl_idname, bl_label, the properties and poll, the operator subclasses the stub and adds the rest.
+    The operator module is imported on first execute and everything the stub lacks is delegated to the operator class
+    with the stub instance as self. A stub has to delegate invoke, modal and draw itself if the operator defines them."""
+
+    operator_path = ""  # "<module>:<class name>" of the operator
+    _operators: dict[str, type] = {}
+
+    @classmethod
+    def operator_class(cls) -> type:
+        operator = LazyOperator._operators.get(cls.operator_path)
+        if operator is None:
+            module_name, class_name = cls.operator_path.split(":")
+            start = time.perf_counter()
+            operator = LazyOperator._operators[cls.operator_path] = getattr(importlib.import_module(module_name), class_name)
+            logging.debug("📦 Imported %s on first use in %.3fs", module_name, time.perf_counter() - start)
+        return operator
+
+    def execute(self, context):
+        return self.operator_class().execute(self, context)
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)  # keep special method lookups from importing the operator
+        operator = self.operator_class()
+        value = inspect.getattr_static(operator, name)
+        if isinstance(value, (staticmethod, classmethod)):
+            return getattr(operator, name)
+        return value.__get__(self, type(self)) if hasattr(value, "__get__") else value
@@ -301,6 +301,24 @@ class ObjectUtils:
         selected_edges = [edge.index for edge in bm.edges if edge.select]
         return selected_edges
 
+    @staticmethod
+    def set_elements_selection(obj, domain, mask, bm=None):
+        """Sets the select state of all verts, edges or faces from a bool per element, deselecting the rest."""
+        if obj.mode == 'EDIT':
+            bm = bm or bmesh.from_edit_mesh(obj.data)
+            elements = getattr(bm, domain)
+            for elem in elements:
+                elem.select = False
+            bm.select_flush(False)
+            for elem, selected in zip(elements, mask):
+                if selected:
+                    elem.select = True
+            bmesh.update_edit_mesh(obj.data)
+        else:
+            elements = getattr(obj.data, {"verts": "vertices", "edges": "edges", "faces": "polygons"}[domain])
+            elements.foreach_set("select", mask)
+            obj.data.update()
+
     @staticmethod
     def _import_node_group(blend_path, group_node_name, link=True):
         """Helper function to either link or append a node group."""